@@ -2,6 +2,8 @@
 Main application entry point for My Work Bot.
 """
 import os
+import signal
+import sys
 from dotenv import load_dotenv
 from slack.bot import create_bot
 
@@ -35,9 +37,21 @@ def main():
     else:
         print("✅ Jira integration enabled")
     
+    # Exit normally on SIGTERM, so shutdown hooks such as the todo flush run
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    
     # Create and start the bot
+    runtime = os.getenv("BOT_RUNTIME", "sync").lower()
     try:
-        bot = create_bot()
+        if runtime == "async":
+            try:
+                from slack.async_bot import create_async_bot
+            except ImportError as e:
+                print(f"❌ Error: BOT_RUNTIME=async needs aiohttp ({e}). Install it with: pip install aiohttp")
+                return
+            bot = create_async_bot()
+        else:
+            bot = create_bot()
         print("\n" + "=" * 50)
         bot.start()
     except Exception as e:
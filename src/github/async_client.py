@@ -0,0 +1,205 @@
+"""
+asyncio GitHub client for the async runtime (BOT_RUNTIME=async).
+Runs the REST category searches on one event loop instead of worker threads.
+"""
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+import aiohttp
+
+from github.client import GitHubClient
+from github.query_planner import merge_search_results
+from utils.async_http import AsyncHttpError, AsyncHttpTransport
+from utils.rate_limit import RateLimitExceeded
+from utils.single_flight import AsyncSingleFlight
+
+
+class AsyncGitHubClient:
+    """
+    Async front end for a configured GitHubClient.
+    
+    Query building, fetch limits, the conditional response cache and the
+    rate limit scheduler are shared with the wrapped client. The GraphQL
+    and CI enrichment modes are delegated to the wrapped client on a
+    worker thread.
+    """
+    
+    def __init__(self, client: GitHubClient, transport: AsyncHttpTransport, single_flight: Optional[AsyncSingleFlight] = None):
+        """
+        Initialize the client.
+        
+        Args:
+            client: Configured synchronous GitHub client
+            transport: Pooled aiohttp transport
+            single_flight: Coalesces identical concurrent fetches
+        """
+        self.client = client
+        self.transport = transport
+        self.single_flight = single_flight or AsyncSingleFlight()
+    
+    async def _request(self, url: str, params: Optional[Dict] = None) -> Dict:
+        """
+        Make authenticated request to GitHub API, raising on failure.
+        
+        Args:
+            url: API endpoint URL
+            params: Optional query parameters
+            
+        Returns:
+            JSON response as dictionary
+        """
+        client = self.client
+        rate_key = client._rate_limit_key(url)
+        cache_key, cached = client._cache_lookup(url, params)
+        
+        # The scheduler may block until a budget resets, so wait off the loop
+        try:
+            await asyncio.to_thread(client.rate_limiter.acquire, rate_key)
+        except RateLimitExceeded:
+            if cached:
+                return client._rate_limited_fallback(cached)
+            raise
+        
+        response = await self.transport.get(url, headers=client._request_headers(cached), params=params)
+        return client._handle_response(response, rate_key, cache_key, cached)
+    
+    async def _search(self, query: str, per_page: int = 50) -> Dict:
+        """
+        Run a single search query, raising on failure.
+        
+        Args:
+            query: Complete search query string
+            per_page: Number of PRs to fetch
+            
+        Returns:
+            Dictionary with the PR "items" and the server-reported "total_count"
+        """
+        params = {
+            "q": query,
+            "sort": "created",
+            "order": "desc",
+            "per_page": per_page
+        }
+        result = await self._request(f"{self.client.base_url}/search/issues", params)
+        return {
+            "items": result.get("items", []),
+            "total_count": result.get("total_count", 0)
+        }
+    
+    async def _search_prs(self, qualifiers: str, limit: int = 50) -> Dict:
+        """
+        Run a PR search, with long repo filters split into concurrent chunks.
+        
+        Args:
+            qualifiers: User-specific qualifiers (e.g. "author:octocat")
+            limit: Number of PRs to fetch
+            
+        Returns:
+            Dictionary with the PR "items" and the server-reported "total_count"
+        """
+        queries = self.client._build_search_queries(qualifiers)
+        if len(queries) == 1:
+            return await self._search(queries[0], per_page=limit)
+        
+        outcomes = await asyncio.gather(
+            *(self._search(query, limit) for query in queries),
+            return_exceptions=True
+        )
+        results = [outcome for outcome in outcomes if not isinstance(outcome, BaseException)]
+        errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        
+        if errors:
+            if not results:
+                raise errors[0]
+            print(f"GitHub search failed for {len(errors)} of {len(queries)} repo chunks: {errors[0]}")
+        
+        return {
+            "items": merge_search_results([result["items"] for result in results], limit=limit),
+            "total_count": sum(result["total_count"] for result in results)
+        }
+    
+    async def _timed_search(self, qualifiers: str, limit: int) -> Dict:
+        """
+        Run a category search under the fetch deadline and record how long it took.
+        
+        Args:
+            qualifiers: Category search qualifiers
+            limit: Number of PRs to fetch
+            
+        Returns:
+            Dictionary with items, total count, elapsed time, error (if any)
+            and whether the deadline was missed
+        """
+        started = time.monotonic()
+        timed_out = False
+        try:
+            found = await asyncio.wait_for(self._search_prs(qualifiers, limit), self.client.fetch_deadline)
+            error = None
+        except asyncio.TimeoutError:
+            found = {"items": [], "total_count": 0}
+            error = f"timed out after {self.client.fetch_deadline:.1f}s"
+            timed_out = True
+        except (aiohttp.ClientError, AsyncHttpError, RateLimitExceeded, ValueError) as e:
+            found = {"items": [], "total_count": 0}
+            error = str(e)
+        return {
+            "items": found["items"],
+            "total": found["total_count"],
+            "elapsed": time.monotonic() - started,
+            "error": error,
+            "timed_out": timed_out
+        }
+    
+    async def get_all_user_work(self, limited: bool = True) -> Dict[str, List[Dict]]:
+        """
+        Get all GitHub work for the user.
+        
+        Args:
+            limited: Fetch only as many PRs per category as the Slack message
+                displays; "totals" still carries the full counts
+                
+        Returns:
+            Dictionary with categorized PRs, per-category "totals", a
+            "rate_limited" flag and a per-category "fetch_report"
+        """
+        client = self.client
+        if client.use_graphql or client.ci_enricher:
+            return await asyncio.to_thread(client.get_all_user_work, limited)
+        
+        return await self.single_flight.do(
+            ("github", client._token_id, client.username, "work", limited),
+            lambda: self._get_all_user_work(limited)
+        )
+    
+    async def _get_all_user_work(self, limited: bool) -> Dict[str, List[Dict]]:
+        """Fetch every category concurrently without coalescing."""
+        client = self.client
+        fallbacks_before = client._rate_limited_fallback_count()
+        qualifiers = client._category_qualifiers()
+        limits = client._category_limits(limited)
+        
+        categories = list(qualifiers)
+        outcomes = await asyncio.gather(
+            *(self._timed_search(qualifiers[category], limits[category]) for category in categories)
+        )
+        
+        results = {"totals": {}}
+        report = {}
+        for category, outcome in zip(categories, outcomes):
+            results[category] = outcome["items"]
+            if not outcome["timed_out"]:
+                results["totals"][category] = outcome["total"]
+            report[category] = {
+                "elapsed": outcome["elapsed"],
+                "error": outcome["error"],
+                "timed_out": outcome["timed_out"]
+            }
+        client._record_fetch_report(results, report)
+        
+        results["rate_limited"] = client._hit_rate_limit(
+            fallbacks_before,
+            client._rate_limit_key(f"{client.base_url}/search/issues"),
+            report
+        )
+        return results
@@ -0,0 +1,208 @@
+"""
+CI status enrichment for pull requests, cached per commit SHA.
+Combines Checks API runs and legacy commit statuses.
+"""
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional
+
+
+CI_SUCCESS = "success"
+CI_FAILURE = "failure"
+CI_PENDING = "pending"
+
+FAILING_CHECK_CONCLUSIONS = ("failure", "timed_out", "action_required", "startup_failure")
+FAILING_STATUS_STATES = ("failure", "error")
+
+
+class CIStatusCache:
+    """Per-SHA CI results; finished results never change, pending ones expire."""
+    
+    def __init__(self, max_entries: int = 5000, pending_ttl: float = 30.0):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of SHAs kept (least recently used go first)
+            pending_ttl: Seconds before a pending SHA is polled again
+        """
+        self.max_entries = max_entries
+        self.pending_ttl = pending_ttl
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._metrics = {"hits": 0, "misses": 0, "pending_refreshes": 0}
+    
+    def get(self, sha: str) -> Optional[str]:
+        """
+        Look up the CI state of a commit.
+        
+        Args:
+            sha: Commit SHA
+            
+        Returns:
+            CI state, or None if unknown or a pending result has expired
+        """
+        with self._lock:
+            entry = self._entries.get(sha)
+            if entry is None:
+                self._metrics["misses"] += 1
+                return None
+            if entry["state"] == CI_PENDING and time.monotonic() - entry["checked_at"] > self.pending_ttl:
+                self._metrics["pending_refreshes"] += 1
+                return None
+            self._entries.move_to_end(sha)
+            self._metrics["hits"] += 1
+            return entry["state"]
+    
+    def put(self, sha: str, state: str):
+        """
+        Store the CI state of a commit.
+        
+        Args:
+            sha: Commit SHA
+            state: CI state (success, failure or pending)
+        """
+        with self._lock:
+            self._entries[sha] = {"state": state, "checked_at": time.monotonic()}
+            self._entries.move_to_end(sha)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Get cache metrics.
+        
+        Returns:
+            Dictionary with hits, misses, pending refreshes and entries
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics["entries"] = len(self._entries)
+            return metrics
+
+
+class CIStatusEnricher:
+    """Looks up each PR's head commit CI state concurrently through the cache."""
+    
+    def __init__(
+        self,
+        request_json: Callable[..., Dict],
+        cache: Optional[CIStatusCache] = None,
+        max_workers: int = 8
+    ):
+        """
+        Initialize the enricher.
+        
+        Args:
+            request_json: Function taking (url, params) that returns the JSON body or raises
+            cache: Per-SHA CI status cache
+            max_workers: Size of the lookup worker pool
+        """
+        self.request_json = request_json
+        self.cache = cache or CIStatusCache()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="github-ci")
+    
+    def _head_sha(self, pr: Dict) -> Optional[str]:
+        """
+        Get the head commit SHA of a PR.
+        
+        Search results don't include it, so the PR itself is fetched; that
+        request is conditional and usually a free 304.
+        """
+        if pr.get("head_sha"):
+            return pr["head_sha"]
+        pull_url = (pr.get("pull_request") or {}).get("url")
+        if not pull_url and pr.get("repository_url") and pr.get("number"):
+            pull_url = f"{pr['repository_url']}/pulls/{pr['number']}"
+        if not pull_url:
+            return None
+        return (self.request_json(pull_url).get("head") or {}).get("sha")
+    
+    def _commit_state(self, repository_url: str, sha: str) -> str:
+        """
+        Combine Checks API runs and legacy statuses for one commit.
+        
+        Args:
+            repository_url: REST URL of the repository
+            sha: Commit SHA
+            
+        Returns:
+            CI state (success, failure or pending)
+        """
+        checks = self.request_json(
+            f"{repository_url}/commits/{sha}/check-runs",
+            {"per_page": 100}
+        )
+        status = self.request_json(f"{repository_url}/commits/{sha}/status")
+        
+        runs = checks.get("check_runs", [])
+        statuses = status.get("statuses", [])
+        
+        if any(run.get("conclusion") in FAILING_CHECK_CONCLUSIONS for run in runs):
+            return CI_FAILURE
+        if status.get("state") in FAILING_STATUS_STATES:
+            return CI_FAILURE
+        if any(run.get("status") != "completed" for run in runs):
+            return CI_PENDING
+        if statuses and status.get("state") == "pending":
+            return CI_PENDING
+        if not runs and not statuses:
+            # Checks may still be queued for a fresh push
+            return CI_PENDING
+        return CI_SUCCESS
+    
+    def get_state(self, pr: Dict) -> Optional[str]:
+        """
+        Get the CI state of a PR's head commit, using the cache when possible.
+        
+        Args:
+            pr: PR dictionary from a search result
+            
+        Returns:
+            CI state, or None if the head commit could not be determined
+        """
+        sha = self._head_sha(pr)
+        if not sha:
+            return None
+        
+        state = self.cache.get(sha)
+        if state is None:
+            state = self._commit_state(pr["repository_url"], sha)
+            self.cache.put(sha, state)
+        return state
+    
+    def failed_prs(self, prs: List[Dict], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get the PRs whose head commit has failing CI.
+        
+        Lookups run concurrently; PRs whose lookup fails or misses the
+        timeout are left out and counted, so callers can tell "no failures"
+        from "couldn't check".
+        
+        Args:
+            prs: PR dictionaries from a search result
+            timeout: Seconds to wait for all lookups
+            
+        Returns:
+            Dictionary with the "failed" PRs in their original order, and the
+            number of lookups that raised ("errors") or missed the timeout
+            ("timed_out")
+        """
+        futures = [(pr, self._executor.submit(self.get_state, pr)) for pr in prs]
+        wait([future for _, future in futures], timeout=timeout)
+        
+        outcome = {"failed": [], "errors": 0, "timed_out": 0}
+        for pr, future in futures:
+            if not future.done():
+                future.cancel()
+                outcome["timed_out"] += 1
+                continue
+            try:
+                if future.result() == CI_FAILURE:
+                    outcome["failed"].append(pr)
+            except Exception as e:
+                outcome["errors"] += 1
+                print(f"CI status lookup failed for {pr.get('html_url')}: {e}")
+        return outcome
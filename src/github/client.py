@@ -2,14 +2,46 @@
 GitHub API Client for fetching pull requests and related data.
 """
 import os
+import threading
+import time
+import hashlib
 import requests
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, List, Dict, Optional
+
+from github.ci_status import CIStatusCache, CIStatusEnricher
+from github.graphql import FAILED_CI_STATES, build_search_query, node_to_pr
+from github.query_planner import SearchQueryPlanner, merge_search_results
+from github.response_cache import ConditionalResponseCache
+from utils.formatter import GITHUB_DISPLAY_LIMITS
+from utils.http_transport import HttpTransport, get_http_transport
+from utils.rate_limit import RateLimitExceeded, RateLimitScheduler, get_rate_limit_scheduler
+from utils.single_flight import SingleFlight, get_single_flight
 
 
 class GitHubClient:
     """Client to interact with GitHub REST API v3."""
     
-    def __init__(self, token: str, org: str, username: str, repos: Optional[List[str]] = None):
+    def __init__(
+        self,
+        token: str,
+        org: str,
+        username: str,
+        repos: Optional[List[str]] = None,
+        concurrent: bool = True,
+        max_workers: int = 4,
+        fetch_deadline: float = 15.0,
+        transport: Optional[HttpTransport] = None,
+        response_cache: Optional[ConditionalResponseCache] = None,
+        rate_limiter: Optional[RateLimitScheduler] = None,
+        use_graphql: bool = False,
+        graphql_url: Optional[str] = None,
+        max_query_length: int = 256,
+        max_repos_per_query: int = 20,
+        ci_enrichment: bool = False,
+        display_limits: Optional[Dict[str, int]] = None,
+        single_flight: Optional[SingleFlight] = None
+    ):
         """
         Initialize GitHub client.
         
@@ -18,6 +50,21 @@ class GitHubClient:
             org: GitHub organization name
             username: GitHub username to query for
             repos: Optional list of specific repos to check
+            concurrent: Run the category searches in parallel
+            max_workers: Size of the worker pool used for concurrent searches
+            fetch_deadline: Overall deadline in seconds for get_all_user_work
+            transport: HTTP transport (defaults to the shared pooled transport)
+            response_cache: Optional ETag/Last-Modified cache for conditional requests
+            rate_limiter: Rate limit scheduler (defaults to the shared scheduler)
+            use_graphql: Fetch all categories with a single GraphQL query
+            graphql_url: GraphQL endpoint (defaults to the public GitHub API)
+            max_query_length: Longest search query before repo filters are split
+            max_repos_per_query: Most repo qualifiers per search query
+            ci_enrichment: Derive failed CI from each PR's head commit checks
+                instead of the legacy "status:failure" search
+            display_limits: PRs fetched per category for display (defaults to
+                what the Slack formatter shows)
+            single_flight: Coalesces identical concurrent fetches (defaults to the shared group)
         """
         self.token = token
         self.org = org
@@ -28,6 +75,149 @@ class GitHubClient:
             "Authorization": f"token {token}",
             "Accept": "application/vnd.github.v3+json"
         }
+        self.concurrent = concurrent
+        self.max_workers = max(1, max_workers)
+        self.fetch_deadline = fetch_deadline
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.transport = transport or get_http_transport()
+        self.response_cache = response_cache
+        self.rate_limiter = rate_limiter or get_rate_limit_scheduler()
+        self._token_id = hashlib.sha256(token.encode()).hexdigest()[:12]
+        self.use_graphql = use_graphql
+        self.graphql_url = graphql_url or f"{self.base_url}/graphql"
+        self.query_planner = SearchQueryPlanner(
+            org=org,
+            repos=self.repos,
+            max_query_length=max_query_length,
+            max_repos_per_query=max_repos_per_query
+        )
+        self._chunk_executor: Optional[ThreadPoolExecutor] = None
+        self.display_limits = dict(display_limits or GITHUB_DISPLAY_LIMITS)
+        self.single_flight = single_flight or get_single_flight()
+        self.ci_enricher = None
+        if ci_enrichment:
+            self.ci_enricher = CIStatusEnricher(self._request, CIStatusCache(), max_workers=self.max_workers * 2)
+        
+        # Requests answered from the response cache because of rate limiting
+        self._rate_limited_fallbacks = 0
+        self._fallback_lock = threading.Lock()
+    
+    def _request(self, url: str, params: Optional[Dict] = None) -> Dict:
+        """
+        Make authenticated request to GitHub API, raising on failure.
+        
+        Args:
+            url: API endpoint URL
+            params: Optional query parameters
+            
+        Returns:
+            JSON response as dictionary
+        """
+        rate_key = self._rate_limit_key(url)
+        cache_key, cached = self._cache_lookup(url, params)
+        
+        # Wait for budget; if it won't reset soon, serve cached data instead
+        try:
+            self.rate_limiter.acquire(rate_key)
+        except RateLimitExceeded:
+            if cached:
+                return self._rate_limited_fallback(cached)
+            raise
+        
+        response = self.transport.get(url, headers=self._request_headers(cached), params=params, timeout=10)
+        return self._handle_response(response, rate_key, cache_key, cached)
+    
+    def _cache_lookup(self, url: str, params: Optional[Dict]):
+        """Get the response cache key and cached entry for a request (None without a cache)."""
+        if self.response_cache is None:
+            return None, None
+        cache_key = self.response_cache.make_key(url, params)
+        return cache_key, self.response_cache.get(cache_key)
+    
+    def _request_headers(self, cached: Optional[Dict]) -> Dict[str, str]:
+        """Build request headers; cached responses are revalidated, and a 304 reuses the cached body."""
+        headers = dict(self.headers)
+        if cached:
+            headers.update(self.response_cache.conditional_headers(cached))
+        return headers
+    
+    @staticmethod
+    def _is_rate_limit_failure(response) -> bool:
+        """Check whether GitHub refused a request because of rate limiting."""
+        if response.status_code == 429:
+            return True
+        return response.status_code == 403 and bool(
+            response.headers.get("Retry-After") or response.headers.get("X-RateLimit-Remaining") == "0"
+        )
+    
+    def _rate_limited_fallback(self, cached: Dict) -> Dict:
+        """Serve a cached body in place of a rate limited request."""
+        with self._fallback_lock:
+            self._rate_limited_fallbacks += 1
+        return cached["body"]
+    
+    def _handle_response(self, response, rate_key: str, cache_key, cached: Optional[Dict]) -> Dict:
+        """
+        Turn a REST response into its body, raising on failure.
+        
+        Shared by the sync and async clients. Successful responses are
+        always returned and cached, even when they use up the budget; the
+        cached body only stands in for a 304 or a rate limit failure.
+        
+        Args:
+            response: requests.Response or AsyncResponse
+            rate_key: Rate limit key of the request
+            cache_key: Response cache key (None without a cache)
+            cached: Cached entry that was revalidated, if any
+            
+        Returns:
+            JSON response as dictionary
+        """
+        self.rate_limiter.update(rate_key, response.headers, response.status_code)
+        
+        if response.status_code == 304 and cached:
+            self.response_cache.record_not_modified()
+            return cached["body"]
+        if cached and self._is_rate_limit_failure(response):
+            return self._rate_limited_fallback(cached)
+        
+        response.raise_for_status()
+        body = response.json()
+        if self.response_cache is not None:
+            self.response_cache.store(
+                cache_key,
+                body,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                size=len(response.content)
+            )
+        return body
+    
+    def _rate_limited_fallback_count(self) -> int:
+        """Get how many requests have been served from cache because of rate limiting."""
+        with self._fallback_lock:
+            return self._rate_limited_fallbacks
+    
+    def _hit_rate_limit(self, fallbacks_before: int, rate_key: str, report: Dict[str, Dict]) -> bool:
+        """
+        Check whether a fetch was cut short by rate limiting.
+        
+        That is the case when a request was answered from cache instead,
+        or a category failed while the budget is exhausted. A budget that
+        merely reached zero on a successful response doesn't count.
+        
+        Args:
+            fallbacks_before: Fallback count when the fetch started
+            rate_key: Rate limit key of the fetch
+            report: The fetch's per-category report
+            
+        Returns:
+            True if the results are incomplete or stale because of rate limiting
+        """
+        if self._rate_limited_fallback_count() > fallbacks_before:
+            return True
+        failed = any(entry.get("error") for entry in report.values())
+        return failed and self.rate_limiter.is_limited(rate_key)
     
     def _make_request(self, url: str, params: Optional[Dict] = None) -> Dict:
         """
@@ -41,99 +231,196 @@ class GitHubClient:
             JSON response as dictionary
         """
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return self._request(url, params)
+        except (requests.exceptions.RequestException, RateLimitExceeded) as e:
             print(f"GitHub API request failed: {e}")
             return {}
     
-    def get_user_created_prs(self) -> List[Dict]:
+    def _rate_limit_key(self, url: str) -> str:
         """
-        Get all open PRs created by the user.
+        Get the rate limit key for a request.
+        
+        GitHub budgets are per token and per resource; search has its own
+        much smaller budget than the core API.
         
+        Args:
+            url: API endpoint URL
+            
         Returns:
-            List of PR dictionaries
+            Rate limit key
+        """
+        if url == self.graphql_url:
+            resource = "graphql"
+        elif "/search/" in url:
+            resource = "search"
+        else:
+            resource = "core"
+        return f"github:{resource}:{self._token_id}"
+    
+    def _graphql_request(self, payload: Dict) -> Dict:
         """
-        query = f"is:pr is:open author:{self.username}"
+        Run a GraphQL query, raising on failure.
         
-        # Add org filter if specified
-        if self.org:
-            query += f" org:{self.org}"
+        Args:
+            payload: Request body with "query" and "variables"
+            
+        Returns:
+            The "data" object of the response
+        """
+        rate_key = self._rate_limit_key(self.graphql_url)
+        self.rate_limiter.acquire(rate_key)
         
-        # Add repo filter if specified
-        if self.repos:
-            repo_query = " ".join([f"repo:{self.org}/{repo}" for repo in self.repos])
-            query = f"is:pr is:open author:{self.username} {repo_query}"
+        response = self.transport.post(self.graphql_url, headers=self.headers, json=payload, timeout=10)
+        self.rate_limiter.update(rate_key, response.headers, response.status_code)
+        response.raise_for_status()
         
-        url = f"{self.base_url}/search/issues"
-        params = {
-            "q": query,
-            "sort": "created",
-            "order": "desc",
-            "per_page": 50
-        }
+        body = response.json()
+        errors = body.get("errors") or []
+        if errors:
+            messages = "; ".join(error.get("message", "unknown error") for error in errors)
+            if not body.get("data"):
+                raise RuntimeError(f"GitHub GraphQL query failed: {messages}")
+            print(f"GitHub GraphQL query returned partial data: {messages}")
         
-        result = self._make_request(url, params)
-        return result.get("items", [])
+        return body.get("data") or {}
     
-    def get_prs_awaiting_review(self) -> List[Dict]:
+    def _build_search_queries(self, qualifiers: str) -> List[str]:
         """
-        Get all open PRs where the user is requested as a reviewer.
+        Build the PR search queries scoped to the configured org or repos.
+        
+        Long repo lists are split into several queries so each one stays
+        within GitHub's search query limits.
         
+        Args:
+            qualifiers: User-specific qualifiers (e.g. "author:octocat")
+            
         Returns:
-            List of PR dictionaries
+            List of GitHub search query strings
         """
-        query = f"is:pr is:open review-requested:{self.username}"
+        query = f"is:pr is:open {qualifiers}"
         
-        # Add org filter if specified
+        # Add repo filter if specified, otherwise scope to the org
+        if self.repos:
+            return self.query_planner.build_queries(query)
         if self.org:
             query += f" org:{self.org}"
         
-        # Add repo filter if specified
-        if self.repos:
-            repo_query = " ".join([f"repo:{self.org}/{repo}" for repo in self.repos])
-            query = f"is:pr is:open review-requested:{self.username} {repo_query}"
+        return [query]
+    
+    def _get_chunk_executor(self) -> ThreadPoolExecutor:
+        """Get the worker pool for repo chunk searches, creating it on first use."""
+        if self._chunk_executor is None:
+            self._chunk_executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="github-chunk"
+            )
+        return self._chunk_executor
+    
+    def _search(self, query: str, strict: bool, per_page: int = 50, page: int = 1) -> Dict:
+        """
+        Run a single search query.
         
+        Args:
+            query: Complete search query string
+            strict: Raise on request failure instead of returning an empty list
+            per_page: Number of PRs to fetch
+            page: Result page to fetch (1-based)
+            
+        Returns:
+            Dictionary with the PR "items" and the server-reported "total_count"
+        """
         url = f"{self.base_url}/search/issues"
         params = {
             "q": query,
             "sort": "created",
             "order": "desc",
-            "per_page": 50
+            "per_page": per_page
         }
+        if page > 1:
+            params["page"] = page
         
-        result = self._make_request(url, params)
-        return result.get("items", [])
+        if strict:
+            result = self._request(url, params)
+        else:
+            result = self._make_request(url, params)
+        return {
+            "items": result.get("items", []),
+            "total_count": result.get("total_count", 0)
+        }
     
-    def get_assigned_prs(self) -> List[Dict]:
+    def _search_prs(self, qualifiers: str, strict: bool = False, limit: int = 50) -> Dict:
         """
-        Get all open PRs assigned to the user.
+        Run a PR search, splitting long repo filters into parallel chunks.
         
+        Args:
+            qualifiers: User-specific qualifiers (e.g. "author:octocat")
+            strict: Raise on request failure instead of returning an empty list
+            limit: Number of PRs to fetch
+            
         Returns:
-            List of PR dictionaries
+            Dictionary with the PR "items" and the server-reported "total_count"
         """
-        query = f"is:pr is:open assignee:{self.username}"
+        queries = self._build_search_queries(qualifiers)
+        if len(queries) == 1:
+            return self._search(queries[0], strict, per_page=limit)
         
-        # Add org filter if specified
-        if self.org:
-            query += f" org:{self.org}"
+        # Chunks run on their own pool so category workers never wait on themselves
+        executor = self._get_chunk_executor()
+        futures = [executor.submit(self._search, query, strict, limit) for query in queries]
         
-        # Add repo filter if specified
-        if self.repos:
-            repo_query = " ".join([f"repo:{self.org}/{repo}" for repo in self.repos])
-            query = f"is:pr is:open assignee:{self.username} {repo_query}"
+        results = []
+        errors = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                errors.append(e)
         
-        url = f"{self.base_url}/search/issues"
-        params = {
-            "q": query,
-            "sort": "created",
-            "order": "desc",
-            "per_page": 50
+        if errors:
+            if not results:
+                raise errors[0]
+            print(f"GitHub search failed for {len(errors)} of {len(queries)} repo chunks: {errors[0]}")
+        
+        return {
+            "items": merge_search_results([result["items"] for result in results], limit=limit),
+            "total_count": sum(result["total_count"] for result in results)
+        }
+    
+    def _category_qualifiers(self) -> Dict[str, str]:
+        """Map each work category to its search qualifiers."""
+        return {
+            "created": f"author:{self.username}",
+            "review_requested": f"review-requested:{self.username}",
+            "assigned": f"assignee:{self.username}",
+            "failed_ci": f"author:{self.username} status:failure"
         }
+    
+    def get_user_created_prs(self) -> List[Dict]:
+        """
+        Get all open PRs created by the user.
+        
+        Returns:
+            List of PR dictionaries
+        """
+        return self._search_prs(self._category_qualifiers()["created"])["items"]
+    
+    def get_prs_awaiting_review(self) -> List[Dict]:
+        """
+        Get all open PRs where the user is requested as a reviewer.
         
-        result = self._make_request(url, params)
-        return result.get("items", [])
+        Returns:
+            List of PR dictionaries
+        """
+        return self._search_prs(self._category_qualifiers()["review_requested"])["items"]
+    
+    def get_assigned_prs(self) -> List[Dict]:
+        """
+        Get all open PRs assigned to the user.
+        
+        Returns:
+            List of PR dictionaries
+        """
+        return self._search_prs(self._category_qualifiers()["assigned"])["items"]
     
     def get_prs_with_failed_ci(self) -> List[Dict]:
         """
@@ -142,41 +429,296 @@ class GitHubClient:
         Returns:
             List of PR dictionaries with failed CI
         """
-        query = f"is:pr is:open author:{self.username} status:failure"
+        return self._search_prs(self._category_qualifiers()["failed_ci"])["items"]
+    
+    def get_category_page(self, category: str, offset: int, count: int) -> Dict:
+        """
+        Fetch the next PRs of one category, for "Show more".
         
-        # Add org filter if specified
-        if self.org:
-            query += f" org:{self.org}"
+        Args:
+            category: Work category (e.g. "created")
+            offset: Number of PRs already fetched
+            count: Number of PRs to fetch
+            
+        Returns:
+            Dictionary with the PR "items" and the server-reported "total_count"
+        """
+        return self.single_flight.do(
+            ("github", self._token_id, self.username, "page", category, offset, count),
+            lambda: self._get_category_page(category, offset, count)
+        )
+    
+    def _get_category_page(self, category: str, offset: int, count: int) -> Dict:
+        """Fetch the next PRs of one category without coalescing."""
+        qualifiers = self._category_qualifiers()[category]
+        queries = self._build_search_queries(qualifiers)
+        if len(queries) == 1 and offset % count == 0:
+            return self._search(queries[0], strict=False, per_page=count, page=offset // count + 1)
         
-        # Add repo filter if specified
-        if self.repos:
-            repo_query = " ".join([f"repo:{self.org}/{repo}" for repo in self.repos])
-            query = f"is:pr is:open author:{self.username} status:failure {repo_query}"
+        # Repo chunks can only be merged from the top, so fetch everything up to the page
+        found = self._search_prs(qualifiers, limit=min(offset + count, 100))
+        return {
+            "items": found["items"][offset:offset + count],
+            "total_count": found["total_count"]
+        }
+    
+    def _category_limits(self, limited: bool) -> Dict[str, int]:
+        """
+        Get how many PRs to fetch per category.
         
-        url = f"{self.base_url}/search/issues"
-        params = {
-            "q": query,
-            "sort": "created",
-            "order": "desc",
-            "per_page": 50
+        Args:
+            limited: Fetch only what the Slack message displays
+            
+        Returns:
+            Mapping of category to fetch size
+        """
+        limits = {category: 50 for category in self._category_qualifiers()}
+        if limited:
+            limits.update(self.display_limits)
+            if self.ci_enricher or self.use_graphql:
+                # Failed CI is derived from the created PRs, so those are fetched in full
+                limits["created"] = 50
+        return limits
+    
+    def _category_fetchers(self, limited: bool = True) -> Dict[str, Callable[[], Dict]]:
+        """Map each work category to a fetcher that raises on failure."""
+        qualifiers = self._category_qualifiers()
+        limits = self._category_limits(limited)
+        if self.ci_enricher:
+            # Failed CI is derived from the created PRs afterwards
+            del qualifiers["failed_ci"]
+        return {
+            category: (lambda q=category_qualifiers, n=limits[category]: self._search_prs(q, strict=True, limit=n))
+            for category, category_qualifiers in qualifiers.items()
         }
+    
+    def _enrich_failed_ci(self, results: Dict[str, List[Dict]], timeout: Optional[float] = None):
+        """
+        Fill in the failed_ci category from the created PRs' head commits.
+        
+        Args:
+            results: Category results, updated in place
+            timeout: Seconds to wait for the CI lookups
+        """
+        started = time.monotonic()
+        created = results.get("created", [])
+        outcome = self.ci_enricher.failed_prs(created, timeout=timeout)
+        results["failed_ci"] = outcome["failed"]
+        results["totals"]["failed_ci"] = len(results["failed_ci"])
         
-        result = self._make_request(url, params)
-        return result.get("items", [])
+        # A PR that couldn't be checked may be failing, so the category isn't complete
+        unchecked = outcome["errors"] + outcome["timed_out"]
+        error = None
+        if unchecked:
+            error = f"CI status unknown for {unchecked} of {len(created)} PRs"
+            if outcome["timed_out"]:
+                error += f" ({outcome['timed_out']} timed out)"
+            print(f"GitHub failed_ci fetch failed: {error}")
+        results["fetch_report"]["failed_ci"] = {
+            "elapsed": time.monotonic() - started,
+            "error": error,
+            "timed_out": outcome["timed_out"] > 0
+        }
     
-    def get_all_user_work(self) -> Dict[str, List[Dict]]:
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the worker pool for concurrent searches, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="github-fetch"
+            )
+        return self._executor
+    
+    def _timed_fetch(self, fetcher: Callable[[], Dict]) -> Dict:
         """
-        Get all GitHub work for the user.
+        Run a category fetcher and record how long it took.
         
+        Args:
+            fetcher: Category fetch method
+            
         Returns:
-            Dictionary with categorized PRs
+            Dictionary with items, total count, elapsed time and error (if any)
         """
+        started = time.monotonic()
+        try:
+            found = fetcher()
+            error = None
+        except Exception as e:
+            found = {"items": [], "total_count": 0}
+            error = str(e)
         return {
-            "created": self.get_user_created_prs(),
-            "review_requested": self.get_prs_awaiting_review(),
-            "assigned": self.get_assigned_prs(),
-            "failed_ci": self.get_prs_with_failed_ci()
+            "items": found["items"],
+            "total": found["total_count"],
+            "elapsed": time.monotonic() - started,
+            "error": error
         }
+    
+    @staticmethod
+    def _record_fetch_report(results: Dict, report: Dict[str, Dict]):
+        """
+        Attach the per-category report to a fetch's results and log any failed categories.
+        
+        The report travels with the results rather than on the client, since
+        fetches of both sizes (and the async client) run at the same time.
+        
+        Args:
+            results: Category results, updated in place
+            report: Per-category elapsed time, error and timed_out flag
+        """
+        for category, entry in report.items():
+            if entry["error"]:
+                print(f"GitHub {category} fetch failed: {entry['error']}")
+        results["fetch_report"] = report
+    
+    def _get_all_user_work_sequential(self, limited: bool = True) -> Dict[str, List[Dict]]:
+        """Fetch every category one after another."""
+        results = {"totals": {}}
+        report = {}
+        for category, fetcher in self._category_fetchers(limited).items():
+            outcome = self._timed_fetch(fetcher)
+            results[category] = outcome["items"]
+            results["totals"][category] = outcome["total"]
+            report[category] = {
+                "elapsed": outcome["elapsed"],
+                "error": outcome["error"],
+                "timed_out": False
+            }
+        self._record_fetch_report(results, report)
+        return results
+    
+    def _get_all_user_work_concurrent(self, limited: bool = True) -> Dict[str, List[Dict]]:
+        """
+        Fetch every category in parallel under one overall deadline.
+        
+        Categories that fail or miss the deadline come back as empty lists
+        and are flagged in the "fetch_report"; the others are unaffected.
+        """
+        executor = self._get_executor()
+        started = time.monotonic()
+        futures = {
+            category: executor.submit(self._timed_fetch, fetcher)
+            for category, fetcher in self._category_fetchers(limited).items()
+        }
+        wait(futures.values(), timeout=self.fetch_deadline)
+        
+        results = {"totals": {}}
+        report = {}
+        for category, future in futures.items():
+            if future.done():
+                outcome = future.result()
+                results[category] = outcome["items"]
+                results["totals"][category] = outcome["total"]
+                report[category] = {
+                    "elapsed": outcome["elapsed"],
+                    "error": outcome["error"],
+                    "timed_out": False
+                }
+            else:
+                future.cancel()
+                results[category] = []
+                report[category] = {
+                    "elapsed": time.monotonic() - started,
+                    "error": f"timed out after {self.fetch_deadline:.1f}s",
+                    "timed_out": True
+                }
+        
+        self._record_fetch_report(results, report)
+        return results
+    
+    def _get_all_user_work_graphql(self, limited: bool = True) -> Dict[str, List[Dict]]:
+        """
+        Fetch every category with one GraphQL request.
+        
+        Each category is an aliased search field. Failed CI is derived from
+        the status check rollup of the user's own PRs instead of a separate
+        "status:failure" search.
+        """
+        qualifiers = self._category_qualifiers()
+        limits = self._category_limits(limited)
+        categories = ("created", "review_requested", "assigned")
+        
+        # One aliased search per category and repo chunk, all in one request
+        searches = {}
+        first = {}
+        for category in categories:
+            for index, query in enumerate(self._build_search_queries(qualifiers[category])):
+                searches[f"{category}_{index}"] = query
+                first[f"{category}_{index}"] = limits[category]
+        with_ci = [alias for alias in searches if alias.startswith("created_")]
+        payload = build_search_query(searches, with_ci=with_ci, first=first)
+        
+        started = time.monotonic()
+        try:
+            data = self._graphql_request(payload)
+            error = None
+        except (requests.exceptions.RequestException, RateLimitExceeded, RuntimeError) as e:
+            data = {}
+            error = str(e)
+        elapsed = time.monotonic() - started
+        
+        results = {}
+        totals = {}
+        for category in categories:
+            chunk_results = []
+            totals[category] = 0
+            for alias in searches:
+                if alias.rsplit("_", 1)[0] != category:
+                    continue
+                search = data.get(alias) or {}
+                nodes = search.get("nodes") or []
+                chunk_results.append([node_to_pr(node, self.base_url) for node in nodes if node])
+                totals[category] += search.get("issueCount", 0)
+            results[category] = merge_search_results(chunk_results, limit=limits[category])
+        results["failed_ci"] = [
+            pr for pr in results["created"] if pr.get("ci_state") in FAILED_CI_STATES
+        ]
+        totals["failed_ci"] = len(results["failed_ci"])
+        
+        self._record_fetch_report(results, {
+            category: {"elapsed": elapsed, "error": error, "timed_out": False}
+            for category in results
+        })
+        results["totals"] = totals
+        return results
+    
+    def get_all_user_work(self, limited: bool = True) -> Dict[str, List[Dict]]:
+        """
+        Get all GitHub work for the user.
+        
+        Args:
+            limited: Fetch only as many PRs per category as the Slack message
+                displays; "totals" still carries the full counts
+            
+        Returns:
+            Dictionary with categorized PRs, per-category "totals", a
+            "rate_limited" flag and a per-category "fetch_report"
+        """
+        # Everyone sees the same configured user's PRs, so concurrent callers share one fetch
+        return self.single_flight.do(
+            ("github", self._token_id, self.username, "work", limited),
+            lambda: self._get_all_user_work(limited)
+        )
+    
+    def _get_all_user_work(self, limited: bool) -> Dict[str, List[Dict]]:
+        """Fetch all GitHub work for the user without coalescing."""
+        fallbacks_before = self._rate_limited_fallback_count()
+        if self.use_graphql:
+            results = self._get_all_user_work_graphql(limited)
+            rate_key = self._rate_limit_key(self.graphql_url)
+        else:
+            started = time.monotonic()
+            if self.concurrent:
+                results = self._get_all_user_work_concurrent(limited)
+            else:
+                results = self._get_all_user_work_sequential(limited)
+            if self.ci_enricher:
+                remaining = max(0.0, self.fetch_deadline - (time.monotonic() - started))
+                self._enrich_failed_ci(results, timeout=remaining)
+            rate_key = self._rate_limit_key(f"{self.base_url}/search/issues")
+        
+        # Let the formatter tell "rate limited" apart from "nothing to do"
+        results["rate_limited"] = self._hit_rate_limit(fallbacks_before, rate_key, results["fetch_report"])
+        return results
 
 
 def create_github_client() -> Optional[GitHubClient]:
@@ -190,12 +732,39 @@ def create_github_client() -> Optional[GitHubClient]:
     org = os.getenv("GITHUB_ORG")
     username = os.getenv("GITHUB_USERNAME")
     repos_str = os.getenv("GITHUB_REPOS", "")
+    concurrent = os.getenv("GITHUB_CONCURRENT_FETCH", "true").lower() == "true"
+    max_workers = int(os.getenv("GITHUB_FETCH_WORKERS", "4"))
+    fetch_deadline = float(os.getenv("GITHUB_FETCH_DEADLINE", "15"))
+    cache_entries = int(os.getenv("GITHUB_CACHE_MAX_ENTRIES", "256"))
+    cache_bytes = int(os.getenv("GITHUB_CACHE_MAX_BYTES", str(5 * 1024 * 1024)))
+    use_graphql = os.getenv("GITHUB_USE_GRAPHQL", "false").lower() == "true"
+    graphql_url = os.getenv("GITHUB_GRAPHQL_URL") or None
+    max_query_length = int(os.getenv("GITHUB_MAX_QUERY_LENGTH", "256"))
+    max_repos_per_query = int(os.getenv("GITHUB_MAX_REPOS_PER_QUERY", "20"))
+    ci_enrichment = os.getenv("GITHUB_CI_ENRICHMENT", "false").lower() == "true"
     
     if not token or not username:
         print("GitHub configuration missing: GITHUB_TOKEN and GITHUB_USERNAME are required")
         return None
     
     repos = [r.strip() for r in repos_str.split(",") if r.strip()] if repos_str else []
+    response_cache = None
+    if cache_entries > 0:
+        response_cache = ConditionalResponseCache(max_entries=cache_entries, max_bytes=cache_bytes)
     
-    return GitHubClient(token=token, org=org, username=username, repos=repos)
+    return GitHubClient(
+        token=token,
+        org=org,
+        username=username,
+        repos=repos,
+        concurrent=concurrent,
+        max_workers=max_workers,
+        fetch_deadline=fetch_deadline,
+        response_cache=response_cache,
+        use_graphql=use_graphql,
+        graphql_url=graphql_url,
+        max_query_length=max_query_length,
+        max_repos_per_query=max_repos_per_query,
+        ci_enrichment=ci_enrichment
+    )
 
@@ -0,0 +1,121 @@
+"""
+GitHub GraphQL query building for fetching all PR categories in one request.
+"""
+from typing import Dict, List, Optional
+
+
+# Only the fields SlackMessageFormatter uses, plus ids for de-duplication
+PR_FIELDS = """
+fragment PrFields on PullRequest {
+  databaseId
+  number
+  title
+  url
+  createdAt
+  author { login }
+  repository { nameWithOwner }
+}
+"""
+
+# The latest commit's rollup covers both the Checks API and legacy statuses
+PR_FIELDS_WITH_CI = """
+fragment PrFieldsWithCI on PullRequest {
+  ...PrFields
+  commits(last: 1) {
+    nodes {
+      commit {
+        statusCheckRollup { state }
+      }
+    }
+  }
+}
+"""
+
+FAILED_CI_STATES = ("FAILURE", "ERROR")
+
+
+def build_search_query(
+    searches: Dict[str, str],
+    with_ci: Optional[List[str]] = None,
+    first: Optional[Dict[str, int]] = None
+) -> Dict:
+    """
+    Build a GraphQL request with one aliased search field per category.
+    
+    Args:
+        searches: Mapping of alias to GitHub search query string
+        with_ci: Aliases whose results should include CI rollup status
+        first: Mapping of alias to the number of results to fetch (default 50)
+        
+    Returns:
+        Request payload with "query" and "variables"
+    """
+    with_ci = with_ci or []
+    first = first or {}
+    variable_defs = []
+    fields = []
+    variables = {}
+    
+    for index, (alias, search) in enumerate(searches.items()):
+        name = f"q{index}"
+        variable_defs.append(f"${name}: String!")
+        variable_defs.append(f"${name}_first: Int!")
+        variables[name] = search
+        variables[f"{name}_first"] = first.get(alias, 50)
+        fragment = "PrFieldsWithCI" if alias in with_ci else "PrFields"
+        fields.append(
+            f"  {alias}: search(query: ${name}, type: ISSUE, first: ${name}_first) {{\n"
+            f"    issueCount\n"
+            f"    nodes {{ ...{fragment} }}\n"
+            f"  }}"
+        )
+    
+    query = f"query({', '.join(variable_defs)}) {{\n" + "\n".join(fields) + "\n}\n" + PR_FIELDS
+    if with_ci:
+        query += PR_FIELDS_WITH_CI
+    
+    return {"query": query, "variables": variables}
+
+
+def node_ci_state(node: Dict) -> Optional[str]:
+    """
+    Get the CI rollup state of a PR node.
+    
+    Args:
+        node: PullRequest node from a search result
+        
+    Returns:
+        Rollup state (e.g. "SUCCESS", "FAILURE") or None if unknown
+    """
+    commits = (node.get("commits") or {}).get("nodes") or []
+    if not commits:
+        return None
+    rollup = (commits[0].get("commit") or {}).get("statusCheckRollup")
+    return rollup.get("state") if rollup else None
+
+
+def node_to_pr(node: Dict, api_base_url: str) -> Dict:
+    """
+    Convert a PullRequest node into the REST search item shape.
+    
+    Args:
+        node: PullRequest node from a search result
+        api_base_url: REST API base URL, used to build repository_url
+        
+    Returns:
+        PR dictionary compatible with the REST search results
+    """
+    repository = (node.get("repository") or {}).get("nameWithOwner", "")
+    author = node.get("author") or {}
+    pr = {
+        "id": node.get("databaseId"),
+        "number": node.get("number"),
+        "title": node.get("title"),
+        "html_url": node.get("url"),
+        "repository_url": f"{api_base_url}/repos/{repository}" if repository else "",
+        "user": {"login": author.get("login", "ghost")},
+        "created_at": node.get("createdAt")
+    }
+    if "commits" in node:
+        pr["ci_state"] = node_ci_state(node)
+    return pr
@@ -0,0 +1,346 @@
+"""
+Local index of open pull requests fed by GitHub webhooks.
+Lets /mywork answer from memory instead of calling the search API.
+"""
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+from github.ci_status import FAILING_CHECK_CONCLUSIONS, FAILING_STATUS_STATES
+
+
+RECONCILED_CATEGORIES = ("created", "review_requested", "assigned", "failed_ci")
+
+
+def pr_key(pr: Dict) -> str:
+    """
+    Get the identity a PR is indexed under.
+    
+    Search results carry the issue ID while webhooks carry the pull
+    request ID, so the PR's URL is used instead; both sources share it.
+    
+    Args:
+        pr: Search result item or webhook pull request object
+        
+    Returns:
+        Index key
+    """
+    return pr.get("html_url") or str(pr.get("id"))
+
+
+class PullRequestIndex:
+    """Open PRs indexed by author, requested reviewer and assignee."""
+    
+    def __init__(self, result_limit: int = 50):
+        """
+        Initialize an empty index.
+        
+        Args:
+            result_limit: Maximum number of PRs returned per category
+        """
+        self.result_limit = result_limit
+        # Keyed by pr_key
+        self._prs: Dict[str, Dict] = {}
+        self._by_author: Dict[str, Set[str]] = {}
+        self._by_reviewer: Dict[str, Set[str]] = {}
+        self._by_assignee: Dict[str, Set[str]] = {}
+        # head SHA -> {check suite or status context: failing?}
+        self._sha_checks: Dict[str, Dict[str, bool]] = {}
+        self._lock = threading.RLock()
+        self.last_reconciled: Optional[float] = None
+        self.events_applied = 0
+    
+    def is_ready(self) -> bool:
+        """Check whether the index has been filled by at least one reconciliation."""
+        return self.last_reconciled is not None
+    
+    @staticmethod
+    def _login(user: Optional[Dict]) -> Optional[str]:
+        """Normalize a user object to a lowercase login."""
+        if not user or not user.get("login"):
+            return None
+        return user["login"].lower()
+    
+    def _link(self, table: Dict[str, Set[str]], logins: Iterable[str], pr_id: str):
+        """Add a PR to the given logins in one lookup table."""
+        for login in logins:
+            table.setdefault(login, set()).add(pr_id)
+    
+    def _unlink(self, table: Dict[str, Set[str]], logins: Iterable[str], pr_id: str):
+        """Remove a PR from the given logins in one lookup table."""
+        for login in logins:
+            ids = table.get(login)
+            if ids is None:
+                continue
+            ids.discard(pr_id)
+            if not ids:
+                del table[login]
+    
+    def _remove(self, pr_id: str):
+        """Drop a PR and all of its lookup entries."""
+        record = self._prs.pop(pr_id, None)
+        if record is None:
+            return
+        self._unlink(self._by_author, [record["author"]] if record["author"] else [], pr_id)
+        self._unlink(self._by_reviewer, record["reviewers"], pr_id)
+        self._unlink(self._by_assignee, record["assignees"], pr_id)
+    
+    def _store(self, record: Dict):
+        """Insert or replace a PR record and its lookup entries."""
+        pr_id = pr_key(record["item"])
+        self._remove(pr_id)
+        self._prs[pr_id] = record
+        self._link(self._by_author, [record["author"]] if record["author"] else [], pr_id)
+        self._link(self._by_reviewer, record["reviewers"], pr_id)
+        self._link(self._by_assignee, record["assignees"], pr_id)
+    
+    def _upsert_pull_request(self, pr: Dict):
+        """Index a pull request object from a webhook payload."""
+        if pr.get("state") != "open":
+            self._remove(pr_key(pr))
+            return
+        
+        previous = self._prs.get(pr_key(pr), {})
+        item = {
+            "id": pr["id"],
+            "number": pr.get("number"),
+            "title": pr.get("title"),
+            "html_url": pr.get("html_url"),
+            "repository_url": ((pr.get("base") or {}).get("repo") or {}).get("url", ""),
+            "user": {"login": (pr.get("user") or {}).get("login", "ghost")},
+            "created_at": pr.get("created_at")
+        }
+        self._store({
+            "item": item,
+            "author": self._login(pr.get("user")),
+            "reviewers": {login for login in map(self._login, pr.get("requested_reviewers") or []) if login},
+            "assignees": {login for login in map(self._login, pr.get("assignees") or []) if login},
+            "head_sha": (pr.get("head") or {}).get("sha"),
+            "ci_failed": previous.get("ci_failed", False)
+        })
+    
+    def _record_check(self, sha: Optional[str], source: str, failing: bool):
+        """Record the outcome of one check suite or status context for a commit."""
+        if not sha:
+            return
+        self._sha_checks.setdefault(sha, {})[source] = failing
+    
+    def apply_event(self, event: str, payload: Dict):
+        """
+        Apply a GitHub webhook event to the index.
+        
+        Handles pull_request, pull_request_review, check_suite and status
+        events; anything else is ignored.
+        
+        Args:
+            event: Value of the X-GitHub-Event header
+            payload: Decoded webhook payload
+        """
+        with self._lock:
+            if event in ("pull_request", "pull_request_review"):
+                pr = payload.get("pull_request") or {}
+                if pr.get("id") is None:
+                    return
+                if payload.get("action") == "closed":
+                    self._remove(pr_key(pr))
+                else:
+                    self._upsert_pull_request(pr)
+            elif event == "check_suite":
+                suite = payload.get("check_suite") or {}
+                app = (suite.get("app") or {}).get("slug") or str(suite.get("id"))
+                self._record_check(
+                    suite.get("head_sha"),
+                    f"check_suite:{app}",
+                    suite.get("conclusion") in FAILING_CHECK_CONCLUSIONS
+                )
+            elif event == "status":
+                self._record_check(
+                    payload.get("sha"),
+                    f"status:{payload.get('context', 'default')}",
+                    payload.get("state") in FAILING_STATUS_STATES
+                )
+            else:
+                return
+            self.events_applied += 1
+    
+    def _ci_failed(self, record: Dict) -> bool:
+        """Check whether a PR's CI is failing, preferring webhook data over sweeps."""
+        checks = self._sha_checks.get(record.get("head_sha"))
+        if checks:
+            return any(checks.values())
+        return record.get("ci_failed", False)
+    
+    def _items(self, ids: Iterable[str]) -> List[Dict]:
+        """Get PR items for ids, newest first."""
+        items = [self._prs[pr_id]["item"] for pr_id in ids if pr_id in self._prs]
+        items.sort(key=lambda item: item.get("created_at") or "", reverse=True)
+        return items[:self.result_limit]
+    
+    def get_user_work(self, username: str) -> Dict[str, List[Dict]]:
+        """
+        Get a user's PRs in the same shape as GitHubClient.get_all_user_work.
+        
+        Args:
+            username: GitHub username
+            
+        Returns:
+            Dictionary with categorized PRs
+        """
+        login = username.lower()
+        with self._lock:
+            created_ids = self._by_author.get(login, set())
+            failed_ids = [pr_id for pr_id in created_ids if self._ci_failed(self._prs[pr_id])]
+            return {
+                "created": self._items(created_ids),
+                "review_requested": self._items(self._by_reviewer.get(login, set())),
+                "assigned": self._items(self._by_assignee.get(login, set())),
+                "failed_ci": self._items(failed_ids)
+            }
+    
+    def reconcile(self, username: str, work: Dict[str, List[Dict]], categories: Iterable[str] = RECONCILED_CATEGORIES):
+        """
+        Bring a user's entries in line with a fresh REST API sweep.
+        
+        PRs missing from the sweep lose the user's roles (and are dropped
+        once nobody references them), which catches missed webhook events.
+        Only the given categories are trusted; roles from the others are
+        left as they are, so a failed category doesn't wipe them.
+        
+        Args:
+            username: GitHub username the sweep was run for
+            work: Result of GitHubClient.get_all_user_work
+            categories: Categories that were fetched successfully
+        """
+        login = username.lower()
+        categories = set(categories)
+        roles = {
+            category: {pr_key(item) for item in work.get(category, [])}
+            for category in ("created", "review_requested", "assigned")
+        }
+        failed = {pr_key(item) for item in work.get("failed_ci", [])}
+        
+        with self._lock:
+            items = {}
+            for category in RECONCILED_CATEGORIES:
+                if category not in categories:
+                    continue
+                for item in work.get(category, []):
+                    items[pr_key(item)] = item
+            
+            known = (
+                self._by_author.get(login, set())
+                | self._by_reviewer.get(login, set())
+                | self._by_assignee.get(login, set())
+            )
+            
+            for pr_id in known | set(items):
+                previous = self._prs.get(pr_id)
+                record = {
+                    "item": items.get(pr_id) or previous["item"],
+                    "author": previous["author"] if previous else None,
+                    "reviewers": set(previous["reviewers"]) if previous else set(),
+                    "assignees": set(previous["assignees"]) if previous else set(),
+                    "head_sha": previous.get("head_sha") if previous else None,
+                    "ci_failed": previous.get("ci_failed", False) if previous else False
+                }
+                if "failed_ci" in categories:
+                    record["ci_failed"] = pr_id in failed
+                
+                if "created" in categories:
+                    if pr_id in roles["created"]:
+                        record["author"] = login
+                    elif record["author"] == login:
+                        record["author"] = None
+                for role, key in (("review_requested", "reviewers"), ("assigned", "assignees")):
+                    if role not in categories:
+                        continue
+                    if pr_id in roles[role]:
+                        record[key].add(login)
+                    else:
+                        record[key].discard(login)
+                
+                if record["author"] or record["reviewers"] or record["assignees"]:
+                    self._store(record)
+                else:
+                    self._remove(pr_id)
+            
+            # Forget CI results for commits that are no longer a PR head
+            head_shas = {record.get("head_sha") for record in self._prs.values()}
+            for sha in list(self._sha_checks):
+                if sha not in head_shas:
+                    del self._sha_checks[sha]
+            
+            self.last_reconciled = time.time()
+    
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get index counters.
+        
+        Returns:
+            Dictionary with indexed PRs, tracked commits and applied events
+        """
+        with self._lock:
+            return {
+                "pull_requests": len(self._prs),
+                "tracked_commits": len(self._sha_checks),
+                "events_applied": self.events_applied
+            }
+
+
+class IndexReconciler:
+    """Periodically re-syncs the PR index against the REST API."""
+    
+    def __init__(self, index: PullRequestIndex, github_client, interval: float = 900.0):
+        """
+        Initialize the reconciler.
+        
+        Args:
+            index: PR index to keep in sync
+            github_client: GitHubClient used for the sweep
+            interval: Seconds between sweeps
+        """
+        self.index = index
+        self.github_client = github_client
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def sweep(self):
+        """Run one reconciliation sweep."""
+        work = self.github_client.get_all_user_work(limited=False)
+        if work.get("rate_limited"):
+            print("Skipping PR index reconciliation: GitHub is rate limited")
+            return
+        
+        # A failed or timed out category comes back empty; don't read that as "no PRs"
+        report = work.get("fetch_report", {})
+        failed = {
+            category for category, entry in report.items()
+            if entry.get("error") or entry.get("timed_out")
+        }
+        categories = [category for category in RECONCILED_CATEGORIES if category not in failed]
+        if not categories:
+            print("Skipping PR index reconciliation: every category failed")
+            return
+        if failed:
+            print(f"Reconciling the PR index without {', '.join(sorted(failed))}: fetch failed")
+        self.index.reconcile(self.github_client.username, work, categories)
+    
+    def _run(self):
+        """Sweep immediately, then every interval until stopped."""
+        while not self._stop.is_set():
+            try:
+                self.sweep()
+            except Exception as e:
+                print(f"PR index reconciliation failed: {e}")
+            self._stop.wait(self.interval)
+    
+    def start(self):
+        """Start sweeping in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="pr-index-reconciler", daemon=True)
+            self._thread.start()
+    
+    def stop(self):
+        """Stop the background thread."""
+        self._stop.set()
@@ -0,0 +1,119 @@
+"""
+Search query planning for long GITHUB_REPOS filters.
+Splits repo qualifiers into chunks that fit GitHub's search query limits.
+"""
+import threading
+from typing import Dict, List, Tuple
+
+
+class SearchQueryPlanner:
+    """Splits a repo list into search-query-sized chunks and caches the plan."""
+    
+    def __init__(self, org: str, repos: List[str], max_query_length: int = 256, max_repos_per_query: int = 20):
+        """
+        Initialize the planner.
+        
+        Args:
+            org: GitHub organization that owns the repos
+            repos: Repo names to filter on
+            max_query_length: Longest search query GitHub accepts
+            max_repos_per_query: Most repo qualifiers to put in one query
+        """
+        self.org = org
+        self.repos = list(repos)
+        self.max_query_length = max_query_length
+        self.max_repos_per_query = max(1, max_repos_per_query)
+        self._plans: Dict[int, Tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+    
+    def _repo_terms(self) -> List[str]:
+        """Build the repo qualifiers, dropping duplicates but keeping order."""
+        terms = []
+        seen = set()
+        for repo in self.repos:
+            term = f"repo:{self.org}/{repo}"
+            if term not in seen:
+                seen.add(term)
+                terms.append(term)
+        return terms
+    
+    def plan(self, prefix_length: int) -> Tuple[str, ...]:
+        """
+        Get the repo filter for each chunk of a query.
+        
+        Plans only depend on how much room the rest of the query needs, so
+        they are computed once per prefix length and reused.
+        
+        Args:
+            prefix_length: Length of the query before the repo filter
+            
+        Returns:
+            Tuple of space-separated repo filters, one per chunk
+        """
+        with self._lock:
+            cached = self._plans.get(prefix_length)
+            if cached is not None:
+                return cached
+        
+        # Room left after the prefix and the separating space
+        budget = self.max_query_length - prefix_length - 1
+        chunks = []
+        current: List[str] = []
+        current_length = 0
+        
+        for term in self._repo_terms():
+            extra = len(term) + (1 if current else 0)
+            if current and (current_length + extra > budget or len(current) >= self.max_repos_per_query):
+                chunks.append(" ".join(current))
+                current = []
+                current_length = 0
+                extra = len(term)
+            if extra > budget:
+                print(f"GitHub search filter {term} does not fit in a {self.max_query_length}-character query")
+            current.append(term)
+            current_length += extra
+        
+        if current:
+            chunks.append(" ".join(current))
+        
+        plan = tuple(chunks)
+        with self._lock:
+            self._plans[prefix_length] = plan
+        return plan
+    
+    def build_queries(self, prefix: str) -> List[str]:
+        """
+        Build one search query per repo chunk.
+        
+        Args:
+            prefix: Query without repo filters (e.g. "is:pr is:open author:octocat")
+            
+        Returns:
+            List of complete search queries
+        """
+        return [f"{prefix} {chunk}" for chunk in self.plan(len(prefix))]
+
+
+def merge_search_results(result_lists: List[List[Dict]], limit: int) -> List[Dict]:
+    """
+    Merge search results from several chunks.
+    
+    Items are de-duplicated by id and re-sorted newest first, matching the
+    "sort=created, order=desc" of the individual searches.
+    
+    Args:
+        result_lists: Items returned by each chunk
+        limit: Maximum number of items to return
+        
+    Returns:
+        Merged list of items
+    """
+    merged = {}
+    for items in result_lists:
+        for item in items:
+            key = item.get("id") or item.get("html_url")
+            if key not in merged:
+                merged[key] = item
+    
+    ordered = sorted(merged.values(), key=lambda item: item.get("created_at") or "", reverse=True)
+    return ordered[:limit]
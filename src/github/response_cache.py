@@ -0,0 +1,138 @@
+"""
+Conditional request cache for GitHub API responses.
+Stores ETag / Last-Modified validators so unchanged responses cost a 304.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class ConditionalResponseCache:
+    """Memory-bounded LRU cache of GitHub responses keyed by URL and params."""
+    
+    def __init__(self, max_entries: int = 256, max_bytes: int = 5 * 1024 * 1024):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached response bodies in bytes
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._metrics = {
+            "hits": 0,
+            "misses": 0,
+            "not_modified": 0,
+            "evictions": 0
+        }
+    
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict] = None) -> Tuple:
+        """
+        Build a cache key from a URL and its query parameters.
+        
+        Args:
+            url: API endpoint URL
+            params: Optional query parameters
+            
+        Returns:
+            Hashable cache key
+        """
+        items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return (url, items)
+    
+    def get(self, key: Tuple) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response and count the hit or miss.
+        
+        Args:
+            key: Cache key from make_key
+            
+        Returns:
+            Cached entry with "body", "etag" and "last_modified", or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._metrics["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._metrics["hits"] += 1
+            return entry
+    
+    @staticmethod
+    def conditional_headers(entry: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Build the validator headers for a conditional request.
+        
+        Args:
+            entry: Cached entry
+            
+        Returns:
+            If-None-Match / If-Modified-Since headers
+        """
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+    
+    def record_not_modified(self):
+        """Count a 304 response served from the cache."""
+        with self._lock:
+            self._metrics["not_modified"] += 1
+    
+    def store(self, key: Tuple, body: Any, etag: Optional[str], last_modified: Optional[str], size: int):
+        """
+        Cache a response body with its validators.
+        
+        Responses without an ETag or Last-Modified header are not cached,
+        since they can never be revalidated.
+        
+        Args:
+            key: Cache key from make_key
+            body: Parsed JSON body
+            etag: ETag response header
+            last_modified: Last-Modified response header
+            size: Size of the raw response body in bytes
+        """
+        if self.max_entries <= 0 or size > self.max_bytes:
+            return
+        if not etag and not last_modified:
+            return
+        
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous["size"]
+            
+            self._entries[key] = {
+                "body": body,
+                "etag": etag,
+                "last_modified": last_modified,
+                "size": size
+            }
+            self._size += size
+            
+            while self._entries and (len(self._entries) > self.max_entries or self._size > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted["size"]
+                self._metrics["evictions"] += 1
+    
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Get cache metrics.
+        
+        Returns:
+            Dictionary with hits, misses, not_modified, evictions, entries and bytes
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics["entries"] = len(self._entries)
+            metrics["bytes"] = self._size
+            return metrics
@@ -0,0 +1,161 @@
+"""
+GitHub webhook receiver that keeps the local PR index up to date.
+"""
+import hashlib
+import hmac
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from github.pr_index import PullRequestIndex
+
+
+WEBHOOK_PATH = "/github/webhooks"
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """
+    Verify a GitHub X-Hub-Signature-256 header.
+    
+    Args:
+        secret: Webhook secret configured on GitHub
+        body: Raw request body
+        signature: Value of the X-Hub-Signature-256 header
+        
+    Returns:
+        True if the signature matches
+    """
+    if not signature or not signature.startswith("sha256="):
+        return False
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature[len("sha256="):])
+
+
+class GitHubWebhookReceiver:
+    """Small HTTP server that feeds GitHub webhook deliveries into a PR index."""
+    
+    def __init__(
+        self,
+        index: PullRequestIndex,
+        port: int = 3001,
+        secret: Optional[str] = None,
+        host: str = "0.0.0.0",
+        allow_unsigned: bool = False
+    ):
+        """
+        Initialize the receiver.
+        
+        Args:
+            index: PR index to update
+            port: Port to listen on (next to the Bolt HTTP app)
+            secret: Webhook secret; deliveries with a bad signature are rejected
+            host: Interface to bind to
+            allow_unsigned: Accept deliveries without checking signatures when
+                there is no secret (local testing only); otherwise they are rejected
+        """
+        self.index = index
+        self.port = port
+        self.secret = secret
+        self.host = host
+        self.allow_unsigned = allow_unsigned
+        self._server: Optional[ThreadingHTTPServer] = None
+    
+    def handle_delivery(self, event: str, body: bytes, signature: Optional[str] = None) -> int:
+        """
+        Process one webhook delivery.
+        
+        Args:
+            event: Value of the X-GitHub-Event header
+            body: Raw request body
+            signature: Value of the X-Hub-Signature-256 header
+            
+        Returns:
+            HTTP status code for the response
+        """
+        if self.secret:
+            if not verify_signature(self.secret, body, signature):
+                return 401
+        elif not self.allow_unsigned:
+            return 401
+        
+        try:
+            payload = json.loads(body or b"{}")
+        except json.JSONDecodeError:
+            return 400
+        
+        if event == "ping":
+            return 200
+        
+        self.index.apply_event(event, payload)
+        return 202
+    
+    def _make_handler(self):
+        """Build the request handler class bound to this receiver."""
+        receiver = self
+        
+        class WebhookHandler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if self.path.split("?")[0] != WEBHOOK_PATH:
+                    self.send_error(404)
+                    return
+                
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length)
+                status = receiver.handle_delivery(
+                    self.headers.get("X-GitHub-Event", ""),
+                    body,
+                    self.headers.get("X-Hub-Signature-256")
+                )
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+            
+            def log_message(self, format, *args):
+                pass
+        
+        return WebhookHandler
+    
+    def start(self):
+        """Start serving in a background thread."""
+        if self._server is not None:
+            return
+        self._server = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+        self.port = self._server.server_port
+        thread = threading.Thread(target=self._server.serve_forever, name="github-webhooks", daemon=True)
+        thread.start()
+    
+    def stop(self):
+        """Stop the server."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+def create_webhook_receiver(index: PullRequestIndex) -> Optional[GitHubWebhookReceiver]:
+    """
+    Create a webhook receiver from environment variables.
+    
+    Unsigned deliveries would let anyone who can reach the port add PRs to
+    /mywork, so the receiver needs GITHUB_WEBHOOK_SECRET unless
+    GITHUB_WEBHOOK_INSECURE=true explicitly opts out.
+    
+    Returns:
+        GitHubWebhookReceiver instance or None if GITHUB_WEBHOOK_PORT is not
+        set, or there is no secret and no insecure opt-in
+    """
+    port = os.getenv("GITHUB_WEBHOOK_PORT")
+    if not port:
+        return None
+    
+    secret = os.getenv("GITHUB_WEBHOOK_SECRET")
+    allow_unsigned = os.getenv("GITHUB_WEBHOOK_INSECURE", "false").lower() == "true"
+    if not secret:
+        if not allow_unsigned:
+            print("❌ GITHUB_WEBHOOK_SECRET not set; not starting the GitHub webhook receiver (set GITHUB_WEBHOOK_INSECURE=true to accept unsigned deliveries)")
+            return None
+        print("⚠️  Warning: GITHUB_WEBHOOK_INSECURE=true. Webhook signatures will not be verified.")
+    
+    return GitHubWebhookReceiver(index=index, port=int(port), secret=secret, allow_unsigned=allow_unsigned)
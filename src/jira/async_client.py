@@ -0,0 +1,184 @@
+"""
+asyncio Jira client for the async runtime (BOT_RUNTIME=async).
+Runs the JQL searches on one event loop instead of worker threads.
+"""
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional
+
+import aiohttp
+
+from jira.client import JiraClient
+from utils.async_http import AsyncHttpError, AsyncHttpTransport
+from utils.rate_limit import RateLimitExceeded
+from utils.single_flight import AsyncSingleFlight
+
+
+class AsyncJiraClient:
+    """
+    Async front end for a configured JiraClient.
+    
+    Paging, display limits, the status map and the rate limit scheduler are
+    shared with the wrapped client. The incremental sync keeps its issues
+    locally, so in that mode fetches are delegated to the wrapped client on
+    a worker thread.
+    """
+    
+    def __init__(self, client: JiraClient, transport: AsyncHttpTransport, single_flight: Optional[AsyncSingleFlight] = None):
+        """
+        Initialize the client.
+        
+        Args:
+            client: Configured synchronous Jira client
+            transport: Pooled aiohttp transport
+            single_flight: Coalesces identical concurrent fetches
+        """
+        self.client = client
+        self.transport = transport
+        self.single_flight = single_flight or AsyncSingleFlight()
+    
+    async def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
+        """
+        Make authenticated request to Jira API.
+        
+        Args:
+            endpoint: API endpoint path
+            params: Optional query parameters
+            
+        Returns:
+            JSON response as dictionary (empty on failure)
+        """
+        client = self.client
+        url = f"{client.base_url}/rest/api/2/{endpoint}"
+        try:
+            # The scheduler may block until a budget resets, so wait off the loop
+            await asyncio.to_thread(client.rate_limiter.acquire, client.rate_limit_key)
+            response = await self.transport.get(url, headers=client.headers, params=params)
+            client.rate_limiter.update(client.rate_limit_key, response.headers, response.status_code)
+            response.raise_for_status()
+            return response.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError, AsyncHttpError, RateLimitExceeded, ValueError) as e:
+            print(f"Jira API request failed: {e}")
+            return {}
+    
+    async def _search(self, jql: str, max_results: int = 50, fields: Optional[str] = None, start_at: int = 0) -> Dict:
+        """
+        Run a JQL search.
+        
+        Args:
+            jql: JQL query
+            max_results: Maximum number of issues to return
+            fields: Comma-separated fields to return (defaults to ISSUE_FIELDS)
+            start_at: Index of the first issue to return
+            
+        Returns:
+            Raw search response (empty on failure)
+        """
+        params = {
+            "jql": jql,
+            "startAt": start_at,
+            "maxResults": max_results,
+            "fields": fields or self.client.ISSUE_FIELDS
+        }
+        return await self._make_request("search", params)
+    
+    async def iter_issue_pages(self, jql: str, fields: Optional[str] = None, strict: bool = False) -> AsyncIterator[List[Dict]]:
+        """
+        Stream the results of a JQL search page by page.
+        
+        Same paging plan and failure handling as JiraClient.iter_issue_pages:
+        the remaining pages run concurrently, at most search_workers ahead of
+        the consumer, and are yielded in order.
+        
+        Args:
+            jql: JQL query
+            fields: Comma-separated fields to return (defaults to ISSUE_FIELDS)
+            strict: Raise IncompleteSearchError when a page fails instead of
+                logging and skipping it
+            
+        Yields:
+            Lists of raw issue dictionaries
+            
+        Raises:
+            IncompleteSearchError: A page failed and strict is set
+        """
+        client = self.client
+        first = await self._search(jql, min(client.page_size, client.max_issues), fields)
+        issues = client._page_issues(first, 0, strict)
+        if not issues:
+            return
+        yield issues
+        
+        pages = iter(client._remaining_pages(first))
+        
+        def submit(page):
+            start_at, count = page
+            return page, asyncio.ensure_future(self._search(jql, count, fields, start_at))
+        
+        pending = [submit(page) for _, page in zip(range(client.search_workers), pages)]
+        try:
+            while pending:
+                (start_at, _), task = pending.pop(0)
+                result = await task
+                next_page = next(pages, None)
+                if next_page is not None:
+                    pending.append(submit(next_page))
+                issues = client._page_issues(result, start_at, strict)
+                if issues:
+                    yield issues
+        finally:
+            for _, task in pending:
+                task.cancel()
+    
+    async def _get_bucket_heads(self, status_ids: Dict[str, List[str]]) -> Dict[str, Dict]:
+        """
+        Fetch only the displayed issues of each status bucket, concurrently.
+        
+        Args:
+            status_ids: Mapping of bucket to the status ids it covers
+            
+        Returns:
+            Mapping of bucket to its raw search response
+        """
+        client = self.client
+        buckets = [bucket for bucket, ids in status_ids.items() if ids]
+        results = await asyncio.gather(*(
+            self._search(client._bucket_jql(status_ids[bucket]), client.display_limits.get(bucket, client.page_size))
+            for bucket in buckets
+        ))
+        return dict(zip(buckets, results))
+    
+    async def get_all_user_work(self, limited: bool = True) -> Dict[str, List[Dict]]:
+        """
+        Get all Jira work for the user, categorized by status.
+        
+        Args:
+            limited: Fetch only as many issues per bucket as the Slack message
+                displays; "totals" still carries the full counts
+                
+        Returns:
+            Dictionary with categorized issues, per-bucket "totals" and a "rate_limited" flag
+        """
+        client = self.client
+        if client.issue_sync:
+            return await asyncio.to_thread(client.get_all_user_work, limited)
+        
+        return await self.single_flight.do(
+            (client.rate_limit_key, "work", limited),
+            lambda: self._get_all_user_work(limited)
+        )
+    
+    async def _get_all_user_work(self, limited: bool) -> Dict[str, List[Dict]]:
+        """Fetch all Jira work for the user without coalescing."""
+        client = self.client
+        
+        # Load (or refresh) the status metadata off the loop; bucket_for then
+        # answers from the cache
+        status_ids = await asyncio.to_thread(client.status_map.status_ids_by_bucket)
+        
+        if limited and status_ids:
+            work = client._work_from_bucket_heads(await self._get_bucket_heads(status_ids))
+            if work is not None:
+                return work
+            print("Jira bucket search failed; falling back to the full search")
+        pages = [page async for page in self.iter_issue_pages(client.USER_ISSUES_JQL, strict=True)]
+        return client._work_from_pages(pages)
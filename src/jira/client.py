@@ -3,14 +3,40 @@ Jira API Client for fetching assigned issues.
 """
 import os
 import requests
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
 import base64
 
+from jira.status_map import BUCKETS, StatusCategoryMap
+from jira.sync import IncompleteSearchError, IncrementalIssueSync
+from utils.formatter import JIRA_DISPLAY_LIMITS
+from utils.http_transport import HttpTransport, get_http_transport
+from utils.rate_limit import RateLimitExceeded, RateLimitScheduler, get_rate_limit_scheduler
+from utils.single_flight import SingleFlight, get_single_flight
+
 
 class JiraClient:
     """Client to interact with Jira REST API."""
     
-    def __init__(self, email: str, api_token: str, base_url: str):
+    ISSUE_FIELDS = "summary,status,priority,assignee,issuetype,updated,created"
+    USER_ISSUES_JQL = "assignee = currentUser() AND resolution = Unresolved ORDER BY priority DESC, updated DESC"
+    
+    def __init__(
+        self,
+        email: str,
+        api_token: str,
+        base_url: str,
+        transport: Optional[HttpTransport] = None,
+        rate_limiter: Optional[RateLimitScheduler] = None,
+        status_cache_ttl: float = 3600.0,
+        incremental_sync: bool = False,
+        full_sync_interval: float = 3600.0,
+        page_size: int = 50,
+        max_issues: int = 500,
+        search_workers: int = 4,
+        display_limits: Optional[Dict[str, int]] = None,
+        single_flight: Optional[SingleFlight] = None
+    ):
         """
         Initialize Jira client.
         
@@ -18,6 +44,17 @@ class JiraClient:
             email: Jira account email (can be username for Bearer auth)
             api_token: Jira API token (Personal Access Token)
             base_url: Jira instance base URL (e.g., https://issues.redhat.com)
+            transport: HTTP transport (defaults to the shared pooled transport)
+            rate_limiter: Rate limit scheduler (defaults to the shared scheduler)
+            status_cache_ttl: Seconds to cache the status metadata used for categorizing
+            incremental_sync: Keep a local issue cache and only fetch issues updated since the last sync
+            full_sync_interval: Seconds between full reconciles in incremental mode
+            page_size: Issues requested per search page
+            max_issues: Hard ceiling on issues fetched per search
+            search_workers: Maximum number of search pages fetched concurrently
+            display_limits: Issues fetched per status bucket for display (defaults
+                to what the Slack formatter shows)
+            single_flight: Coalesces identical concurrent fetches (defaults to the shared group)
         """
         self.email = email
         self.api_token = api_token
@@ -30,6 +67,19 @@ class JiraClient:
             "Accept": "application/json",
             "Content-Type": "application/json"
         }
+        self.transport = transport or get_http_transport()
+        self.rate_limiter = rate_limiter or get_rate_limit_scheduler()
+        self.rate_limit_key = f"jira:{self.base_url}:{email}"
+        self.status_map = StatusCategoryMap(self._make_request, ttl=status_cache_ttl)
+        self.page_size = max(1, page_size)
+        self.max_issues = max(1, max_issues)
+        self.search_workers = max(1, search_workers)
+        self._search_executor = ThreadPoolExecutor(max_workers=self.search_workers, thread_name_prefix="jira-search")
+        self.display_limits = dict(display_limits or JIRA_DISPLAY_LIMITS)
+        self.single_flight = single_flight or get_single_flight()
+        self.issue_sync = None
+        if incremental_sync:
+            self.issue_sync = IncrementalIssueSync(self, full_sync_interval=full_sync_interval)
     
     def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
         """
@@ -44,31 +94,158 @@ class JiraClient:
         """
         url = f"{self.base_url}/rest/api/2/{endpoint}"
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
+            self.rate_limiter.acquire(self.rate_limit_key)
+            response = self.transport.get(url, headers=self.headers, params=params, timeout=10)
+            self.rate_limiter.update(self.rate_limit_key, response.headers, response.status_code)
             response.raise_for_status()
             return response.json()
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, RateLimitExceeded) as e:
             print(f"Jira API request failed: {e}")
             return {}
     
-    def get_user_issues(self) -> List[Dict]:
+    def _search(self, jql: str, max_results: int = 50, fields: Optional[str] = None, start_at: int = 0) -> Dict:
         """
-        Get all unresolved issues assigned to the current user.
-        Uses JQL: assignee = currentUser() AND resolution = Unresolved
+        Run a JQL search.
         
+        Args:
+            jql: JQL query
+            max_results: Maximum number of issues to return
+            fields: Comma-separated fields to return (defaults to ISSUE_FIELDS)
+            start_at: Index of the first issue to return
+            
         Returns:
-            List of issue dictionaries
+            Raw search response (empty on failure)
         """
-        jql = "assignee = currentUser() AND resolution = Unresolved ORDER BY priority DESC, updated DESC"
-        
         params = {
             "jql": jql,
-            "maxResults": 50,
-            "fields": "summary,status,priority,assignee,issuetype,updated,created"
+            "startAt": start_at,
+            "maxResults": max_results,
+            "fields": fields or self.ISSUE_FIELDS
         }
+        return self._make_request("search", params)
+    
+    def iter_issue_pages(self, jql: str, fields: Optional[str] = None, strict: bool = False) -> Iterator[List[Dict]]:
+        """
+        Stream the results of a JQL search page by page.
+        
+        The first page gives the total; the remaining pages are fetched
+        concurrently, at most search_workers ahead of the consumer, and
+        yielded in order. Nothing past max_issues is requested.
+        
+        Args:
+            jql: JQL query
+            fields: Comma-separated fields to return (defaults to ISSUE_FIELDS)
+            strict: Raise IncompleteSearchError when a page fails, for callers
+                that must not act on partial results; otherwise the failed
+                page is logged and skipped
+            
+        Yields:
+            Lists of raw issue dictionaries
+            
+        Raises:
+            IncompleteSearchError: A page failed and strict is set
+        """
+        first = self._search(jql, min(self.page_size, self.max_issues), fields)
+        issues = self._page_issues(first, 0, strict)
+        if not issues:
+            return
+        yield issues
+        
+        pages = iter(self._remaining_pages(first))
+        
+        def submit(page):
+            start_at, count = page
+            return page, self._search_executor.submit(self._search, jql, count, fields, start_at)
+        
+        pending = [submit(page) for _, page in zip(range(self.search_workers), pages)]
+        try:
+            while pending:
+                (start_at, _), future = pending.pop(0)
+                result = future.result()
+                next_page = next(pages, None)
+                if next_page is not None:
+                    pending.append(submit(next_page))
+                issues = self._page_issues(result, start_at, strict)
+                if issues:
+                    yield issues
+        finally:
+            for _, future in pending:
+                future.cancel()
+    
+    def _remaining_pages(self, first: Dict) -> List[Tuple[int, int]]:
+        """
+        Plan the pages of a search after its first one.
+        
+        Args:
+            first: Raw response of the first page
+            
+        Returns:
+            (start_at, count) of each remaining page, up to max_issues
+        """
+        issues = first["issues"]
+        # Jira may lower maxResults below what was asked for, so page by what it returned
+        stride = first.get("maxResults") or len(issues)
+        total = min(first.get("total", len(issues)), self.max_issues)
+        return [(start_at, min(stride, total - start_at)) for start_at in range(len(issues), total, stride)]
+    
+    @staticmethod
+    def _page_issues(result: Dict, start_at: int, strict: bool) -> List[Dict]:
+        """
+        Get the issues of one search page, checking that it didn't fail.
+        
+        Args:
+            result: Raw search response
+            start_at: Offset of the page
+            strict: Raise instead of logging a failed page
+            
+        Returns:
+            The page's raw issues (empty if it failed)
+            
+        Raises:
+            IncompleteSearchError: The page failed and strict is set
+        """
+        if "issues" in result:
+            return result["issues"]
+        if strict:
+            raise IncompleteSearchError(f"Jira search page at offset {start_at} failed")
+        print(f"Jira search page at offset {start_at} failed; results are incomplete")
+        return []
+    
+    def _search_all(self, jql: str) -> List[Dict]:
+        """Collect every page of a JQL search, up to max_issues."""
+        issues = []
+        for page in self.iter_issue_pages(jql):
+            issues.extend(page)
+        return issues
+    
+    def iter_user_issue_pages(self, strict: bool = False) -> Iterator[List[Dict]]:
+        """
+        Stream the current user's unresolved issues page by page.
+        
+        Args:
+            strict: Raise IncompleteSearchError when a search page fails
+            
+        Yields:
+            Lists of raw issue dictionaries
+        """
+        if self.issue_sync:
+            yield self.issue_sync.get_issues()
+            return
+        
+        yield from self.iter_issue_pages(self.USER_ISSUES_JQL, strict=strict)
+    
+    def get_user_issues(self) -> List[Dict]:
+        """
+        Get all unresolved issues assigned to the current user.
+        Uses JQL: assignee = currentUser() AND resolution = Unresolved
         
-        result = self._make_request("search", params)
-        return result.get("issues", [])
+        Returns:
+            List of issue dictionaries
+        """
+        issues = []
+        for page in self.iter_user_issue_pages():
+            issues.extend(page)
+        return issues
     
     def get_issues_by_status(self, statuses: List[str]) -> List[Dict]:
         """
@@ -83,14 +260,7 @@ class JiraClient:
         status_filter = ", ".join([f'"{status}"' for status in statuses])
         jql = f"assignee = currentUser() AND resolution = Unresolved AND status IN ({status_filter}) ORDER BY priority DESC, updated DESC"
         
-        params = {
-            "jql": jql,
-            "maxResults": 50,
-            "fields": "summary,status,priority,assignee,issuetype,updated,created"
-        }
-        
-        result = self._make_request("search", params)
-        return result.get("issues", [])
+        return self._search_all(jql)
     
     def format_issue(self, issue: Dict) -> Dict:
         """
@@ -116,40 +286,148 @@ class JiraClient:
             "created": fields.get("created", "")
         }
     
-    def get_all_user_work(self) -> Dict[str, List[Dict]]:
+    def _get_bucket_heads(self, status_ids: Dict[str, List[str]]) -> Dict[str, Dict]:
         """
-        Get all Jira work for the user, categorized by status.
+        Fetch only the displayed issues of each status bucket, in parallel.
+        
+        Args:
+            status_ids: Mapping of bucket to the status ids it covers
+            
+        Returns:
+            Mapping of bucket to its raw search response
+        """
+        futures = {}
+        for bucket, ids in status_ids.items():
+            if not ids:
+                continue
+            futures[bucket] = self._search_executor.submit(
+                self._search, self._bucket_jql(ids), self.display_limits.get(bucket, self.page_size)
+            )
+        return {bucket: future.result() for bucket, future in futures.items()}
+    
+    @staticmethod
+    def _bucket_jql(status_ids: List[str]) -> str:
+        """Build the JQL for the current user's unresolved issues in the given statuses."""
+        return (
+            f"assignee = currentUser() AND resolution = Unresolved AND status IN ({', '.join(status_ids)}) "
+            "ORDER BY priority DESC, updated DESC"
+        )
+    
+    def get_bucket_page(self, bucket: str, start_at: int, count: int) -> Dict:
+        """
+        Fetch the next issues of one status bucket, for "Show more".
         
+        Args:
+            bucket: Status bucket (e.g. "todo")
+            start_at: Number of issues already fetched
+            count: Number of issues to fetch
+            
         Returns:
-            Dictionary with categorized issues
+            Dictionary with formatted "issues" and Jira's "total" (None on failure)
         """
-        # Get all unresolved issues
-        all_issues = self.get_user_issues()
+        return self.single_flight.do(
+            (self.rate_limit_key, "page", bucket, start_at, count),
+            lambda: self._get_bucket_page(bucket, start_at, count)
+        )
+    
+    def _get_bucket_page(self, bucket: str, start_at: int, count: int) -> Dict:
+        """Fetch the next issues of one status bucket without coalescing."""
+        status_ids = self.status_map.status_ids_by_bucket() or {}
+        if not status_ids.get(bucket):
+            return {"issues": [], "total": None}
         
-        # Categorize by status
-        categorized = {
-            "todo": [],
-            "in_progress": [],
-            "blocked": [],
-            "other": []
+        result = self._search(self._bucket_jql(status_ids[bucket]), count, start_at=start_at)
+        return {
+            "issues": [self.format_issue(issue) for issue in result.get("issues", [])],
+            "total": result.get("total")
         }
+    
+    def get_all_user_work(self, limited: bool = True) -> Dict[str, List[Dict]]:
+        """
+        Get all Jira work for the user, categorized by status.
         
-        for issue in all_issues:
-            formatted_issue = self.format_issue(issue)
-            status = formatted_issue["status"].lower()
+        Args:
+            limited: Fetch only as many issues per bucket as the Slack message
+                displays; "totals" still carries the full counts
+            
+        Returns:
+            Dictionary with categorized issues, per-bucket "totals" and a "rate_limited" flag
             
-            if "to do" in status or "todo" in status or "backlog" in status:
-                categorized["todo"].append(formatted_issue)
-            elif "in progress" in status or "in review" in status or "development" in status:
-                categorized["in_progress"].append(formatted_issue)
-            elif "blocked" in status or "waiting" in status or "hold" in status:
-                categorized["blocked"].append(formatted_issue)
-            else:
-                categorized["other"].append(formatted_issue)
+        Raises:
+            IncompleteSearchError: A search failed, so the results would be incomplete
+        """
+        # Everyone sees the same configured user's issues, so concurrent callers share one fetch
+        return self.single_flight.do(
+            (self.rate_limit_key, "work", limited),
+            lambda: self._get_all_user_work(limited)
+        )
+    
+    def _get_all_user_work(self, limited: bool) -> Dict[str, List[Dict]]:
+        """Fetch all Jira work for the user without coalescing."""
+        # The incremental sync already holds every issue locally
+        status_ids = None
+        if limited and not self.issue_sync:
+            status_ids = self.status_map.status_ids_by_bucket()
         
+        if status_ids:
+            work = self._work_from_bucket_heads(self._get_bucket_heads(status_ids))
+            if work is not None:
+                return work
+            print("Jira bucket search failed; falling back to the full search")
+        return self._work_from_pages(self.iter_user_issue_pages(strict=True))
+    
+    def _work_from_bucket_heads(self, heads: Dict[str, Dict]) -> Optional[Dict[str, List[Dict]]]:
+        """
+        Build the get_all_user_work result from each bucket's first page.
+        
+        Args:
+            heads: Mapping of bucket to its raw search response
+            
+        Returns:
+            Dictionary with categorized issues, per-bucket "totals" and a
+            "rate_limited" flag, or None if any bucket's search failed
+        """
+        if any("issues" not in result for result in heads.values()):
+            return None
+        
+        all_issues = []
+        categorized = {bucket: [] for bucket in BUCKETS}
+        totals = {}
+        for bucket, result in heads.items():
+            categorized[bucket] = [self.format_issue(issue) for issue in result.get("issues", [])]
+            all_issues.extend(categorized[bucket])
+            totals[bucket] = result.get("total", 0)
+        return self._work_result(all_issues, categorized, totals)
+    
+    def _work_from_pages(self, pages: Iterable[List[Dict]]) -> Dict[str, List[Dict]]:
+        """
+        Build the get_all_user_work result from every issue, categorized by status.
+        
+        Args:
+            pages: Pages of raw issues
+            
+        Returns:
+            Dictionary with categorized issues, per-bucket "totals" and a "rate_limited" flag
+        """
+        # Format each issue once; both views share the same records
+        all_issues = []
+        categorized = {bucket: [] for bucket in BUCKETS}
+        for page in pages:
+            for issue in page:
+                formatted_issue = self.format_issue(issue)
+                all_issues.append(formatted_issue)
+                status = issue.get("fields", {}).get("status") or {}
+                categorized[self.status_map.bucket_for(status)].append(formatted_issue)
+        totals = {bucket: len(issues) for bucket, issues in categorized.items()}
+        return self._work_result(all_issues, categorized, totals)
+    
+    def _work_result(self, all_issues: List[Dict], categorized: Dict[str, List[Dict]], totals: Dict[str, int]) -> Dict:
+        """Assemble a get_all_user_work result."""
         return {
-            "all_issues": [self.format_issue(issue) for issue in all_issues],
-            "categorized": categorized
+            "all_issues": all_issues,
+            "categorized": categorized,
+            "totals": totals,
+            "rate_limited": self.rate_limiter.is_limited(self.rate_limit_key)
         }
 
 
@@ -168,5 +446,22 @@ def create_jira_client() -> Optional[JiraClient]:
         print("Jira configuration missing: JIRA_EMAIL, JIRA_API_TOKEN, and JIRA_BASE_URL are required")
         return None
     
-    return JiraClient(email=email, api_token=api_token, base_url=base_url)
+    status_cache_ttl = float(os.getenv("JIRA_STATUS_CACHE_TTL", "3600"))
+    incremental_sync = os.getenv("JIRA_INCREMENTAL_SYNC", "false").lower() == "true"
+    full_sync_interval = float(os.getenv("JIRA_FULL_SYNC_INTERVAL", "3600"))
+    page_size = int(os.getenv("JIRA_PAGE_SIZE", "50"))
+    max_issues = int(os.getenv("JIRA_MAX_ISSUES", "500"))
+    search_workers = int(os.getenv("JIRA_SEARCH_WORKERS", "4"))
+    
+    return JiraClient(
+        email=email,
+        api_token=api_token,
+        base_url=base_url,
+        status_cache_ttl=status_cache_ttl,
+        incremental_sync=incremental_sync,
+        full_sync_interval=full_sync_interval,
+        page_size=page_size,
+        max_issues=max_issues,
+        search_workers=search_workers
+    )
 
@@ -0,0 +1,125 @@
+"""
+Jira status to /mywork bucket mapping, built from the instance's status metadata.
+"""
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+
+BUCKETS = ("todo", "in_progress", "blocked", "other")
+
+# Jira has no "blocked" status category, so those statuses are recognized by name
+BLOCKED_KEYWORDS = ("blocked", "waiting", "hold")
+
+CATEGORY_BUCKETS = {
+    "new": "todo",
+    "indeterminate": "in_progress",
+    "done": "other"
+}
+
+
+def classify_status_name(name: str) -> str:
+    """
+    Classify a status by its name alone.
+    
+    Used for statuses whose category isn't known.
+    
+    Args:
+        name: Status name
+        
+    Returns:
+        Bucket name
+    """
+    status = name.lower()
+    if "to do" in status or "todo" in status or "backlog" in status:
+        return "todo"
+    if "in progress" in status or "in review" in status or "development" in status:
+        return "in_progress"
+    if any(keyword in status for keyword in BLOCKED_KEYWORDS):
+        return "blocked"
+    return "other"
+
+
+class StatusCategoryMap:
+    """Status id to bucket lookup table loaded from Jira and cached with a TTL."""
+    
+    def __init__(self, request_json: Callable[[str], object], ttl: float = 3600.0, retry_ttl: float = 60.0):
+        """
+        Initialize the map.
+        
+        Args:
+            request_json: Function taking a Jira REST endpoint and returning its JSON
+            ttl: Seconds before the status metadata is loaded again
+            retry_ttl: Seconds before a failed load is retried
+        """
+        self.request_json = request_json
+        self.ttl = ttl
+        self.retry_ttl = min(retry_ttl, ttl)
+        self._by_id: Dict[str, str] = {}
+        self._expires_at: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _bucket_for_status(status: Dict) -> str:
+        """Pick the bucket for one status from its category, falling back to its name."""
+        name = status.get("name", "")
+        if any(keyword in name.lower() for keyword in BLOCKED_KEYWORDS):
+            return "blocked"
+        category = (status.get("statusCategory") or {}).get("key")
+        return CATEGORY_BUCKETS.get(category) or classify_status_name(name)
+    
+    def _refresh_if_stale(self):
+        """Reload the status metadata once the TTL has passed."""
+        with self._lock:
+            if self._expires_at is not None and time.monotonic() < self._expires_at:
+                return
+            
+            statuses = self.request_json("status")
+            if not isinstance(statuses, list) or not statuses:
+                # Keep the previous table if Jira couldn't be reached, and retry soon
+                self._expires_at = time.monotonic() + self.retry_ttl
+                return
+            
+            self._by_id = {
+                str(status.get("id")): self._bucket_for_status(status)
+                for status in statuses
+                if status.get("id") is not None
+            }
+            self._expires_at = time.monotonic() + self.ttl
+    
+    def bucket_for(self, status: Dict) -> str:
+        """
+        Get the bucket for an issue's status field.
+        
+        Statuses missing from the metadata are bucketed by the
+        statusCategory the issue's status field carries, and only by name
+        if that is missing too.
+        
+        Args:
+            status: The issue's "status" field (with "id", "name" and usually "statusCategory")
+            
+        Returns:
+            Bucket name
+        """
+        self._refresh_if_stale()
+        
+        bucket = self._by_id.get(str(status.get("id")))
+        if bucket is not None:
+            return bucket
+        return self._bucket_for_status(status)
+    
+    def status_ids_by_bucket(self) -> Optional[Dict[str, List[str]]]:
+        """
+        Get the status ids that fall into each bucket, for per-bucket JQL.
+        
+        Returns:
+            Mapping of bucket to status ids, or None if the metadata couldn't be loaded
+        """
+        self._refresh_if_stale()
+        
+        if not self._by_id:
+            return None
+        status_ids = {bucket: [] for bucket in BUCKETS}
+        for status_id, bucket in self._by_id.items():
+            status_ids[bucket].append(status_id)
+        return status_ids
@@ -0,0 +1,160 @@
+"""
+Incremental Jira issue sync using an "updated since last sync" watermark.
+Keeps a local copy of the user's unresolved issues and only fetches changes.
+"""
+import math
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+class IncompleteSearchError(Exception):
+    """A page of a paged JQL search failed, so the results are incomplete."""
+
+
+class IncrementalIssueSync:
+    """Local cache of the current user's unresolved issues, kept fresh by delta queries."""
+    
+    BASE_JQL = "assignee = currentUser() AND resolution = Unresolved"
+    # Also match issues reassigned away since the last sync so they can be dropped
+    DELTA_JQL = "(assignee = currentUser() OR assignee WAS currentUser()) AND updated >= \"-{minutes}m\""
+    
+    def __init__(self, jira_client, full_sync_interval: float = 3600.0, max_results: int = 50):
+        """
+        Initialize the sync.
+        
+        Args:
+            jira_client: JiraClient used for searches
+            full_sync_interval: Seconds between full reconciles that catch deletions
+            max_results: Page size for delta searches
+        """
+        self.jira_client = jira_client
+        self.full_sync_interval = full_sync_interval
+        self.max_results = max_results
+        
+        self._issues: Dict[str, Dict] = {}
+        self._identity: Optional[Dict] = None
+        self._last_sync: Optional[float] = None
+        self._last_full_sync: Optional[float] = None
+        self._lock = threading.Lock()
+        self.stats = {"full_syncs": 0, "delta_syncs": 0, "reconciles": 0, "issues_transferred": 0}
+    
+    def _load_identity(self) -> bool:
+        """Look up the current user, retrying on each call until it succeeds."""
+        if not self._identity:
+            self._identity = self.jira_client._make_request("myself") or None
+        return self._identity is not None
+    
+    def _is_mine(self, issue: Dict) -> bool:
+        """Check whether an issue is still assigned to the current user (needs the identity loaded)."""
+        assignee = issue.get("fields", {}).get("assignee") or {}
+        for field in ("accountId", "key", "name"):
+            if assignee.get(field) and assignee.get(field) == self._identity.get(field):
+                return True
+        return False
+    
+    @staticmethod
+    def _priority_rank(issue: Dict) -> float:
+        """Rank an issue's priority; Jira's default priority ids run from Highest (1) down."""
+        priority_id = str((issue.get("fields", {}).get("priority") or {}).get("id", ""))
+        return int(priority_id) if priority_id.isdigit() else math.inf
+    
+    def _full_sync(self, started: float) -> bool:
+        """Replace the cache with a full fetch of unresolved issues."""
+        issues = {}
+        try:
+            for page in self.jira_client.iter_issue_pages(
+                f"{self.BASE_JQL} ORDER BY priority DESC, updated DESC",
+                strict=True
+            ):
+                issues.update((issue["key"], issue) for issue in page)
+        except IncompleteSearchError as e:
+            # Keep the current cache rather than replace it with part of the queue
+            print(f"Jira full sync aborted: {e}")
+            return False
+        
+        self._issues = issues
+        self._last_sync = started
+        self._last_full_sync = started
+        self.stats["full_syncs"] += 1
+        self.stats["issues_transferred"] += len(issues)
+        return True
+    
+    def _reconcile(self) -> bool:
+        """Drop cached issues that no longer match, fetching keys only."""
+        current_keys = set()
+        try:
+            for page in self.jira_client.iter_issue_pages(self.BASE_JQL, fields="key", strict=True):
+                current_keys.update(issue["key"] for issue in page)
+        except IncompleteSearchError as e:
+            # Issues on the missing page would look deleted
+            print(f"Jira reconcile aborted: {e}")
+            return False
+        
+        for key in list(self._issues):
+            if key not in current_keys:
+                del self._issues[key]
+        self.stats["reconciles"] += 1
+        return True
+    
+    def _delta_sync(self, started: float) -> bool:
+        """Merge in issues updated since the last sync."""
+        if not self._load_identity():
+            # Without it every changed issue would look reassigned; retry next time
+            return False
+        
+        minutes = math.ceil((started - self._last_sync) / 60) + 1
+        result = self.jira_client._search(
+            self.DELTA_JQL.format(minutes=minutes),
+            self.max_results,
+            fields=f"{self.jira_client.ISSUE_FIELDS},resolution"
+        )
+        if "issues" not in result:
+            return False
+        if result.get("total", 0) > len(result["issues"]):
+            # Too many changes to merge from one page; start over
+            return self._full_sync(started)
+        
+        for issue in result["issues"]:
+            resolved = issue.get("fields", {}).get("resolution") is not None
+            if resolved or not self._is_mine(issue):
+                self._issues.pop(issue["key"], None)
+            else:
+                self._issues[issue["key"]] = issue
+        
+        self._last_sync = started
+        self.stats["delta_syncs"] += 1
+        self.stats["issues_transferred"] += len(result["issues"])
+        return True
+    
+    def get_issues(self) -> List[Dict]:
+        """
+        Get the user's unresolved issues, syncing only what changed.
+        
+        Returns:
+            List of raw issue dictionaries, highest priority first
+        """
+        with self._lock:
+            started = time.time()
+            
+            if self._last_sync is None:
+                self._full_sync(started)
+            else:
+                if started - self._last_full_sync >= self.full_sync_interval:
+                    if self._reconcile():
+                        self._last_full_sync = started
+                    elif self._full_sync(started):
+                        return self._sorted()
+                self._delta_sync(started)
+            
+            return self._sorted()
+    
+    def _sorted(self) -> List[Dict]:
+        """Get the cached issues ordered like "ORDER BY priority DESC, updated DESC"."""
+        issues = sorted(
+            self._issues.values(),
+            key=lambda issue: issue.get("fields", {}).get("updated", ""),
+            reverse=True
+        )
+        issues.sort(key=self._priority_rank)
+        return issues[:self.jira_client.max_issues]
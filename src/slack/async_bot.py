@@ -0,0 +1,377 @@
+"""
+asyncio runtime for the Slack bot (BOT_RUNTIME=async).
+Requires the optional aiohttp dependency.
+"""
+import asyncio
+import os
+
+from aiohttp import web
+from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
+from slack_bolt.async_app import AsyncApp
+
+from github.async_client import AsyncGitHubClient
+from jira.async_client import AsyncJiraClient
+from slack.bot import MyWorkBot
+from utils.async_http import create_async_http_transport
+from utils.formatter import SHOW_MORE_ACTION, SlackMessageFormatter, parse_show_more_value
+from utils.single_flight import AsyncSingleFlight
+
+
+class AsyncMyWorkBot(MyWorkBot):
+    """
+    MyWorkBot with its handlers and GitHub/Jira fetches on one event loop.
+    
+    GitHub and Jira requests share a pooled aiohttp session and run as
+    coroutines, so slow upstreams cost no threads. The todo store, "Show
+    more" paging and the modes the async clients don't cover run on
+    worker threads.
+    """
+    
+    def __init__(self):
+        """Initialize the bot and its async API clients."""
+        super().__init__()
+        self.async_transport = create_async_http_transport()
+        self.async_flights = AsyncSingleFlight()
+        self.async_github = None
+        if self.github_client:
+            self.async_github = AsyncGitHubClient(self.github_client, self.async_transport, self.async_flights)
+        self.async_jira = None
+        if self.jira_client:
+            self.async_jira = AsyncJiraClient(self.jira_client, self.async_transport, self.async_flights)
+        
+        # Keep references to background tasks so they aren't garbage collected mid-run
+        self._tasks = set()
+    
+    def _create_app(self):
+        """Create the Bolt app the handlers are registered on."""
+        return AsyncApp(
+            token=self.bot_token,
+            signing_secret=self.signing_secret
+        )
+    
+    def _spawn(self, coro):
+        """Run a coroutine in the background."""
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+    
+    def _register_handlers(self):
+        """Register Slack command handlers."""
+        
+        @self.app.command(self.slash_command)
+        async def handle_mywork_command(ack, respond, command):
+            """Handle /mywork slash command."""
+            await ack()
+            
+            if command.get("text", "").strip() == "stats":
+                await respond(self._queue_stats_text())
+                return
+            
+            self._spawn(self._run_mywork_async(command.get("user_id"), respond))
+        
+        @self.app.action(SHOW_MORE_ACTION)
+        async def handle_show_more(ack, body, respond):
+            """Handle a "Show more" button on a /mywork message."""
+            await ack()
+            
+            view_id, source, category = parse_show_more_value(body["actions"][0]["value"])
+            user_id = body.get("user", {}).get("id")
+            state = self.view_states.get(view_id)
+            if state is None or state["user_id"] != user_id:
+                await respond(
+                    text=f"This list has expired. Run `{self.slash_command}` again to see your latest work.",
+                    replace_original=False
+                )
+                return
+            
+            try:
+                admitted = self.rate_limiter.admit_user(user_id)
+                await asyncio.to_thread(self._load_more, state, source, category, admitted)
+                response = await respond(blocks=self._render_my_work(view_id, state), replace_original=True)
+                if self._update_failed(response):
+                    await respond(text=self._update_failed_text(), replace_original=False)
+            except Exception as e:
+                await respond(
+                    blocks=SlackMessageFormatter.create_error_message(f"Sorry, something went wrong: {str(e)}"),
+                    replace_original=False
+                )
+        
+        @self.app.command("/todo")
+        async def handle_todo_command(ack, respond, command):
+            """Handle /todo slash command with subcommands."""
+            await ack()
+            
+            # The todo store does blocking file I/O, so the command runs on a thread
+            loop = asyncio.get_running_loop()
+            
+            def respond_from_thread(*args, **kwargs):
+                asyncio.run_coroutine_threadsafe(respond(*args, **kwargs), loop).result()
+            
+            await asyncio.to_thread(
+                self._run_todo_command,
+                command.get("user_id"),
+                command.get("text", "").strip(),
+                respond_from_thread
+            )
+        
+        @self.app.event("app_mention")
+        async def handle_app_mention(event, say):
+            """Handle @bot mentions."""
+            user = event.get("user")
+            await say(f"Hi <@{user}>! 👋\n\nUse `{self.slash_command}` to see your pending work from GitHub and Jira.\nUse `/todo` to manage your personal todos.")
+        
+        @self.app.event("message")
+        async def handle_message_events(body, logger):
+            """Handle message events (required for socket mode)."""
+            logger.debug(body)
+    
+    async def _run_mywork_async(self, user_id: str, respond):
+        """
+        Fetch and post a user's /mywork message through the response URL.
+        
+        Each source runs under its own MYWORK_FETCH_BUDGET timeout; one that
+        misses it is shown as timed out while the others render normally.
+        
+        Args:
+            user_id: Slack user ID
+            respond: Async Bolt respond function bound to the command's response_url
+        """
+        try:
+            if self.prewarmer:
+                # Writes the usage history on the first run of the day
+                await asyncio.to_thread(self.prewarmer.record, user_id)
+            
+            pending = ["github", "jira", "todos"]
+            results = {}
+            if self.progressive:
+                await self._render_progress(respond, results, pending, replace_original=False)
+            else:
+                await respond(blocks=SlackMessageFormatter.create_loading_message())
+            
+            admitted = self.rate_limiter.admit_user(user_id)
+            stale_since = {}
+            fetchers = {
+                "github": lambda: self._fetch_github_data_async(admitted),
+                "jira": lambda: self._fetch_jira_data_async(admitted),
+                "todos": lambda: asyncio.to_thread(self.todo_store.get_todos, user_id, True)
+            }
+            fallbacks = {
+                "github": self._empty_github_data(),
+                "jira": self._empty_jira_data(),
+                "todos": []
+            }
+            budget = self.fetch_orchestrator.budget
+            tasks = {
+                asyncio.ensure_future(
+                    asyncio.wait_for(self._cached_fetch_async(user_id, source, fetcher, stale_since), budget)
+                ): source
+                for source, fetcher in fetchers.items()
+            }
+            
+            timed_out = []
+            remaining = set(tasks)
+            while remaining:
+                done, remaining = await asyncio.wait(remaining, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    source = tasks[task]
+                    try:
+                        results[source] = task.result()
+                    except asyncio.TimeoutError:
+                        timed_out.append(source)
+                        results[source] = fallbacks[source]
+                        print(f"Fetching {source} timed out after {budget:.1f}s")
+                    except Exception as e:
+                        results[source] = fallbacks[source]
+                        print(f"Error fetching {source} data: {e}")
+                    pending.remove(source)
+                
+                if self.progressive and pending:
+                    await self._render_progress(respond, results, pending, replace_original=True)
+            
+            state = {
+                "user_id": user_id,
+                "github": results["github"],
+                "jira": results["jira"],
+                "todos": results["todos"],
+                "timed_out": timed_out,
+                "as_of": min(stale_since.values()) if stale_since else None,
+                "shown": {"github": {}, "jira": {}}
+            }
+            view_id = self.view_states.put(state)
+            response = await respond(blocks=self._render_my_work(view_id, state), replace_original=True)
+            if self._update_failed(response):
+                await respond(text=self._update_failed_text(), replace_original=False)
+            
+        except Exception as e:
+            await respond(
+                blocks=SlackMessageFormatter.create_error_message(f"Sorry, something went wrong: {str(e)}"),
+                replace_original=True
+            )
+    
+    @staticmethod
+    async def _render_progress(respond, results: dict, pending: list, replace_original: bool):
+        """Post the /mywork message with placeholders for the sources still pending."""
+        await respond(
+            blocks=SlackMessageFormatter.create_my_work_message(
+                github_data=results.get("github", {}),
+                jira_data=results.get("jira", {}),
+                todos=results.get("todos"),
+                pending_sources=pending
+            ),
+            replace_original=replace_original
+        )
+    
+    async def _cached_fetch_async(self, user_id: str, source: str, fetcher, stale_since: dict):
+        """
+        Fetch a source through the per-user result cache (see MyWorkBot._cached_fetch).
+        
+        Args:
+            user_id: Slack user ID
+            source: Source name ("github", "jira" or "todos")
+            fetcher: Zero-argument coroutine function fetching the source
+            stale_since: Fetch times of stale sources, updated in place
+            
+        Returns:
+            Source data
+        """
+        entry = self.result_cache.get(user_id, source)
+        if entry and entry["fresh"]:
+            return entry["data"]
+        
+        if entry:
+            if self.result_cache.begin_refresh(user_id, source):
+                self._spawn(self._refresh_source_async(user_id, source, fetcher))
+            stale_since[source] = entry["fetched_at"]
+            return entry["data"]
+        
+        return await self._fetch_and_cache_async(user_id, source, fetcher)
+    
+    async def _fetch_and_cache_async(self, user_id: str, source: str, fetcher):
+        """Fetch a source and cache the result unless it is a rate limited fallback or failed."""
+        generation = self.result_cache.generation(user_id, source)
+        data = await fetcher()
+        if not (isinstance(data, dict) and (data.get("rate_limited") or data.get("failed"))):
+            self.result_cache.put(user_id, source, data, generation=generation)
+        return data
+    
+    async def _refresh_source_async(self, user_id: str, source: str, fetcher):
+        """Refresh a stale cache entry in the background."""
+        try:
+            await self._fetch_and_cache_async(user_id, source, fetcher)
+        except Exception as e:
+            print(f"Background refresh of {source} failed: {e}")
+        finally:
+            self.result_cache.end_refresh(user_id, source)
+    
+    async def _fetch_github_data_async(self, admitted: bool = True) -> dict:
+        """
+        Fetch GitHub data.
+        
+        Args:
+            admitted: Whether the user may trigger upstream requests
+            
+        Returns:
+            Dictionary with GitHub PR data
+        """
+        if not self.async_github:
+            return self._empty_github_data()
+        
+        if self.pr_index and self.pr_index.is_ready():
+            return self.pr_index.get_user_work(self.github_client.username)
+        
+        data = None
+        if admitted:
+            try:
+                data = await self.async_github.get_all_user_work()
+            except Exception as e:
+                print(f"Error fetching GitHub data: {e}")
+                return self._empty_github_data()
+        
+        return self._with_last_good_data("github", data, self._empty_github_data())
+    
+    async def _fetch_jira_data_async(self, admitted: bool = True) -> dict:
+        """
+        Fetch Jira data.
+        
+        Args:
+            admitted: Whether the user may trigger upstream requests
+            
+        Returns:
+            Dictionary with Jira issue data
+        """
+        if not self.async_jira:
+            return self._empty_jira_data()
+        
+        data = None
+        if admitted:
+            try:
+                data = await self.async_jira.get_all_user_work()
+            except Exception as e:
+                print(f"Error fetching Jira data: {e}")
+                return dict(self._empty_jira_data(), failed=True)
+        
+        return self._with_last_good_data("jira", data, self._empty_jira_data())
+    
+    def _queue_stats_text(self) -> str:
+        """Format result cache, coalescing and HTTP metrics for the async runtime."""
+        cache = self.result_cache.get_metrics()
+        flights = self.async_flights.get_metrics()
+        transport = self.async_transport.get_stats()
+        return (
+            "*📈 /mywork (async runtime)*\n"
+            f"• Running: {len(self._tasks)} background tasks\n"
+            f"• Result cache: {cache['hits']} fresh, {cache['stale_hits']} stale, {cache['misses']} misses, "
+            f"{cache['entries']} entries\n"
+            f"• Upstream fetches: {flights['calls']} made, {flights['coalesced']} coalesced\n"
+            f"• HTTP: {transport['requests']} requests, {transport['retries']} retries"
+            f"{self._prewarm_stats_text()}"
+            f"{self._digest_stats_text()}"
+        )
+    
+    async def start_async(self):
+        """Run the bot on the current event loop until it is stopped."""
+        if self.webhook_receiver:
+            self.webhook_receiver.start()
+            self.index_reconciler.start()
+            print(f"🪝 GitHub webhooks listening on port {self.webhook_receiver.port}")
+        
+        if self.prewarmer:
+            # Warm-ups use the sync clients on the pre-warmer's own thread
+            self.prewarmer.start()
+            print("🔥 /mywork pre-warming enabled")
+        
+        if self.digest:
+            # Digests are built and sent with the sync clients on their own thread
+            self.digest.start()
+            print(f"📬 Daily digest enabled for {len(self.digest.user_ids)} users")
+        
+        try:
+            if self.app_token:
+                print(f"⚡️ Bot is running in Socket Mode (async runtime)")
+                print(f"   Commands: {self.slash_command}, /todo")
+                handler = AsyncSocketModeHandler(self.app, self.app_token)
+                await handler.start_async()
+            else:
+                print(f"⚡️ Bot is running in HTTP Mode (async runtime)")
+                print(f"   Commands: {self.slash_command}, /todo")
+                runner = web.AppRunner(self.app.web_app())
+                await runner.setup()
+                await web.TCPSite(runner, port=int(os.environ.get("PORT", 3000))).start()
+                await asyncio.Event().wait()
+        finally:
+            await self.async_transport.close()
+    
+    def start(self):
+        """Start the bot."""
+        asyncio.run(self.start_async())
+
+
+def create_async_bot() -> AsyncMyWorkBot:
+    """
+    Create and return an AsyncMyWorkBot instance.
+    
+    Returns:
+        AsyncMyWorkBot instance
+    """
+    return AsyncMyWorkBot()
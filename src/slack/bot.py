@@ -2,13 +2,24 @@
 Slack Bot implementation using Bolt framework.
 """
 import os
+import threading
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
 from typing import Optional
 
 from github.client import create_github_client
+from github.pr_index import IndexReconciler, PullRequestIndex
+from github.webhooks import create_webhook_receiver
 from jira.client import create_jira_client
-from utils.formatter import SlackMessageFormatter
+from slack.digest import create_digest_scheduler
+from slack.view_state import ViewStateCache
+from utils.formatter import GITHUB_DISPLAY_LIMITS, JIRA_DISPLAY_LIMITS, SHOW_MORE_ACTION, SlackMessageFormatter, parse_show_more_value
+from utils.fetch_orchestrator import create_fetch_orchestrator
+from utils.prewarmer import create_prewarmer
+from utils.rate_limit import get_rate_limit_scheduler
+from utils.result_cache import create_result_cache
+from utils.single_flight import get_single_flight
+from utils.work_queue import create_refresh_queue, create_work_queue
 from storage.todo_store import get_todo_store
 
 
@@ -27,58 +38,113 @@ class MyWorkBot:
             raise ValueError("SLACK_BOT_TOKEN and SLACK_SIGNING_SECRET are required")
         
         # Initialize Slack app
-        self.app = App(
-            token=self.bot_token,
-            signing_secret=self.signing_secret
-        )
+        self.app = self._create_app()
         
         # Initialize API clients
         self.github_client = create_github_client()
         self.jira_client = create_jira_client()
         self.todo_store = get_todo_store()
+        self._init_pr_index()
+        self.fetch_orchestrator = create_fetch_orchestrator()
+        self.work_queue = create_work_queue()
+        self.progressive = os.getenv("MYWORK_PROGRESSIVE", "true").lower() == "true"
+        self.rate_limiter = get_rate_limit_scheduler()
+        
+        # Last result per source that was not rate limited, served when
+        # upstream budgets or a user's fair share are used up
+        self._last_good_data = {}
+        self._last_good_lock = threading.Lock()
+        
+        # Recently fetched source data per user, served stale while it refreshes
+        self.result_cache = create_result_cache()
+        self.refresh_queue = create_refresh_queue()
+        
+        # Refreshes each user's cached results shortly before they usually run /mywork
+        self.prewarmer = create_prewarmer(
+            self._prewarm_user,
+            self._is_prewarmed,
+            self.rate_limiter,
+            self._quota_keys(),
+            max_age=min(self.result_cache.ttls["github"], self.result_cache.ttls["jira"])
+        )
+        
+        # Daily digest DMs at each user's local send time
+        self.digest = create_digest_scheduler(self.bot_token, self._fetch_digest_shared, self._build_digest)
+        
+        # Data behind each /mywork message, for its "Show more" buttons
+        self.view_states = ViewStateCache(ttl=float(os.getenv("MYWORK_VIEW_TTL", "900")))
         
         # Register command handlers
         self._register_handlers()
     
+    def _create_app(self):
+        """Create the Bolt app the handlers are registered on."""
+        return App(
+            token=self.bot_token,
+            signing_secret=self.signing_secret
+        )
+    
+    def _init_pr_index(self):
+        """Set up the webhook-fed PR index when GITHUB_WEBHOOK_PORT is configured."""
+        self.pr_index = None
+        self.webhook_receiver = None
+        self.index_reconciler = None
+        
+        if not self.github_client:
+            return
+        
+        index = PullRequestIndex()
+        receiver = create_webhook_receiver(index)
+        if not receiver:
+            return
+        
+        self.pr_index = index
+        self.webhook_receiver = receiver
+        self.index_reconciler = IndexReconciler(
+            index,
+            self.github_client,
+            interval=float(os.getenv("GITHUB_RECONCILE_INTERVAL", "900"))
+        )
+    
     def _register_handlers(self):
         """Register Slack command handlers."""
         
         @self.app.command(self.slash_command)
         def handle_mywork_command(ack, respond, command):
             """Handle /mywork slash command."""
-            # Acknowledge the command immediately
+            # Acknowledge the command immediately; the work runs on the /mywork pool
             ack()
             
-            try:
-                # Send loading message
-                respond(blocks=SlackMessageFormatter.create_loading_message())
-                
-                # Get user ID
-                user_id = command.get("user_id")
-                
-                # Fetch data from GitHub, Jira, and Todos
-                github_data = self._fetch_github_data()
-                jira_data = self._fetch_jira_data()
-                todos = self.todo_store.get_todos(user_id, include_completed=True)
-                
-                # Format the response
-                blocks = SlackMessageFormatter.create_my_work_message(
-                    github_data=github_data,
-                    jira_data=jira_data,
-                    todos=todos
+            if command.get("text", "").strip() == "stats":
+                self._show_queue_stats(respond)
+                return
+            
+            if not self.work_queue.submit(self._run_mywork, command.get("user_id"), respond):
+                respond(
+                    blocks=SlackMessageFormatter.create_error_message(
+                        "Lots of people are checking their work right now. Please try again in a moment."
+                    )
                 )
-                
-                # Send the formatted response
+        
+        @self.app.action(SHOW_MORE_ACTION)
+        def handle_show_more(ack, body, respond):
+            """Handle a "Show more" button on a /mywork message."""
+            ack()
+            
+            view_id, source, category = parse_show_more_value(body["actions"][0]["value"])
+            user_id = body.get("user", {}).get("id")
+            state = self.view_states.get(view_id)
+            if state is None or state["user_id"] != user_id:
                 respond(
-                    blocks=blocks,
-                    replace_original=True
+                    text=f"This list has expired. Run `{self.slash_command}` again to see your latest work.",
+                    replace_original=False
                 )
-                
-            except Exception as e:
-                error_msg = f"Sorry, something went wrong: {str(e)}"
+                return
+            
+            if not self.work_queue.submit(self._run_show_more, view_id, state, source, category, respond):
                 respond(
-                    blocks=SlackMessageFormatter.create_error_message(error_msg),
-                    replace_original=True
+                    blocks=SlackMessageFormatter.create_error_message("The bot is busy right now. Please try again in a moment."),
+                    replace_original=False
                 )
         
         @self.app.command("/todo")
@@ -86,75 +152,7 @@ class MyWorkBot:
             """Handle /todo slash command with subcommands."""
             ack()
             
-            user_id = command.get("user_id")
-            text = command.get("text", "").strip()
-            
-            try:
-                # Parse subcommand
-                if not text:
-                    # Show help
-                    self._show_todo_help(respond)
-                elif text.startswith("add "):
-                    # Add todo
-                    description = text[4:].strip()
-                    if not description:
-                        respond("❌ Please provide a description.\nUsage: `/todo add <description>`")
-                        return
-                    
-                    todo = self.todo_store.add_todo(user_id, description)
-                    respond(f"✅ Added todo #{todo['id']}: {description}")
-                
-                elif text == "list":
-                    # List todos
-                    self._show_todo_list(user_id, respond)
-                
-                elif text.startswith("done "):
-                    # Mark todo as done
-                    try:
-                        todo_id = int(text[5:].strip())
-                        todo = self.todo_store.complete_todo(user_id, todo_id)
-                        if todo:
-                            respond(f"✅ Completed todo #{todo_id}: ~{todo['description']}~")
-                        else:
-                            respond(f"❌ Todo #{todo_id} not found.")
-                    except ValueError:
-                        respond("❌ Invalid todo ID.\nUsage: `/todo done <id>`")
-                
-                elif text.startswith("delete "):
-                    # Delete todo
-                    try:
-                        todo_id = int(text[7:].strip())
-                        if self.todo_store.delete_todo(user_id, todo_id):
-                            respond(f"🗑️ Deleted todo #{todo_id}")
-                        else:
-                            respond(f"❌ Todo #{todo_id} not found.")
-                    except ValueError:
-                        respond("❌ Invalid todo ID.\nUsage: `/todo delete <id>`")
-                
-                elif text.startswith("edit "):
-                    # Edit todo
-                    parts = text[5:].strip().split(" ", 1)
-                    if len(parts) != 2:
-                        respond("❌ Usage: `/todo edit <id> <new description>`")
-                        return
-                    
-                    try:
-                        todo_id = int(parts[0])
-                        new_description = parts[1].strip()
-                        todo = self.todo_store.update_todo(user_id, todo_id, new_description)
-                        if todo:
-                            respond(f"✏️ Updated todo #{todo_id}: {new_description}")
-                        else:
-                            respond(f"❌ Todo #{todo_id} not found.")
-                    except ValueError:
-                        respond("❌ Invalid todo ID.\nUsage: `/todo edit <id> <new description>`")
-                
-                else:
-                    # Unknown subcommand
-                    respond(f"❌ Unknown command: `{text.split()[0]}`\n\nUse `/todo` to see available commands.")
-                    
-            except Exception as e:
-                respond(f"❌ Error: {str(e)}")
+            self._run_todo_command(command.get("user_id"), command.get("text", "").strip(), respond)
         
         @self.app.event("app_mention")
         def handle_app_mention(event, say):
@@ -167,63 +165,554 @@ class MyWorkBot:
             """Handle message events (required for socket mode)."""
             logger.debug(body)
     
-    def _fetch_github_data(self) -> dict:
+    def _run_todo_command(self, user_id: str, text: str, respond):
         """
-        Fetch GitHub data.
+        Run a /todo subcommand.
         
-        Returns:
-            Dictionary with GitHub PR data
+        Args:
+            user_id: Slack user ID
+            text: Command text after /todo
+            respond: Function posting the reply
         """
-        if not self.github_client:
-            return {
-                "created": [],
-                "review_requested": [],
-                "assigned": [],
-                "failed_ci": []
+        try:
+            # Parse subcommand
+            if not text:
+                # Show help
+                self._show_todo_help(respond)
+            elif text.startswith("add "):
+                # Add todo
+                description = text[4:].strip()
+                if not description:
+                    respond("❌ Please provide a description.\nUsage: `/todo add <description>`")
+                    return
+                
+                todo = self.todo_store.add_todo(user_id, description)
+                self.result_cache.invalidate(user_id, "todos")
+                respond(f"✅ Added todo #{todo['id']}: {description}")
+            
+            elif text == "list":
+                # List todos
+                self._show_todo_list(user_id, respond)
+            
+            elif text.startswith("done "):
+                # Mark todo as done
+                try:
+                    todo_id = int(text[5:].strip())
+                    todo = self.todo_store.complete_todo(user_id, todo_id)
+                    self.result_cache.invalidate(user_id, "todos")
+                    if todo:
+                        respond(f"✅ Completed todo #{todo_id}: ~{todo['description']}~")
+                    else:
+                        respond(f"❌ Todo #{todo_id} not found.")
+                except ValueError:
+                    respond("❌ Invalid todo ID.\nUsage: `/todo done <id>`")
+            
+            elif text.startswith("delete "):
+                # Delete todo
+                try:
+                    todo_id = int(text[7:].strip())
+                    if self.todo_store.delete_todo(user_id, todo_id):
+                        self.result_cache.invalidate(user_id, "todos")
+                        respond(f"🗑️ Deleted todo #{todo_id}")
+                    else:
+                        respond(f"❌ Todo #{todo_id} not found.")
+                except ValueError:
+                    respond("❌ Invalid todo ID.\nUsage: `/todo delete <id>`")
+            
+            elif text.startswith("edit "):
+                # Edit todo
+                parts = text[5:].strip().split(" ", 1)
+                if len(parts) != 2:
+                    respond("❌ Usage: `/todo edit <id> <new description>`")
+                    return
+                
+                try:
+                    todo_id = int(parts[0])
+                    new_description = parts[1].strip()
+                    todo = self.todo_store.update_todo(user_id, todo_id, new_description)
+                    self.result_cache.invalidate(user_id, "todos")
+                    if todo:
+                        respond(f"✏️ Updated todo #{todo_id}: {new_description}")
+                    else:
+                        respond(f"❌ Todo #{todo_id} not found.")
+                except ValueError:
+                    respond("❌ Invalid todo ID.\nUsage: `/todo edit <id> <new description>`")
+            
+            else:
+                # Unknown subcommand
+                respond(f"❌ Unknown command: `{text.split()[0]}`\n\nUse `/todo` to see available commands.")
+                
+        except Exception as e:
+            respond(f"❌ Error: {str(e)}")
+    
+    @staticmethod
+    def _empty_github_data() -> dict:
+        """Return GitHub data with every category empty."""
+        return {
+            "created": [],
+            "review_requested": [],
+            "assigned": [],
+            "failed_ci": []
+        }
+    
+    @staticmethod
+    def _empty_jira_data() -> dict:
+        """Return Jira data with every category empty."""
+        return {
+            "all_issues": [],
+            "categorized": {
+                "todo": [],
+                "in_progress": [],
+                "blocked": [],
+                "other": []
+            }
+        }
+    
+    def _run_mywork(self, user_id: str, respond):
+        """
+        Fetch and post a user's /mywork message through the response URL.
+        
+        Args:
+            user_id: Slack user ID
+            respond: Bolt respond function bound to the command's response_url
+        """
+        try:
+            if self.prewarmer:
+                self.prewarmer.record(user_id)
+            
+            if self.progressive:
+                # Placeholders for every section, filled in as sources finish
+                on_result = self._progress_renderer(respond)
+            else:
+                # Send loading message
+                respond(blocks=SlackMessageFormatter.create_loading_message())
+                on_result = None
+            
+            # Users over their fair share are served cached data
+            admitted = self.rate_limiter.admit_user(user_id)
+            
+            # Fetch data from GitHub, Jira, and Todos in parallel, reusing recent results
+            stale_since = {}
+            fetchers = {
+                "github": lambda: self._fetch_github_data(admitted),
+                "jira": lambda: self._fetch_jira_data(admitted),
+                "todos": lambda: self.todo_store.get_todos(user_id, include_completed=True)
+            }
+            outcome = self.fetch_orchestrator.fetch(
+                fetchers={
+                    source: (lambda s=source, f=fetcher: self._cached_fetch(user_id, s, f, stale_since))
+                    for source, fetcher in fetchers.items()
+                },
+                fallbacks={
+                    "github": self._empty_github_data(),
+                    "jira": self._empty_jira_data(),
+                    "todos": []
+                },
+                on_result=on_result
+            )
+            results = outcome["results"]
+            
+            # Keep the data so "Show more" only has to fetch the next page
+            state = {
+                "user_id": user_id,
+                "github": results["github"],
+                "jira": results["jira"],
+                "todos": results["todos"],
+                "timed_out": outcome["timed_out"],
+                "as_of": min(stale_since.values()) if stale_since else None,
+                "shown": {"github": {}, "jira": {}}
             }
+            view_id = self.view_states.put(state)
+            
+            # Format the response
+            blocks = self._render_my_work(view_id, state)
+            
+            # Send the formatted response
+            response = respond(
+                blocks=blocks,
+                replace_original=True
+            )
+            if self._update_failed(response):
+                respond(text=self._update_failed_text(), replace_original=False)
+            
+        except Exception as e:
+            error_msg = f"Sorry, something went wrong: {str(e)}"
+            respond(
+                blocks=SlackMessageFormatter.create_error_message(error_msg),
+                replace_original=True
+            )
+    
+    def _run_show_more(self, view_id: str, state: dict, source: str, category: str, respond):
+        """
+        Load one more page of a category and update the /mywork message in place.
         
+        Args:
+            view_id: View id of the message
+            state: View state
+            source: Source name ("github" or "jira")
+            category: Category within the source
+            respond: Bolt respond function bound to the action's response_url
+        """
         try:
-            return self.github_client.get_all_user_work()
+            self._load_more(state, source, category, admitted=self.rate_limiter.admit_user(state["user_id"]))
+            response = respond(blocks=self._render_my_work(view_id, state), replace_original=True)
+            if self._update_failed(response):
+                respond(text=self._update_failed_text(), replace_original=False)
         except Exception as e:
-            print(f"Error fetching GitHub data: {e}")
-            return {
-                "created": [],
-                "review_requested": [],
-                "assigned": [],
-                "failed_ci": []
+            respond(
+                blocks=SlackMessageFormatter.create_error_message(f"Sorry, something went wrong: {str(e)}"),
+                replace_original=False
+            )
+    
+    def _cached_fetch(self, user_id: str, source: str, fetcher, stale_since: dict):
+        """
+        Fetch a source through the per-user result cache.
+        
+        Fresh data is returned as is. Stale data is returned at once while a
+        background refresh runs on the refresh queue, and its fetch time is
+        recorded in stale_since for the "as of" line.
+        
+        Args:
+            user_id: Slack user ID
+            source: Source name ("github", "jira" or "todos")
+            fetcher: Zero-argument function fetching the source
+            stale_since: Fetch times of stale sources, updated in place
+            
+        Returns:
+            Source data
+        """
+        entry = self.result_cache.get(user_id, source)
+        if entry and entry["fresh"]:
+            return entry["data"]
+        
+        if entry:
+            if self.result_cache.begin_refresh(user_id, source):
+                if not self.refresh_queue.submit(self._refresh_source, user_id, source, fetcher):
+                    self.result_cache.end_refresh(user_id, source)
+            stale_since[source] = entry["fetched_at"]
+            return entry["data"]
+        
+        return self._fetch_and_cache(user_id, source, fetcher)
+    
+    def _fetch_and_cache(self, user_id: str, source: str, fetcher):
+        """Fetch a source and cache the result unless it is a rate limited fallback or failed."""
+        generation = self.result_cache.generation(user_id, source)
+        data = fetcher()
+        if not (isinstance(data, dict) and (data.get("rate_limited") or data.get("failed"))):
+            self.result_cache.put(user_id, source, data, generation=generation)
+        return data
+    
+    def _refresh_source(self, user_id: str, source: str, fetcher):
+        """Refresh a stale cache entry in the background."""
+        try:
+            self._fetch_and_cache(user_id, source, fetcher)
+        finally:
+            self.result_cache.end_refresh(user_id, source)
+    
+    def _quota_keys(self) -> list:
+        """Rate limit keys a /mywork refresh spends from."""
+        keys = []
+        if self.github_client:
+            url = self.github_client.graphql_url if self.github_client.use_graphql else f"{self.github_client.base_url}/search/issues"
+            keys.append(self.github_client._rate_limit_key(url))
+        if self.jira_client:
+            keys.append(self.jira_client.rate_limit_key)
+        return keys
+    
+    def _prewarm_user(self, user_id: str):
+        """Refresh a user's cached GitHub and Jira results ahead of their /mywork."""
+        for source, fetcher in (("github", self._fetch_github_data), ("jira", self._fetch_jira_data)):
+            if self.result_cache.begin_refresh(user_id, source):
+                self._refresh_source(user_id, source, fetcher)
+    
+    def _is_prewarmed(self, user_id: str) -> bool:
+        """Check whether a user's GitHub and Jira results are cached and still fresh."""
+        return all(self.result_cache.contains(user_id, source, fresh=True) for source in ("github", "jira"))
+    
+    def _progress_renderer(self, respond):
+        """
+        Post a /mywork skeleton and build a callback that fills it in as sources finish.
+        
+        The skeleton shows a placeholder for every source. Each finished source
+        replaces its placeholder; the last one is left to the final render,
+        which also adds the "Show more" buttons.
+        
+        Args:
+            respond: Bolt respond function bound to the command's response_url
+            
+        Returns:
+            Callback taking (source name, result)
+        """
+        results = {}
+        pending = ["github", "jira", "todos"]
+        
+        def render(replace_original: bool):
+            respond(
+                blocks=SlackMessageFormatter.create_my_work_message(
+                    github_data=results.get("github", {}),
+                    jira_data=results.get("jira", {}),
+                    todos=results.get("todos"),
+                    pending_sources=pending
+                ),
+                replace_original=replace_original
+            )
+        
+        def on_result(name, data):
+            results[name] = data
+            if name in pending:
+                pending.remove(name)
+            if pending:
+                render(replace_original=True)
+        
+        render(replace_original=False)
+        return on_result
+    
+    def _fetch_digest_shared(self) -> dict:
+        """
+        Fetch the GitHub and Jira data every digest of a broadcast shows.
+        
+        Returns:
+            Dictionary with "github" and "jira" data and the "timed_out" sources
+        """
+        outcome = self.fetch_orchestrator.fetch(
+            fetchers={
+                "github": self._fetch_github_data,
+                "jira": self._fetch_jira_data
+            },
+            fallbacks={
+                "github": self._empty_github_data(),
+                "jira": self._empty_jira_data()
             }
+        )
+        return dict(outcome["results"], timed_out=outcome["timed_out"])
+    
+    def _build_digest(self, user_id: str, shared: dict) -> list:
+        """
+        Build a user's digest message.
+        
+        Args:
+            user_id: Slack user ID
+            shared: GitHub and Jira data from _fetch_digest_shared
+            
+        Returns:
+            List of Slack blocks
+        """
+        return SlackMessageFormatter.create_my_work_message(
+            github_data=shared["github"],
+            jira_data=shared["jira"],
+            todos=self.todo_store.get_todos(user_id, include_completed=True),
+            timed_out_sources=shared["timed_out"]
+        )
+    
+    def _show_queue_stats(self, respond):
+        """Show /mywork work queue metrics."""
+        respond(self._queue_stats_text())
+    
+    def _queue_stats_text(self) -> str:
+        """Format /mywork work queue, result cache and coalescing metrics."""
+        stats = self.work_queue.get_stats()
+        refreshes = self.refresh_queue.get_stats()
+        cache = self.result_cache.get_metrics()
+        flights = get_single_flight().get_metrics()
+        return (
+            "*📈 /mywork queue*\n"
+            f"• Workers: {stats['running']}/{stats['workers']} busy\n"
+            f"• Queued: {stats['queued']} (max {stats['max_queue']})\n"
+            f"• Completed: {stats['completed']}, failed: {stats['failed']}, rejected: {stats['rejected']}\n"
+            f"• Wait for a worker: {stats['avg_wait']:.2f}s avg, {stats['max_wait']:.2f}s max\n"
+            f"• Result cache: {cache['hits']} fresh, {cache['stale_hits']} stale, {cache['misses']} misses, "
+            f"{cache['entries']} entries\n"
+            f"• Background refreshes: {refreshes['running']} running, {refreshes['queued']} queued, "
+            f"{refreshes['rejected']} skipped\n"
+            f"• Upstream fetches: {flights['calls']} made, {flights['coalesced']} coalesced"
+            f"{self._prewarm_stats_text()}"
+            f"{self._digest_stats_text()}"
+        )
     
-    def _fetch_jira_data(self) -> dict:
+    def _digest_stats_text(self) -> str:
+        """Format digest metrics as an extra stats line, if digests are on."""
+        if not self.digest:
+            return ""
+        metrics = self.digest.get_metrics()
+        return (
+            f"\n• Digests: {metrics['sent']} sent, {metrics['failed']} failed, "
+            f"{metrics['throttled']} Slack 429s ({metrics['paused']:.0f}s paused)"
+        )
+    
+    def _prewarm_stats_text(self) -> str:
+        """Format pre-warming metrics as an extra stats line, if pre-warming is on."""
+        if not self.prewarmer:
+            return ""
+        metrics = self.prewarmer.get_metrics()
+        hit_rate = metrics["warm_hits"] / metrics["first_runs"] if metrics["first_runs"] else 0.0
+        return (
+            f"\n• Pre-warming: {metrics['predictable']}/{metrics['users']} users predictable, "
+            f"{metrics['warms']} warmed, {hit_rate:.0%} warm hits on first run "
+            f"({metrics['warm_hits']}/{metrics['first_runs']}), {metrics['quota_spent']} API requests spent, "
+            f"{metrics['skipped_quota']} skipped for quota"
+        )
+    
+    def _render_my_work(self, view_id: str, state: dict) -> list:
+        """
+        Render a stored /mywork view.
+        
+        Args:
+            view_id: View id from the view state cache
+            state: View state
+            
+        Returns:
+            List of Slack blocks
+        """
+        return SlackMessageFormatter.create_my_work_message(
+            github_data=state["github"],
+            jira_data=state["jira"],
+            todos=state["todos"],
+            timed_out_sources=state["timed_out"],
+            display_limits=state["shown"],
+            view_id=view_id,
+            as_of=state.get("as_of")
+        )
+    
+    @staticmethod
+    def _update_failed(response) -> bool:
+        """
+        Check whether Slack rejected a message sent through a response_url.
+        
+        Args:
+            response: WebhookResponse returned by respond
+            
+        Returns:
+            True if the message wasn't posted (the failure is logged)
+        """
+        if response is None or response.status_code == 200:
+            return False
+        print(f"Slack rejected the /mywork message: {response.status_code} {response.body}")
+        return True
+    
+    def _update_failed_text(self) -> str:
+        """Ephemeral text sent when the /mywork message couldn't be updated."""
+        return f"Sorry, your work list couldn't be updated. Run `{self.slash_command}` again to see your latest work."
+    
+    def _load_more(self, state: dict, source: str, category: str, admitted: bool = True):
+        """
+        Show one more page of a category, fetching it only if it isn't loaded yet.
+        
+        The view's lists are replaced rather than extended, since they may be
+        shared with the last-good data.
+        
+        Args:
+            state: View state, updated in place
+            source: Source name ("github" or "jira")
+            category: Category within the source
+            admitted: Whether the user may trigger upstream requests
+        """
+        step = (GITHUB_DISPLAY_LIMITS if source == "github" else JIRA_DISPLAY_LIMITS)[category]
+        shown = state["shown"][source].get(category, step) + step
+        state["shown"][source][category] = shown
+        
+        data = dict(state[source])
+        totals = dict(data.get("totals", {}))
+        lists = dict(data["categorized"]) if source == "jira" else data
+        items = lists.get(category, [])
+        if len(items) >= min(shown, totals.get(category, len(items))) or not admitted:
+            return
+        
+        if source == "github" and self.github_client:
+            page = self.github_client.get_category_page(category, len(items), shown - len(items))
+            new_items, total = page["items"], page["total_count"]
+            seen = {item.get("id") for item in items}
+            new_items = [item for item in new_items if item.get("id") not in seen]
+        elif source == "jira" and self.jira_client:
+            page = self.jira_client.get_bucket_page(category, len(items), shown - len(items))
+            new_items, total = page["issues"], page["total"]
+            seen = {issue["key"] for issue in items}
+            new_items = [issue for issue in new_items if issue["key"] not in seen]
+        else:
+            return
+        
+        lists[category] = items + new_items
+        if total:
+            totals[category] = total
+        data["totals"] = totals
+        if source == "jira":
+            data["categorized"] = lists
+            data["all_issues"] = data.get("all_issues", []) + new_items
+        state[source] = data
+    
+    def _with_last_good_data(self, source: str, data: dict, empty_data: dict) -> dict:
+        """
+        Remember complete results and substitute them for rate limited ones.
+        
+        Args:
+            source: Source name ("github" or "jira")
+            data: Freshly fetched data, or None if the fetch was skipped
+            empty_data: Empty data for the source
+            
+        Returns:
+            Data to display, flagged with "rate_limited" when served from cache
+        """
+        with self._last_good_lock:
+            if data is not None and not data.get("rate_limited"):
+                self._last_good_data[source] = data
+                return data
+            
+            cached = self._last_good_data.get(source)
+        
+        if cached is not None:
+            return dict(cached, rate_limited=True)
+        if data is not None:
+            return data
+        return dict(empty_data, rate_limited=True)
+    
+    def _fetch_github_data(self, admitted: bool = True) -> dict:
+        """
+        Fetch GitHub data.
+        
+        Args:
+            admitted: Whether the user may trigger upstream requests
+            
+        Returns:
+            Dictionary with GitHub PR data
+        """
+        if not self.github_client:
+            return self._empty_github_data()
+        
+        # The webhook-fed index answers without any GitHub API calls
+        if self.pr_index and self.pr_index.is_ready():
+            return self.pr_index.get_user_work(self.github_client.username)
+        
+        data = None
+        if admitted:
+            try:
+                data = self.github_client.get_all_user_work()
+            except Exception as e:
+                print(f"Error fetching GitHub data: {e}")
+                return self._empty_github_data()
+        
+        return self._with_last_good_data("github", data, self._empty_github_data())
+    
+    def _fetch_jira_data(self, admitted: bool = True) -> dict:
         """
         Fetch Jira data.
         
+        Args:
+            admitted: Whether the user may trigger upstream requests
+            
         Returns:
             Dictionary with Jira issue data
         """
         if not self.jira_client:
-            return {
-                "all_issues": [],
-                "categorized": {
-                    "todo": [],
-                    "in_progress": [],
-                    "blocked": [],
-                    "other": []
-                }
-            }
+            return self._empty_jira_data()
         
-        try:
-            return self.jira_client.get_all_user_work()
-        except Exception as e:
-            print(f"Error fetching Jira data: {e}")
-            return {
-                "all_issues": [],
-                "categorized": {
-                    "todo": [],
-                    "in_progress": [],
-                    "blocked": [],
-                    "other": []
-                }
-            }
+        data = None
+        if admitted:
+            try:
+                data = self.jira_client.get_all_user_work()
+            except Exception as e:
+                print(f"Error fetching Jira data: {e}")
+                return dict(self._empty_jira_data(), failed=True)
+        
+        return self._with_last_good_data("jira", data, self._empty_jira_data())
     
     def _show_todo_help(self, respond):
         """Show TODO command help."""
@@ -283,6 +772,19 @@ Your todos will appear in `/mywork` along with GitHub and Jira!
     
     def start(self):
         """Start the bot."""
+        if self.webhook_receiver:
+            self.webhook_receiver.start()
+            self.index_reconciler.start()
+            print(f"🪝 GitHub webhooks listening on port {self.webhook_receiver.port}")
+        
+        if self.prewarmer:
+            self.prewarmer.start()
+            print("🔥 /mywork pre-warming enabled")
+        
+        if self.digest:
+            self.digest.start()
+            print(f"📬 Daily digest enabled for {len(self.digest.user_ids)} users")
+        
         if self.app_token:
             # Use Socket Mode (for local development)
             print(f"⚡️ Bot is running in Socket Mode")
@@ -0,0 +1,379 @@
+"""
+Scheduled /mywork digest DMs, sent at a set local time in each user's timezone.
+"""
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
+
+from utils.rate_limit import TokenBucket
+
+
+class SlackPacer:
+    """Paces Slack Web API calls per method and waits out 429 Retry-After responses."""
+    
+    def __init__(self, rates: Dict[str, float], default_rate: float = 1.0, max_retries: int = 5):
+        """
+        Initialize the pacer.
+        
+        Args:
+            rates: Calls per second allowed for each API method
+            default_rate: Calls per second for methods not in rates
+            max_retries: Times a rate limited call is retried before giving up
+        """
+        self.rates = rates
+        self.default_rate = default_rate
+        self.max_retries = max(0, max_retries)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._paused_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "throttled": 0, "paused": 0.0}
+    
+    def _bucket(self, method: str) -> TokenBucket:
+        """Get the token bucket for an API method, creating it on first use."""
+        with self._lock:
+            bucket = self._buckets.get(method)
+            if bucket is None:
+                rate = self.rates.get(method, self.default_rate)
+                bucket = self._buckets[method] = TokenBucket(rate, capacity=max(1.0, rate))
+            return bucket
+    
+    def _wait_for_pause(self, method: str):
+        """Sleep until a Retry-After pause on the method has passed."""
+        with self._lock:
+            wait_for = self._paused_until.get(method, 0.0) - time.monotonic()
+            if wait_for > 0:
+                self._stats["paused"] += wait_for
+        if wait_for > 0:
+            time.sleep(wait_for)
+    
+    def call(self, method: str, fn: Callable[[], Any]) -> Any:
+        """
+        Make a Slack API call at the method's pace.
+        
+        A 429 pauses every call to the method for its Retry-After, after
+        which the call is retried.
+        
+        Args:
+            method: Slack API method name (e.g. "chat.postMessage")
+            fn: Zero-argument function making the call
+            
+        Returns:
+            Result of fn
+            
+        Raises:
+            SlackApiError: If the call fails, or is still rate limited after max_retries
+        """
+        bucket = self._bucket(method)
+        attempt = 0
+        while True:
+            self._wait_for_pause(method)
+            bucket.acquire()
+            with self._lock:
+                self._stats["calls"] += 1
+            try:
+                return fn()
+            except SlackApiError as e:
+                if e.response.status_code != 429 or attempt >= self.max_retries:
+                    raise
+                headers = {key.lower(): value for key, value in (e.response.headers or {}).items()}
+                try:
+                    retry_after = float(headers.get("retry-after", 1))
+                except (TypeError, ValueError):
+                    retry_after = 1.0
+                with self._lock:
+                    self._stats["throttled"] += 1
+                    self._paused_until[method] = max(
+                        self._paused_until.get(method, 0.0),
+                        time.monotonic() + retry_after
+                    )
+                attempt += 1
+    
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get pacing metrics.
+        
+        Returns:
+            Dictionary with calls made, 429 responses and seconds paused for them
+        """
+        with self._lock:
+            return dict(self._stats)
+
+
+class DigestScheduler:
+    """
+    Sends each configured user a /mywork digest DM at a set local time.
+    
+    Due users are grouped by timezone, since each timezone's users share a
+    send time. GitHub and Jira data belong to the bot's configured accounts,
+    so they are fetched once per group; each user's part is built on a
+    bounded worker pool and sent at Slack's pace. Sent digests are recorded
+    in a state file, so a restart in the middle of a broadcast picks up
+    where it left off instead of sending duplicates.
+    """
+    
+    def __init__(
+        self,
+        client: WebClient,
+        user_ids: List[str],
+        fetch_shared: Callable[[], Any],
+        build_blocks: Callable[[str, Any], List[Dict]],
+        send_time: str = "09:00",
+        window: float = 7200.0,
+        weekdays_only: bool = True,
+        fetch_workers: int = 4,
+        send_rate: float = 1.0,
+        state_path: str = "data/digest_state.json",
+        default_tz: str = "UTC",
+        interval: float = 60.0
+    ):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            client: Slack Web API client
+            user_ids: Slack user IDs to send digests to
+            fetch_shared: Fetches the data every digest shares (GitHub and Jira)
+            build_blocks: Builds a user's digest blocks from the shared data
+            send_time: Local send time as "HH:MM"
+            window: Seconds after the send time a missed digest is still sent
+            weekdays_only: Skip Saturdays and Sundays
+            fetch_workers: Digests built in parallel
+            send_rate: chat.postMessage calls per second
+            state_path: JSON file recording the digests already sent
+            default_tz: Timezone for users whose Slack profile has none
+            interval: Seconds between checks for due digests
+        """
+        self.client = client
+        self.user_ids = user_ids
+        self.fetch_shared = fetch_shared
+        self.build_blocks = build_blocks
+        hour, minute = send_time.split(":")
+        self.send_hour = int(hour)
+        self.send_minute = int(minute)
+        self.window = window
+        self.weekdays_only = weekdays_only
+        self.state_path = state_path
+        self.default_tz = default_tz
+        self.interval = interval
+        # users.list is a Tier 2 method (about 20 calls a minute)
+        self.pacer = SlackPacer({"chat.postMessage": send_rate, "users.list": 20 / 60})
+        self._executor = ThreadPoolExecutor(max_workers=max(1, fetch_workers), thread_name_prefix="digest")
+        
+        # Local date of the last digest sent to each user
+        self._sent: Dict[str, str] = self._load_state()
+        self._timezones: Dict[str, ZoneInfo] = {}
+        self._timezones_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._metrics = {"sent": 0, "failed": 0, "broadcasts": 0}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def _load_state(self) -> Dict[str, str]:
+        """Load the sent digests, starting empty if the file is missing or unreadable."""
+        try:
+            with open(self.state_path, 'r') as f:
+                return json.load(f).get("sent", {})
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+    
+    def _save_state(self):
+        """Write the sent digests, replacing the file atomically."""
+        storage_dir = os.path.dirname(self.state_path)
+        if storage_dir and not os.path.exists(storage_dir):
+            os.makedirs(storage_dir)
+        with self._lock:
+            state = {"sent": dict(self._sent)}
+        temp_path = f"{self.state_path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(temp_path, self.state_path)
+    
+    def _zone(self, name: Optional[str]) -> ZoneInfo:
+        """Resolve a timezone name, falling back to the default timezone."""
+        try:
+            return ZoneInfo(name or self.default_tz)
+        except (ZoneInfoNotFoundError, ValueError):
+            return ZoneInfo(self.default_tz)
+    
+    def _refresh_timezones(self):
+        """Read the users' timezones from Slack's user list, at most once a day."""
+        if self._timezones_at is not None and time.monotonic() - self._timezones_at < 86400:
+            return
+        
+        wanted = set(self.user_ids)
+        timezones = {}
+        cursor = None
+        try:
+            while True:
+                response = self.pacer.call(
+                    "users.list",
+                    lambda: self.client.users_list(cursor=cursor, limit=200)
+                )
+                for member in response.get("members", []):
+                    if member.get("id") in wanted:
+                        timezones[member["id"]] = self._zone(member.get("tz"))
+                cursor = (response.get("response_metadata") or {}).get("next_cursor")
+                if not cursor or len(timezones) == len(wanted):
+                    break
+        except SlackApiError as e:
+            # Keep the timezones we have; without any, digests wait for the next check
+            print(f"Couldn't read user timezones from Slack: {e}")
+            return
+        
+        self._timezones = timezones
+        self._timezones_at = time.monotonic()
+    
+    def _due_groups(self, now: datetime) -> List[Dict[str, str]]:
+        """
+        Find the users whose digest is due, grouped by timezone.
+        
+        Args:
+            now: Current time (timezone-aware)
+            
+        Returns:
+            Groups of {user ID: local date}, earliest send time first
+        """
+        self._refresh_timezones()
+        groups: Dict[str, Dict] = {}
+        for user_id in self.user_ids:
+            tz = self._timezones.get(user_id)
+            if tz is None:
+                continue
+            local = now.astimezone(tz)
+            if self.weekdays_only and local.weekday() >= 5:
+                continue
+            send_at = local.replace(hour=self.send_hour, minute=self.send_minute, second=0, microsecond=0)
+            today = local.date().isoformat()
+            with self._lock:
+                already_sent = self._sent.get(user_id) == today
+            if already_sent or not send_at <= local < send_at + timedelta(seconds=self.window):
+                continue
+            group = groups.setdefault(str(tz), {"send_at": send_at, "users": {}})
+            group["users"][user_id] = today
+        return [group["users"] for group in sorted(groups.values(), key=lambda group: group["send_at"])]
+    
+    def _broadcast(self, users: Dict[str, str]):
+        """
+        Build and send the digests of one group.
+        
+        Args:
+            users: Mapping of user ID to the local date the digest is for
+        """
+        shared = self.fetch_shared()
+        futures = {
+            self._executor.submit(self.build_blocks, user_id, shared): user_id
+            for user_id in users
+        }
+        for future in as_completed(futures):
+            user_id = futures[future]
+            try:
+                blocks = future.result()
+                self.pacer.call(
+                    "chat.postMessage",
+                    lambda: self.client.chat_postMessage(channel=user_id, blocks=blocks, text="Your pending work")
+                )
+            except Exception as e:
+                print(f"Sending the /mywork digest to {user_id} failed: {e}")
+                with self._lock:
+                    self._metrics["failed"] += 1
+                continue
+            
+            with self._lock:
+                self._sent[user_id] = users[user_id]
+                self._metrics["sent"] += 1
+            try:
+                self._save_state()
+            except OSError as e:
+                print(f"Failed to save digest progress: {e}")
+        
+        with self._lock:
+            self._metrics["broadcasts"] += 1
+    
+    def run_once(self, now: Optional[datetime] = None):
+        """
+        Send every digest that is due.
+        
+        Args:
+            now: Current time (timezone-aware; defaults to now)
+        """
+        now = now or datetime.now(timezone.utc)
+        for users in self._due_groups(now):
+            self._broadcast(users)
+    
+    def _run(self):
+        """Check for due digests every interval until stopped."""
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"/mywork digest run failed: {e}")
+            self._stop.wait(self.interval)
+    
+    def start(self):
+        """Start sending digests from a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="mywork-digest", daemon=True)
+            self._thread.start()
+    
+    def stop(self):
+        """Stop the background thread."""
+        self._stop.set()
+    
+    def get_metrics(self) -> Dict[str, float]:
+        """
+        Get digest metrics.
+        
+        Returns:
+            Dictionary with digests sent and failed, broadcasts run, and
+            the Slack pacer's calls, 429 responses and seconds paused
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+        metrics.update(self.pacer.get_stats())
+        return metrics
+
+
+def create_digest_scheduler(
+    bot_token: str,
+    fetch_shared: Callable[[], Any],
+    build_blocks: Callable[[str, Any], List[Dict]]
+) -> Optional[DigestScheduler]:
+    """
+    Create the digest scheduler from environment variables.
+    
+    Args:
+        bot_token: Slack bot token
+        fetch_shared: Fetches the data every digest shares (GitHub and Jira)
+        build_blocks: Builds a user's digest blocks from the shared data
+        
+    Returns:
+        DigestScheduler instance, or None if DIGEST_USERS is not set
+    """
+    users_str = os.getenv("DIGEST_USERS", "")
+    user_ids = [u.strip() for u in users_str.split(",") if u.strip()]
+    if not user_ids:
+        return None
+    
+    # SLACK_API_URL points the digest at another Slack API, e.g. a local stub for testing
+    client = WebClient(token=bot_token, base_url=os.getenv("SLACK_API_URL", "https://slack.com/api/"))
+    return DigestScheduler(
+        client,
+        user_ids,
+        fetch_shared,
+        build_blocks,
+        send_time=os.getenv("DIGEST_TIME", "09:00"),
+        window=float(os.getenv("DIGEST_WINDOW", "7200")),
+        weekdays_only=os.getenv("DIGEST_WEEKDAYS_ONLY", "true").lower() == "true",
+        fetch_workers=int(os.getenv("DIGEST_FETCH_WORKERS", "4")),
+        send_rate=float(os.getenv("DIGEST_SEND_RATE", "1")),
+        state_path=os.getenv("DIGEST_STATE_PATH", "data/digest_state.json"),
+        default_tz=os.getenv("DIGEST_DEFAULT_TZ", "UTC")
+    )
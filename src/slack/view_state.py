@@ -0,0 +1,69 @@
+"""
+Short-lived server-side state for interactive /mywork messages.
+"""
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+class ViewStateCache:
+    """
+    Fetched data and paging cursors per rendered /mywork message.
+    
+    Slack sends back only the button value when a button on an ephemeral
+    message is pressed, so the data behind the message is kept here under
+    a short id that fits in that value.
+    """
+    
+    def __init__(self, ttl: float = 900.0, max_entries: int = 500):
+        """
+        Initialize the cache.
+        
+        Args:
+            ttl: Seconds a view stays available after it was last used
+            max_entries: Maximum number of views kept (least recently used go first)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._views: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def put(self, state: Dict) -> str:
+        """
+        Store the state of a new view.
+        
+        Args:
+            state: View state
+            
+        Returns:
+            View id
+        """
+        view_id = secrets.token_urlsafe(8)
+        with self._lock:
+            self._views[view_id] = {"state": state, "used_at": time.monotonic()}
+            while len(self._views) > self.max_entries:
+                self._views.popitem(last=False)
+        return view_id
+    
+    def get(self, view_id: str) -> Optional[Dict]:
+        """
+        Look up the state of a view.
+        
+        Args:
+            view_id: View id from put
+            
+        Returns:
+            View state, or None if unknown or expired
+        """
+        with self._lock:
+            entry = self._views.get(view_id)
+            if entry is None:
+                return None
+            if time.monotonic() - entry["used_at"] > self.ttl:
+                del self._views[view_id]
+                return None
+            entry["used_at"] = time.monotonic()
+            self._views.move_to_end(view_id)
+            return entry["state"]
@@ -0,0 +1,177 @@
+"""
+One-shot migration of the JSON todo store into SQLite.
+Streams todos.json one user at a time, so the file is never loaded whole,
+and replays its journal on top.
+
+Usage (from src/):
+    python -m storage.migrate [--json data/todos.json] [--db data/todos.db]
+
+Without --json, TODO_JSON_PATH (the JSON backend's file) is read.
+"""
+import argparse
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterator, List, Tuple
+
+from storage.sqlite_store import SqliteTodoStore
+from storage.todo_store import apply_journal_record, read_journal
+
+
+JSON_MIGRATED_KEY = "json_migrated_at"
+
+
+def iter_json_users(path: str, chunk_size: int = 65536) -> Iterator[Tuple[str, Dict]]:
+    """
+    Stream the top-level entries of todos.json.
+    
+    Reads the file in chunks and decodes one user's object at a time, so
+    memory use depends on the largest user rather than the whole file.
+    
+    Args:
+        path: Path to the JSON todo store
+        chunk_size: Characters read per chunk
+        
+    Yields:
+        (user ID, user data) pairs
+    """
+    decoder = json.JSONDecoder()
+    with open(path, 'r') as f:
+        buffer = ""
+        pos = 0
+        eof = False
+        
+        def read_more() -> bool:
+            nonlocal buffer, pos, eof
+            if eof:
+                return False
+            chunk = f.read(chunk_size)
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            eof = not chunk
+            return bool(chunk)
+        
+        def peek() -> str:
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos].isspace():
+                    pos += 1
+                if pos < len(buffer):
+                    return buffer[pos]
+                if not read_more():
+                    return ""
+        
+        def decode_value():
+            nonlocal pos
+            while True:
+                try:
+                    value, pos = decoder.raw_decode(buffer, pos)
+                    return value
+                except json.JSONDecodeError:
+                    # The value may just continue in the next chunk
+                    if not read_more():
+                        raise
+        
+        first = peek()
+        if first == "":
+            return
+        if first != "{":
+            raise ValueError(f"{path} is not a JSON object")
+        pos += 1
+        if peek() == "}":
+            return
+        
+        while True:
+            if peek() != '"':
+                raise ValueError(f"Malformed todo store {path}: expected a user ID")
+            user_id = decode_value()
+            if peek() != ":":
+                raise ValueError(f"Malformed todo store {path}: expected ':' after {user_id!r}")
+            pos += 1
+            peek()
+            yield user_id, decode_value()
+            
+            separator = peek()
+            pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"Malformed todo store {path}: expected ',' or '}}' after {user_id!r}")
+
+
+def iter_store_users(path: str, chunk_size: int = 65536) -> Iterator[Tuple[str, Dict]]:
+    """
+    Stream the JSON todo store's users with its journal applied.
+    
+    The journal only holds changes since the last compaction, so it is
+    read into memory and each streamed user gets their records replayed.
+    
+    Args:
+        path: Path to the JSON todo store snapshot
+        chunk_size: Characters read per chunk
+        
+    Yields:
+        (user ID, user data) pairs
+    """
+    pending: Dict[str, List[Dict]] = {}
+    for record in read_journal(f"{path}.journal"):
+        pending.setdefault(record["user"], []).append(record)
+    
+    def replay(user_id: str, user_data: Dict) -> Dict:
+        data = {user_id: user_data or {}}
+        for record in pending.pop(user_id, []):
+            apply_journal_record(data, record)
+        return data[user_id]
+    
+    for user_id, user_data in iter_json_users(path, chunk_size):
+        yield user_id, replay(user_id, user_data)
+    
+    # Users who only appear in the journal
+    for user_id in list(pending):
+        yield user_id, replay(user_id, {})
+
+
+def migrate_json_to_sqlite(json_path: str, store: SqliteTodoStore) -> int:
+    """
+    Copy the JSON todo store, including its journal, into a SQLite store,
+    unless that was already done.
+    
+    The whole import is one transaction that also records the migration,
+    so an interrupted run leaves the database unchanged and can be rerun.
+    A database that already holds todos, or has no JSON store to import,
+    is only marked as migrated: a JSON file that shows up later must not
+    overwrite newer rows or move ID counters back.
+    
+    Args:
+        json_path: Path to the JSON todo store
+        store: SQLite store to import into
+        
+    Returns:
+        Number of todos imported (0 if already migrated or nothing was imported)
+    """
+    if store.get_meta(JSON_MIGRATED_KEY):
+        return 0
+    if not os.path.exists(json_path) or store.has_users():
+        store.set_meta(JSON_MIGRATED_KEY, datetime.now().isoformat())
+        return 0
+    return store.import_users(iter_store_users(json_path), marker=JSON_MIGRATED_KEY)
+
+
+def main():
+    """Run the migration from the command line."""
+    parser = argparse.ArgumentParser(description="Migrate the JSON todo store to SQLite.")
+    parser.add_argument("--json", default=os.getenv("TODO_JSON_PATH", "data/todos.json"), help="JSON todo store to read")
+    parser.add_argument("--db", default="data/todos.db", help="SQLite database to write")
+    args = parser.parse_args()
+    
+    store = SqliteTodoStore(args.db)
+    if store.get_meta(JSON_MIGRATED_KEY):
+        print(f"✅ {args.db} was already migrated on {store.get_meta(JSON_MIGRATED_KEY)}")
+        return
+    
+    count = migrate_json_to_sqlite(args.json, store)
+    print(f"✅ Migrated {count} todos from {args.json} to {args.db}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""
+Personal TODO list storage in SQLite.
+One row per todo keyed by (user_id, id), so each operation only touches that user's rows.
+"""
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from storage.todo_store import next_todo_id
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS todos (
+    user_id TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    description TEXT NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    priority TEXT NOT NULL DEFAULT 'medium',
+    created_at TEXT,
+    updated_at TEXT,
+    completed_at TEXT,
+    PRIMARY KEY (user_id, id)
+) WITHOUT ROWID;
+
+-- Per-user ID counter, so a deleted todo's ID is never handed out again
+CREATE TABLE IF NOT EXISTS counters (
+    user_id TEXT PRIMARY KEY,
+    next_id INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class SqliteTodoStore:
+    """Manages user todo lists in a SQLite database in WAL mode (same API as TodoStore)."""
+    
+    def __init__(self, db_path: str = "data/todos.db"):
+        """
+        Initialize todo storage.
+        
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = db_path
+        storage_dir = os.path.dirname(self.db_path)
+        if storage_dir and not os.path.exists(storage_dir):
+            os.makedirs(storage_dir)
+        
+        # sqlite3 connections can't be shared across threads, so each thread gets its own
+        self._local = threading.local()
+        self._connect().executescript(SCHEMA)
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5.0, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            # WAL lets readers run alongside the single writer
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
+    @contextmanager
+    def _transaction(self):
+        """Run a write transaction, taking the write lock up front."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    
+    @staticmethod
+    def _row_to_todo(row: sqlite3.Row) -> Dict:
+        """Convert a row to the todo dictionary TodoStore returns."""
+        todo = {
+            "id": row["id"],
+            "description": row["description"],
+            "completed": bool(row["completed"]),
+            "priority": row["priority"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"]
+        }
+        if row["completed_at"]:
+            todo["completed_at"] = row["completed_at"]
+        return todo
+    
+    def _select_todo(self, conn: sqlite3.Connection, user_id: str, todo_id: int) -> Optional[Dict]:
+        """Read one todo with the given connection."""
+        row = conn.execute(
+            "SELECT * FROM todos WHERE user_id = ? AND id = ?",
+            (user_id, todo_id)
+        ).fetchone()
+        return self._row_to_todo(row) if row else None
+    
+    def add_todo(self, user_id: str, description: str, priority: str = "medium") -> Dict:
+        """
+        Add a new todo for a user.
+        
+        Args:
+            user_id: Slack user ID
+            description: Todo description
+            priority: Priority level (high/medium/low)
+            
+        Returns:
+            The created todo
+        """
+        now = datetime.now().isoformat()
+        with self._transaction() as conn:
+            # Both lookups use a primary key index; MAX(id) covers users without a counter yet
+            new_id = conn.execute(
+                "SELECT MAX("
+                "COALESCE((SELECT next_id FROM counters WHERE user_id = ?), 1), "
+                "COALESCE((SELECT MAX(id) FROM todos WHERE user_id = ?), 0) + 1)",
+                (user_id, user_id)
+            ).fetchone()[0]
+            conn.execute(
+                "INSERT OR REPLACE INTO counters (user_id, next_id) VALUES (?, ?)",
+                (user_id, new_id + 1)
+            )
+            conn.execute(
+                "INSERT INTO todos (user_id, id, description, completed, priority, created_at, updated_at) "
+                "VALUES (?, ?, ?, 0, ?, ?, ?)",
+                (user_id, new_id, description, priority, now, now)
+            )
+        
+        return {
+            "id": new_id,
+            "description": description,
+            "completed": False,
+            "priority": priority,
+            "created_at": now,
+            "updated_at": now
+        }
+    
+    def get_todos(self, user_id: str, include_completed: bool = True) -> List[Dict]:
+        """
+        Get all todos for a user.
+        
+        Args:
+            user_id: Slack user ID
+            include_completed: Whether to include completed todos
+            
+        Returns:
+            List of todos
+        """
+        query = "SELECT * FROM todos WHERE user_id = ?"
+        if not include_completed:
+            query += " AND completed = 0"
+        rows = self._connect().execute(query + " ORDER BY id", (user_id,)).fetchall()
+        return [self._row_to_todo(row) for row in rows]
+    
+    def get_todo(self, user_id: str, todo_id: int) -> Optional[Dict]:
+        """
+        Get a specific todo.
+        
+        Args:
+            user_id: Slack user ID
+            todo_id: Todo ID
+            
+        Returns:
+            The todo or None if not found
+        """
+        return self._select_todo(self._connect(), user_id, todo_id)
+    
+    def update_todo(self, user_id: str, todo_id: int, description: str) -> Optional[Dict]:
+        """
+        Update a todo's description.
+        
+        Args:
+            user_id: Slack user ID
+            todo_id: Todo ID
+            description: New description
+            
+        Returns:
+            Updated todo or None if not found
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE todos SET description = ?, updated_at = ? WHERE user_id = ? AND id = ?",
+                (description, datetime.now().isoformat(), user_id, todo_id)
+            )
+            return self._select_todo(conn, user_id, todo_id)
+    
+    def complete_todo(self, user_id: str, todo_id: int) -> Optional[Dict]:
+        """
+        Mark a todo as completed.
+        
+        Args:
+            user_id: Slack user ID
+            todo_id: Todo ID
+            
+        Returns:
+            Updated todo or None if not found
+        """
+        now = datetime.now().isoformat()
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE todos SET completed = 1, completed_at = ?, updated_at = ? WHERE user_id = ? AND id = ?",
+                (now, now, user_id, todo_id)
+            )
+            return self._select_todo(conn, user_id, todo_id)
+    
+    def delete_todo(self, user_id: str, todo_id: int) -> bool:
+        """
+        Delete a todo.
+        
+        Args:
+            user_id: Slack user ID
+            todo_id: Todo ID
+            
+        Returns:
+            True if deleted, False if not found
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute("DELETE FROM todos WHERE user_id = ? AND id = ?", (user_id, todo_id))
+            return cursor.rowcount > 0
+    
+    def get_stats(self, user_id: str) -> Dict:
+        """
+        Get statistics for a user's todos.
+        
+        Args:
+            user_id: Slack user ID
+            
+        Returns:
+            Dictionary with stats
+        """
+        total, completed = self._connect().execute(
+            "SELECT COUNT(*), COALESCE(SUM(completed), 0) FROM todos WHERE user_id = ?",
+            (user_id,)
+        ).fetchone()
+        
+        return {
+            "total": total,
+            "active": total - completed,
+            "completed": completed
+        }
+    
+    def get_meta(self, key: str) -> Optional[str]:
+        """
+        Read a value from the meta table.
+        
+        Args:
+            key: Meta key
+            
+        Returns:
+            Stored value or None
+        """
+        row = self._connect().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+    
+    def set_meta(self, key: str, value: str):
+        """
+        Write a value to the meta table.
+        
+        Args:
+            key: Meta key
+            value: Value to store
+        """
+        self._connect().execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+    
+    def has_users(self) -> bool:
+        """Check whether any user has stored todos (now or in the past)."""
+        return self._connect().execute("SELECT 1 FROM counters LIMIT 1").fetchone() is not None
+    
+    def import_users(self, users: Iterable[Tuple[str, Dict]], marker: Optional[str] = None) -> int:
+        """
+        Import users' todos in the JSON store's layout, in one transaction.
+        
+        Existing todos with the same (user, id) are replaced. If marker is
+        given it is recorded in the meta table in the same transaction, so
+        an import either happens completely, marked, or not at all.
+        
+        Args:
+            users: (user ID, {"todos": [...]}) pairs, e.g. streamed from todos.json
+            marker: Meta key to set once the import is committed
+            
+        Returns:
+            Number of todos imported
+        """
+        count = 0
+        with self._transaction() as conn:
+            for user_id, user_data in users:
+                rows = [
+                    (
+                        user_id,
+                        todo["id"],
+                        todo.get("description", ""),
+                        1 if todo.get("completed") else 0,
+                        todo.get("priority", "medium"),
+                        todo.get("created_at"),
+                        todo.get("updated_at"),
+                        todo.get("completed_at")
+                    )
+                    for todo in (user_data or {}).get("todos", [])
+                    if "id" in todo
+                ]
+                conn.executemany(
+                    "INSERT OR REPLACE INTO todos "
+                    "(user_id, id, description, completed, priority, created_at, updated_at, completed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                count += len(rows)
+                conn.execute(
+                    "INSERT OR REPLACE INTO counters (user_id, next_id) VALUES (?, ?)",
+                    (user_id, next_todo_id(user_data or {}))
+                )
+            if marker:
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    (marker, datetime.now().isoformat())
+                )
+        return count
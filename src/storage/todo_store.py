@@ -1,62 +1,496 @@
 """
 Personal TODO list storage using JSON.
 Stores user-specific todos with CRUD operations.
+
+All todos are kept in memory. Each change is appended to a journal file
+as one small record, and a background compactor periodically folds the
+journal into a new JSON snapshot.
+
+Changes to one user are serialized by a per-user lock. The journal is
+guarded by an advisory file lock, so several processes can share the
+store; each catches up on the others' records before it writes.
+
+In the default "sync" durability mode a change is fsync'd before it
+returns. In "batched" mode changes are applied in memory and written in
+debounced batches by a background flusher, trading the last moments of
+changes on a crash for write latency; it assumes a single bot process.
+Reads are served from memory either way.
 """
+import atexit
 import json
 import os
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Callable, Dict, Iterator, List, Optional
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:
+    # Windows: no advisory file locks, so only one process may use the store
+    fcntl = None
+
+
+def read_journal(journal_path: str) -> Iterator[Dict]:
+    """
+    Read the records of a todo journal in order.
+    
+    A torn last line (from a crash mid-append) is ignored.
+    
+    Args:
+        journal_path: Path to the journal file
+        
+    Yields:
+        Journal records
+    """
+    try:
+        with open(journal_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    return
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    return
+    except FileNotFoundError:
+        return
+
+
+def next_todo_id(user_data: Dict) -> int:
+    """
+    Get the ID a user's next todo gets.
+    
+    IDs come from a per-user counter, so a deleted todo's ID is never
+    handed out again. Data written before the counter existed falls back
+    to one past the highest ID.
+    
+    Args:
+        user_data: User's entry in the snapshot layout
+        
+    Returns:
+        Next todo ID
+    """
+    highest = max([t.get("id", 0) for t in user_data.get("todos", [])], default=0)
+    return max(user_data.get("next_id", 1), highest + 1)
+
+
+def apply_journal_record(data: Dict, record: Dict):
+    """
+    Apply one journal record to todo data in the snapshot layout.
+    
+    Records replace or delete a whole todo, so replaying a record that is
+    already reflected in the snapshot leaves it unchanged. Todo lists are
+    replaced rather than changed in place, so a list handed to a reader
+    never changes under it.
+    
+    Args:
+        data: {user ID: {"todos": [...], "next_id": n, "updated_at": ...}}, updated in place
+        record: {"op": "put", "user", "todo", "at"} or {"op": "delete", "user", "id", "at"}
+    """
+    user_data = data.setdefault(record["user"], {})
+    todos = user_data.get("todos", [])
+    if record["op"] == "put":
+        todo = record["todo"]
+        user_data["next_id"] = max(next_todo_id(user_data), todo["id"] + 1)
+        if any(t.get("id") == todo["id"] for t in todos):
+            user_data["todos"] = [todo if t.get("id") == todo["id"] else t for t in todos]
+        else:
+            user_data["todos"] = todos + [todo]
+    elif record["op"] == "delete":
+        user_data["next_id"] = next_todo_id(user_data)
+        user_data["todos"] = [t for t in todos if t.get("id") != record["id"]]
+    user_data["updated_at"] = record["at"]
+
+
+@contextmanager
+def _flocked(lock_file):
+    """Hold an exclusive advisory lock on an open file."""
+    if fcntl:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
 
 class TodoStore:
     """Manages user todo lists with JSON persistence."""
     
-    def __init__(self, storage_path: str = "data/todos.json"):
+    def __init__(
+        self,
+        storage_path: str = "data/todos.json",
+        compact_records: int = 500,
+        durability: str = "sync",
+        flush_delay: float = 1.0,
+        flush_max_delay: float = 5.0,
+        flush_batch: int = 100
+    ):
         """
         Initialize todo storage.
         
         Args:
             storage_path: Path to JSON storage file
+            compact_records: Journal length that wakes the compactor early
+            durability: "sync" to fsync each change before returning, "batched" to write changes back in batches
+            flush_delay: Seconds without changes before a batch is flushed
+            flush_max_delay: Longest a change waits to be flushed while changes keep coming
+            flush_batch: Pending changes that trigger an immediate flush
         """
         self.storage_path = storage_path
-        self._ensure_storage_exists()
-    
-    def _ensure_storage_exists(self):
-        """Create storage directory and file if they don't exist."""
+        self.journal_path = f"{storage_path}.journal"
+        self.compact_records = compact_records
+        self.batched = durability == "batched"
+        self.flush_delay = flush_delay
+        self.flush_max_delay = max(flush_delay, flush_max_delay)
+        self.flush_batch = flush_batch
+        self.compactor: Optional[JournalCompactor] = None
+        self.flusher: Optional[TodoFlusher] = None
+        
+        # In-process locks. Lock order: user lock -> append lock -> sync lock
+        self._user_locks: Dict[str, threading.Lock] = {}
+        self._user_locks_lock = threading.Lock()
+        self._append_lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        
+        self._data: Dict = {}
+        # Counts maintained as changes are applied: {user: {"total": n, "completed": n}}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        # Batched mode: records applied in memory but not yet journaled, per dirty user
+        self._pending: Dict[str, List[Dict]] = {}
+        self._pending_count = 0
+        self._first_pending_at = 0.0
+        self._last_change_at = 0.0
+        self._journal = None
+        self._journal_ino = None
+        self._journal_gen = 0
+        self._journal_pos = 0
+        self._journal_records = 0
+        self._synced_pos = 0
+        
         storage_dir = os.path.dirname(self.storage_path)
         if storage_dir and not os.path.exists(storage_dir):
             os.makedirs(storage_dir)
+        # Cross-process locks: one for journal appends, one so only one process compacts
+        self._lock_file = open(f"{storage_path}.lock", 'a')
+        self._compact_lock_file = open(f"{storage_path}.compact.lock", 'a')
         
+        with self._append_lock, _flocked(self._lock_file):
+            self._ensure_storage_exists()
+            self._reload()
+    
+    def _ensure_storage_exists(self):
+        """Create the snapshot file if it doesn't exist."""
         if not os.path.exists(self.storage_path):
-            self._save_data({})
+            self._save_data(json.dumps({}))
     
     def _load_data(self) -> Dict:
-        """Load all todo data from storage."""
+        """Load the todo snapshot from storage."""
         try:
             with open(self.storage_path, 'r') as f:
                 return json.load(f)
         except (FileNotFoundError, json.JSONDecodeError):
             return {}
     
-    def _save_data(self, data: Dict):
-        """Save all todo data to storage."""
-        with open(self.storage_path, 'w') as f:
-            json.dump(data, f, indent=2)
+    def _save_data(self, snapshot: str):
+        """Write a snapshot, replacing the file atomically."""
+        temp_path = f"{self.storage_path}.tmp"
+        with open(temp_path, 'w') as f:
+            f.write(snapshot)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.storage_path)
+    
+    def _open_journal(self):
+        """(Re)open the journal for appending. Must be called with the append lock held."""
+        with self._sync_lock:
+            if self._journal:
+                self._journal.close()
+            self._journal = open(self.journal_path, 'ab')
+            self._journal_ino = os.fstat(self._journal.fileno()).st_ino
+            # Writers still waiting on the old file were made durable by whoever replaced it
+            self._journal_gen += 1
+            self._synced_pos = 0
+    
+    def _reload(self):
+        """Load the snapshot and replay the journal. Must be called with both journal locks held."""
+        self._data = self._load_data()
+        self._stats = {}
+        for user_id, user_data in self._data.items():
+            todos = user_data.get("todos", [])
+            self._stats[user_id] = {
+                "total": len(todos),
+                "completed": len([t for t in todos if t.get("completed", False)])
+            }
+        self._journal_pos = 0
+        self._journal_records = 0
+        self._open_journal()
+        self._read_journal_tail()
+        
+        # Changes not flushed yet go back on top
+        for records in self._pending.values():
+            for record in records:
+                self._apply(record)
+    
+    def _read_journal_tail(self):
+        """Apply journal records written since the last read. Must be called with both journal locks held."""
+        if os.path.getsize(self.journal_path) <= self._journal_pos:
+            return
+        with open(self.journal_path, 'rb') as f:
+            f.seek(self._journal_pos)
+            for line in f:
+                try:
+                    record = json.loads(line) if line.endswith(b"\n") else None
+                except ValueError:
+                    record = None
+                if record is None:
+                    # A writer died mid-append. Nobody else can be writing while we hold
+                    # the lock, so cut the partial line off before appending after it.
+                    os.truncate(self.journal_path, self._journal_pos)
+                    return
+                self._apply(record)
+                self._journal_pos += len(line)
+                self._journal_records += 1
+    
+    def _catch_up(self):
+        """Pick up other processes' changes. Must be called with both journal locks held."""
+        try:
+            ino = os.stat(self.journal_path).st_ino
+        except FileNotFoundError:
+            ino = None
+        if ino != self._journal_ino:
+            # Another process compacted the journal into a new snapshot
+            self._reload()
+        else:
+            self._read_journal_tail()
+    
+    def refresh(self):
+        """Pick up other processes' changes if the journal has changed since the last look."""
+        try:
+            stat = os.stat(self.journal_path)
+        except FileNotFoundError:
+            stat = None
+        if stat and stat.st_ino == self._journal_ino and stat.st_size == self._journal_pos:
+            return
+        with self._append_lock, _flocked(self._lock_file):
+            self._catch_up()
+    
+    @staticmethod
+    def _encode(record: Dict) -> bytes:
+        """Encode a journal record as one line."""
+        return (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+    
+    def _user_lock(self, user_id: str) -> threading.Lock:
+        """Get the lock serializing one user's changes."""
+        with self._user_locks_lock:
+            lock = self._user_locks.get(user_id)
+            if lock is None:
+                lock = self._user_locks[user_id] = threading.Lock()
+            return lock
+    
+    def _apply(self, record: Dict):
+        """Apply a record to the in-memory data and its counters. Must be called with the append lock held."""
+        user_id = record["user"]
+        todo_id = record["todo"]["id"] if record["op"] == "put" else record["id"]
+        old = self._find_todo(self._data.get(user_id, {}), todo_id)
+        apply_journal_record(self._data, record)
+        new = record["todo"] if record["op"] == "put" else None
+        
+        stats = self._stats.setdefault(user_id, {"total": 0, "completed": 0})
+        stats["total"] += (new is not None) - (old is not None)
+        stats["completed"] += bool(new and new.get("completed")) - bool(old and old.get("completed"))
+    
+    def _mutate(self, user_id: str, build: Callable[[Dict], Optional[Dict]]) -> Optional[Dict]:
+        """
+        Make one change to a user's todos.
+        
+        In sync mode the record is built from the user's up-to-date data
+        and appended under the journal locks, which are only held for the
+        in-memory work, and this returns once it is durable. The fsync
+        happens after the locks are released and is shared with whichever
+        other users' writes are waiting on it.
+        
+        In batched mode the record is applied in memory and queued for the
+        flusher, without any I/O.
+        
+        Args:
+            user_id: Slack user ID
+            build: Builds the journal record from the user's data, or returns None for no change
+            
+        Returns:
+            The appended record, or None if build returned None
+        """
+        if self.batched:
+            with self._user_lock(user_id), self._append_lock:
+                record = build(self._data.get(user_id, {}))
+                if record is None:
+                    return None
+                
+                self._apply(record)
+                self._pending.setdefault(user_id, []).append(record)
+                self._pending_count += 1
+                now = time.monotonic()
+                if self._pending_count == 1:
+                    self._first_pending_at = now
+                self._last_change_at = now
+                wake = self._pending_count == 1 or self._pending_count >= self.flush_batch
+            
+            if wake and self.flusher:
+                self.flusher.wake()
+            return record
+        
+        with self._user_lock(user_id):
+            with self._append_lock, _flocked(self._lock_file):
+                self._catch_up()
+                record = build(self._data.get(user_id, {}))
+                if record is None:
+                    return None
+                
+                line = self._encode(record)
+                self._journal.write(line)
+                self._journal.flush()
+                self._journal_pos += len(line)
+                self._journal_records += 1
+                self._apply(record)
+                generation, end = self._journal_gen, self._journal_pos
+            
+            self._sync(generation, end)
+        
+        if self.compactor and self._journal_records >= self.compact_records:
+            self.compactor.wake()
+        return record
+    
+    def _sync(self, generation: int, end: int):
+        """Fsync the journal up to end, unless a concurrent fsync already covered it."""
+        with self._sync_lock:
+            if generation != self._journal_gen or self._synced_pos >= end:
+                return
+            # Everything written so far is flushed, so one fsync covers every waiting writer
+            target = self._journal_pos
+            os.fsync(self._journal.fileno())
+            self._synced_pos = target
+    
+    def flush_due_in(self) -> Optional[float]:
+        """
+        Get how long until pending changes should be flushed.
+        
+        Returns:
+            Seconds until the flush (0 or less if due now), or None with nothing pending
+        """
+        with self._append_lock:
+            if not self._pending_count:
+                return None
+            if self._pending_count >= self.flush_batch:
+                return 0.0
+            due = min(self._last_change_at + self.flush_delay, self._first_pending_at + self.flush_max_delay)
+        return due - time.monotonic()
+    
+    def flush(self) -> int:
+        """
+        Write pending changes to the journal in one append and one fsync.
+        
+        On failure the changes stay pending and are retried by the next flush.
+        
+        Returns:
+            Number of records written
+        """
+        with self._flush_lock:
+            with self._append_lock, _flocked(self._lock_file):
+                if not self._pending_count:
+                    return 0
+                # Catch up first, so pending changes land after other processes' records
+                self._catch_up()
+                records = [record for user_records in self._pending.values() for record in user_records]
+                # They are written after anything just caught up on, so they win in memory too
+                for record in records:
+                    self._apply(record)
+                data = b"".join(self._encode(record) for record in records)
+                self._journal.write(data)
+                self._journal.flush()
+                self._journal_pos += len(data)
+                self._journal_records += len(records)
+                self._pending = {}
+                self._pending_count = 0
+                generation, end = self._journal_gen, self._journal_pos
+            
+            self._sync(generation, end)
+        
+        if self.compactor and self._journal_records >= self.compact_records:
+            self.compactor.wake()
+        return len(records)
+    
+    def close(self):
+        """Stop the background threads and flush pending changes."""
+        if self.flusher:
+            self.flusher.stop()
+        if self.compactor:
+            self.compactor.stop()
+        try:
+            count = self.flush()
+            if count:
+                print(f"💾 Flushed {count} pending todo changes")
+        except Exception as e:
+            print(f"Failed to flush pending todo changes: {e}")
+    
+    @staticmethod
+    def _put_record(user_id: str, todo: Dict) -> Dict:
+        """Build the journal record for a new or changed todo."""
+        return {"op": "put", "user": user_id, "todo": todo, "at": datetime.now().isoformat()}
+    
+    @staticmethod
+    def _find_todo(user_data: Dict, todo_id: int) -> Optional[Dict]:
+        """Find a todo by ID in a user's data."""
+        for todo in user_data.get("todos", []):
+            if todo.get("id") == todo_id:
+                return todo
+        return None
     
     def _get_user_todos(self, user_id: str) -> List[Dict]:
-        """Get all todos for a specific user."""
-        data = self._load_data()
-        return data.get(user_id, {}).get("todos", [])
-    
-    def _save_user_todos(self, user_id: str, todos: List[Dict]):
-        """Save todos for a specific user."""
-        data = self._load_data()
-        if user_id not in data:
-            data[user_id] = {}
-        data[user_id]["todos"] = todos
-        data[user_id]["updated_at"] = datetime.now().isoformat()
-        self._save_data(data)
+        """Get all todos for a specific user, from memory."""
+        with self._user_lock(user_id):
+            return self._data.get(user_id, {}).get("todos", [])
+    
+    def compact(self) -> bool:
+        """
+        Fold the journal into a new snapshot.
+        
+        The snapshot is written without holding the journal locks;
+        records appended meanwhile stay in the journal. A crash at any
+        point leaves a snapshot and journal that replay to the current
+        state.
+        
+        Returns:
+            True if a snapshot was written
+        """
+        with self._compact_lock, _flocked(self._compact_lock_file):
+            with self._append_lock, _flocked(self._lock_file):
+                self._catch_up()
+                if not self._journal_records:
+                    return False
+                snapshot = json.dumps(self._data, indent=2)
+                offset = self._journal_pos
+            
+            self._save_data(snapshot)
+            
+            with self._append_lock, _flocked(self._lock_file):
+                self._catch_up()
+                with open(self.journal_path, 'rb') as f:
+                    f.seek(offset)
+                    tail = f.read(self._journal_pos - offset)
+                temp_path = f"{self.journal_path}.tmp"
+                with open(temp_path, 'wb') as f:
+                    f.write(tail)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.journal_path)
+                self._open_journal()
+                self._journal_pos = len(tail)
+                self._journal_records = tail.count(b"\n")
+            return True
     
     def add_todo(self, user_id: str, description: str, priority: str = "medium") -> Dict:
         """
@@ -70,24 +504,18 @@ class TodoStore:
         Returns:
             The created todo
         """
-        todos = self._get_user_todos(user_id)
+        def build(user_data: Dict) -> Dict:
+            now = datetime.now().isoformat()
+            return self._put_record(user_id, {
+                "id": next_todo_id(user_data),
+                "description": description,
+                "completed": False,
+                "priority": priority,
+                "created_at": now,
+                "updated_at": now
+            })
         
-        # Generate new ID
-        new_id = max([t.get("id", 0) for t in todos], default=0) + 1
-        
-        new_todo = {
-            "id": new_id,
-            "description": description,
-            "completed": False,
-            "priority": priority,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
-        }
-        
-        todos.append(new_todo)
-        self._save_user_todos(user_id, todos)
-        
-        return new_todo
+        return dict(self._mutate(user_id, build)["todo"])
     
     def get_todos(self, user_id: str, include_completed: bool = True) -> List[Dict]:
         """
@@ -100,7 +528,7 @@ class TodoStore:
         Returns:
             List of todos
         """
-        todos = self._get_user_todos(user_id)
+        todos = [dict(t) for t in self._get_user_todos(user_id)]
         
         if not include_completed:
             todos = [t for t in todos if not t.get("completed", False)]
@@ -121,7 +549,7 @@ class TodoStore:
         todos = self._get_user_todos(user_id)
         for todo in todos:
             if todo.get("id") == todo_id:
-                return todo
+                return dict(todo)
         return None
     
     def update_todo(self, user_id: str, todo_id: int, description: str) -> Optional[Dict]:
@@ -136,16 +564,17 @@ class TodoStore:
         Returns:
             Updated todo or None if not found
         """
-        todos = self._get_user_todos(user_id)
-        
-        for todo in todos:
-            if todo.get("id") == todo_id:
-                todo["description"] = description
-                todo["updated_at"] = datetime.now().isoformat()
-                self._save_user_todos(user_id, todos)
-                return todo
+        def build(user_data: Dict) -> Optional[Dict]:
+            todo = self._find_todo(user_data, todo_id)
+            if not todo:
+                return None
+            return self._put_record(
+                user_id,
+                dict(todo, description=description, updated_at=datetime.now().isoformat())
+            )
         
-        return None
+        record = self._mutate(user_id, build)
+        return dict(record["todo"]) if record else None
     
     def complete_todo(self, user_id: str, todo_id: int) -> Optional[Dict]:
         """
@@ -158,17 +587,15 @@ class TodoStore:
         Returns:
             Updated todo or None if not found
         """
-        todos = self._get_user_todos(user_id)
-        
-        for todo in todos:
-            if todo.get("id") == todo_id:
-                todo["completed"] = True
-                todo["completed_at"] = datetime.now().isoformat()
-                todo["updated_at"] = datetime.now().isoformat()
-                self._save_user_todos(user_id, todos)
-                return todo
+        def build(user_data: Dict) -> Optional[Dict]:
+            todo = self._find_todo(user_data, todo_id)
+            if not todo:
+                return None
+            now = datetime.now().isoformat()
+            return self._put_record(user_id, dict(todo, completed=True, completed_at=now, updated_at=now))
         
-        return None
+        record = self._mutate(user_id, build)
+        return dict(record["todo"]) if record else None
     
     def delete_todo(self, user_id: str, todo_id: int) -> bool:
         """
@@ -181,16 +608,12 @@ class TodoStore:
         Returns:
             True if deleted, False if not found
         """
-        todos = self._get_user_todos(user_id)
-        initial_count = len(todos)
+        def build(user_data: Dict) -> Optional[Dict]:
+            if not self._find_todo(user_data, todo_id):
+                return None
+            return {"op": "delete", "user": user_id, "id": todo_id, "at": datetime.now().isoformat()}
         
-        todos = [t for t in todos if t.get("id") != todo_id]
-        
-        if len(todos) < initial_count:
-            self._save_user_todos(user_id, todos)
-            return True
-        
-        return False
+        return self._mutate(user_id, build) is not None
     
     def get_stats(self, user_id: str) -> Dict:
         """
@@ -202,10 +625,11 @@ class TodoStore:
         Returns:
             Dictionary with stats
         """
-        todos = self._get_user_todos(user_id)
+        with self._user_lock(user_id):
+            stats = dict(self._stats.get(user_id, {"total": 0, "completed": 0}))
         
-        total = len(todos)
-        completed = len([t for t in todos if t.get("completed", False)])
+        total = stats["total"]
+        completed = stats["completed"]
         active = total - completed
         
         return {
@@ -215,13 +639,147 @@ class TodoStore:
         }
 
 
+class JournalCompactor:
+    """Periodically folds a TodoStore's journal into a new snapshot."""
+    
+    def __init__(self, store: TodoStore, interval: float = 300.0):
+        """
+        Initialize the compactor.
+        
+        Args:
+            store: Todo store to compact
+            interval: Seconds between compactions
+        """
+        self.store = store
+        self.interval = interval
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def wake(self):
+        """Compact now instead of at the next interval."""
+        self._wake.set()
+    
+    def _run(self):
+        """Compact every interval, or when woken, until stopped."""
+        while not self._stop.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self.store.compact()
+            except Exception as e:
+                print(f"Todo journal compaction failed: {e}")
+    
+    def start(self):
+        """Start compacting in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="todo-compactor", daemon=True)
+            self._thread.start()
+    
+    def stop(self):
+        """Stop the background thread."""
+        self._stop.set()
+        self._wake.set()
+
+
+class TodoFlusher:
+    """Writes back a TodoStore's pending changes and picks up other processes' changes."""
+    
+    def __init__(self, store: TodoStore, interval: float = 5.0):
+        """
+        Initialize the flusher.
+        
+        Args:
+            store: Todo store to flush
+            interval: Seconds between checks for other processes' changes while idle
+        """
+        self.store = store
+        self.interval = interval
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def wake(self):
+        """Re-check pending changes now."""
+        self._wake.set()
+    
+    def _run(self):
+        """Flush when pending changes are due, otherwise refresh every interval, until stopped."""
+        while not self._stop.is_set():
+            due_in = self.store.flush_due_in()
+            if due_in is not None and due_in <= 0:
+                try:
+                    self.store.flush()
+                except Exception as e:
+                    print(f"Todo flush failed: {e}")
+                    self._stop.wait(self.interval)
+                continue
+            
+            woken = self._wake.wait(self.interval if due_in is None else due_in)
+            self._wake.clear()
+            if not woken and due_in is None:
+                try:
+                    self.store.refresh()
+                except Exception as e:
+                    print(f"Todo refresh failed: {e}")
+    
+    def start(self):
+        """Start flushing in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="todo-flusher", daemon=True)
+            self._thread.start()
+    
+    def stop(self):
+        """Stop the background thread."""
+        self._stop.set()
+        self._wake.set()
+
+
 # Global instance
 _todo_store = None
+_todo_store_lock = threading.Lock()
 
 def get_todo_store() -> TodoStore:
-    """Get the global todo store instance."""
+    """
+    Get the global todo store instance.
+    
+    TODO_STORE_BACKEND selects the JSON file store ("json", the default) or
+    SQLite ("sqlite"). The first SQLite start imports the JSON store at
+    TODO_JSON_PATH if there is one and the database is still empty.
+    """
     global _todo_store
-    if _todo_store is None:
-        _todo_store = TodoStore()
+    if _todo_store is not None:
+        return _todo_store
+    
+    with _todo_store_lock:
+        if _todo_store is None:
+            json_path = os.getenv("TODO_JSON_PATH", "data/todos.json")
+            if os.getenv("TODO_STORE_BACKEND", "json").lower() == "sqlite":
+                from storage.migrate import migrate_json_to_sqlite
+                from storage.sqlite_store import SqliteTodoStore
+                
+                store = SqliteTodoStore(os.getenv("TODO_DB_PATH", "data/todos.db"))
+                count = migrate_json_to_sqlite(json_path, store)
+                if count:
+                    print(f"📦 Migrated {count} todos from {json_path} to SQLite")
+                _todo_store = store
+            else:
+                store = TodoStore(
+                    storage_path=json_path,
+                    compact_records=int(os.getenv("TODO_COMPACT_RECORDS", "500")),
+                    durability=os.getenv("TODO_DURABILITY", "sync").lower(),
+                    flush_delay=float(os.getenv("TODO_FLUSH_DELAY", "1")),
+                    flush_max_delay=float(os.getenv("TODO_FLUSH_MAX_DELAY", "5")),
+                    flush_batch=int(os.getenv("TODO_FLUSH_BATCH", "100"))
+                )
+                store.compactor = JournalCompactor(
+                    store,
+                    interval=float(os.getenv("TODO_COMPACT_INTERVAL", "300"))
+                )
+                store.flusher = TodoFlusher(store)
+                store.compactor.start()
+                store.flusher.start()
+                # Batched changes still in memory are written on a normal exit
+                atexit.register(store.close)
+                _todo_store = store
     return _todo_store
-
@@ -0,0 +1,172 @@
+"""
+Pooled aiohttp transport for the asyncio runtime (BOT_RUNTIME=async).
+Requires the optional aiohttp dependency.
+"""
+import asyncio
+import json
+import os
+from typing import Dict, Optional
+
+import aiohttp
+
+from utils.http_transport import backoff_delay, is_retryable, parse_retry_after
+
+
+class AsyncHttpError(Exception):
+    """Raised by AsyncResponse.raise_for_status for 4xx/5xx responses."""
+    
+    def __init__(self, status_code: int, url: str):
+        """
+        Initialize the exception.
+        
+        Args:
+            status_code: HTTP status code
+            url: Request URL
+        """
+        super().__init__(f"{status_code} error for url: {url}")
+        self.status_code = status_code
+        self.url = url
+
+
+class AsyncResponse:
+    """Fully read response, shaped like the parts of requests.Response the clients use."""
+    
+    def __init__(self, url: str, status_code: int, headers, content: bytes):
+        """
+        Initialize the response.
+        
+        Args:
+            url: Request URL
+            status_code: HTTP status code
+            headers: Response headers
+            content: Response body
+        """
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+    
+    def json(self):
+        """Decode the body as JSON."""
+        return json.loads(self.content)
+    
+    def raise_for_status(self):
+        """Raise AsyncHttpError for 4xx/5xx responses."""
+        if self.status_code >= 400:
+            raise AsyncHttpError(self.status_code, self.url)
+
+
+class AsyncHttpTransport:
+    """One pooled aiohttp session with the same retry policy as HttpTransport."""
+    
+    def __init__(
+        self,
+        pool_maxsize: int = 10,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        timeout: float = 10.0
+    ):
+        """
+        Initialize the transport.
+        
+        Args:
+            pool_maxsize: Maximum number of keep-alive connections per host
+            max_retries: Retries for transient failures (0 disables retrying)
+            backoff_base: Base delay in seconds for exponential backoff
+            backoff_max: Upper bound in seconds for any single retry delay
+            timeout: Total timeout in seconds for each attempt
+        """
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max(0, max_retries)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._requests = 0
+        self._retries = 0
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the pooled session, creating it on first use inside the running loop."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=0, limit_per_host=self.pool_maxsize),
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+    
+    async def request(self, method: str, url: str, **kwargs) -> AsyncResponse:
+        """
+        Send a request, retrying transient failures.
+        
+        Retries connection errors, timeouts and 429/502/503/504 responses with
+        jittered exponential backoff, honoring Retry-After when present.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed through to aiohttp.ClientSession.request
+            
+        Returns:
+            The final HTTP response (callers should check its status)
+        """
+        session = self._get_session()
+        attempt = 0
+        
+        while True:
+            self._requests += 1
+            try:
+                async with session.request(method, url, **kwargs) as raw:
+                    response = AsyncResponse(url, raw.status, raw.headers, await raw.read())
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= self.max_retries:
+                    raise
+                delay = backoff_delay(attempt, self.backoff_base, self.backoff_max)
+            else:
+                if attempt >= self.max_retries or not is_retryable(response.status_code, response.headers):
+                    return response
+                delay = parse_retry_after(response.headers)
+                if delay is None:
+                    delay = backoff_delay(attempt, self.backoff_base, self.backoff_max)
+                delay = min(delay, self.backoff_max)
+            
+            self._retries += 1
+            attempt += 1
+            await asyncio.sleep(delay)
+    
+    async def get(self, url: str, **kwargs) -> AsyncResponse:
+        """Send a GET request (see request)."""
+        return await self.request("GET", url, **kwargs)
+    
+    async def post(self, url: str, **kwargs) -> AsyncResponse:
+        """Send a POST request (see request)."""
+        return await self.request("POST", url, **kwargs)
+    
+    async def close(self):
+        """Close the session and its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+    
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get transport counters.
+        
+        Returns:
+            Dictionary with request and retry counters
+        """
+        return {"requests": self._requests, "retries": self._retries}
+
+
+def create_async_http_transport() -> AsyncHttpTransport:
+    """
+    Create the asyncio HTTP transport from the same environment variables as HttpTransport.
+    
+    Returns:
+        AsyncHttpTransport instance
+    """
+    return AsyncHttpTransport(
+        pool_maxsize=int(os.getenv("HTTP_POOL_MAXSIZE", "10")),
+        max_retries=int(os.getenv("HTTP_MAX_RETRIES", "3")),
+        backoff_base=float(os.getenv("HTTP_BACKOFF_BASE", "0.5")),
+        backoff_max=float(os.getenv("HTTP_BACKOFF_MAX", "30"))
+    )
@@ -0,0 +1,106 @@
+"""
+Parallel fetch orchestration for /mywork data sources.
+Runs each source concurrently under one shared per-request time budget.
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from typing import Any, Callable, Dict, Optional
+
+
+class FetchOrchestrator:
+    """Runs named fetchers in parallel and returns partial results on timeout."""
+    
+    def __init__(self, max_workers: int = 8, budget: float = 20.0):
+        """
+        Initialize the orchestrator.
+        
+        Args:
+            max_workers: Size of the shared worker pool
+            budget: Default per-request time budget in seconds
+        """
+        self.max_workers = max(1, max_workers)
+        self.budget = budget
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="mywork-fetch"
+        )
+    
+    def fetch(
+        self,
+        fetchers: Dict[str, Callable[[], Any]],
+        fallbacks: Optional[Dict[str, Any]] = None,
+        budget: Optional[float] = None,
+        on_result: Optional[Callable[[str, Any], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run all fetchers in parallel under one time budget.
+        
+        Sources that fail or are still running when the budget runs out are
+        replaced by their fallback value and listed as failed or timed out.
+        
+        Args:
+            fetchers: Mapping of source name to a zero-argument fetch function
+            fallbacks: Mapping of source name to the value used on failure
+            budget: Time budget in seconds (defaults to the orchestrator budget)
+            on_result: Called with (name, result) as each source finishes, in
+                completion order, on the calling thread
+            
+        Returns:
+            Dictionary with "results", "timed_out", "failed" and "elapsed"
+        """
+        fallbacks = fallbacks or {}
+        budget = self.budget if budget is None else budget
+        started = time.monotonic()
+        
+        futures = {
+            self._executor.submit(fetcher): name
+            for name, fetcher in fetchers.items()
+        }
+        
+        results = {}
+        timed_out = []
+        failed = []
+        try:
+            for future in as_completed(futures, timeout=budget):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    failed.append(name)
+                    results[name] = fallbacks.get(name)
+                    print(f"Error fetching {name} data: {e}")
+                
+                if on_result:
+                    try:
+                        on_result(name, results[name])
+                    except Exception as e:
+                        print(f"Progress callback for {name} failed: {e}")
+        except FuturesTimeoutError:
+            pass
+        
+        for future, name in futures.items():
+            if name not in results:
+                future.cancel()
+                timed_out.append(name)
+                results[name] = fallbacks.get(name)
+                print(f"Fetching {name} timed out after {budget:.1f}s")
+        
+        return {
+            "results": results,
+            "timed_out": timed_out,
+            "failed": failed,
+            "elapsed": time.monotonic() - started
+        }
+
+
+def create_fetch_orchestrator() -> FetchOrchestrator:
+    """
+    Create a fetch orchestrator from environment variables.
+    
+    Returns:
+        FetchOrchestrator instance
+    """
+    max_workers = int(os.getenv("MYWORK_FETCH_WORKERS", "8"))
+    budget = float(os.getenv("MYWORK_FETCH_BUDGET", "20"))
+    return FetchOrchestrator(max_workers=max_workers, budget=budget)
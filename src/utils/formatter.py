@@ -1,7 +1,61 @@
 """
 Slack message formatter using Block Kit.
 """
-from typing import List, Dict, Any
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+# Most items shown per category; the clients only fetch this many
+GITHUB_DISPLAY_LIMITS = {
+    "created": 10,
+    "review_requested": 10,
+    "assigned": 10,
+    "failed_ci": 5
+}
+JIRA_DISPLAY_LIMITS = {
+    "todo": 10,
+    "in_progress": 10,
+    "blocked": 10,
+    "other": 5
+}
+
+# Category key and heading of each section, in display order
+GITHUB_SECTIONS = [
+    ("created", "*Your Open PRs* 📝"),
+    ("review_requested", "*Waiting for Your Review* 👀"),
+    ("assigned", "*Assigned to You* 👤"),
+    ("failed_ci", "*Failed CI Checks* ⚠️")
+]
+JIRA_SECTIONS = [
+    ("todo", "*To Do* 📝"),
+    ("in_progress", "*In Progress* 🚀"),
+    ("blocked", "*Blocked* 🚫"),
+    ("other", "*Other* 📌")
+]
+
+SHOW_MORE_ACTION = "mywork_show_more"
+
+# Slack rejects messages with more blocks than this
+MAX_MESSAGE_BLOCKS = 50
+
+
+def show_more_value(view_id: str, source: str, category: str) -> str:
+    """Build a "Show more" button value; parse_show_more_value reads it back."""
+    return f"{view_id}:{source}:{category}"
+
+
+def parse_show_more_value(value: str):
+    """
+    Split a "Show more" button value.
+    
+    Args:
+        value: Button value from show_more_value
+        
+    Returns:
+        (view id, source, category) tuple
+    """
+    view_id, source, category = value.split(":", 2)
+    return view_id, source, category
 
 
 class SlackMessageFormatter:
@@ -50,97 +104,219 @@ class SlackMessageFormatter:
         }
     
     @staticmethod
-    def format_github_prs(github_data: Dict[str, List[Dict]]) -> List[Dict]:
+    def create_timed_out_notice(source_name: str) -> Dict:
+        """Create a context block marking a source that timed out."""
+        return SlackMessageFormatter.create_context([
+            f"⏱️ _{source_name} timed out — results may be incomplete. Try `/mywork` again shortly._"
+        ])
+    
+    @staticmethod
+    def create_pending_notice(source_name: str) -> Dict:
+        """Create a context block marking a source that is still loading."""
+        return SlackMessageFormatter.create_context([
+            f"⏳ _Fetching {source_name}..._"
+        ])
+    
+    @staticmethod
+    def format_age(seconds: float) -> str:
+        """Describe an age in seconds like "2 min ago"."""
+        if seconds < 60:
+            return "just now"
+        if seconds < 3600:
+            return f"{int(seconds // 60)} min ago"
+        return f"{int(seconds // 3600)} h ago"
+    
+    @staticmethod
+    def create_as_of_notice(fetched_at: float) -> Dict:
+        """Create a context block marking results served from cache while they refresh."""
+        age = SlackMessageFormatter.format_age(time.time() - fetched_at)
+        return SlackMessageFormatter.create_context([
+            f"🕒 _Showing results as of {age} — refreshing in the background._"
+        ])
+    
+    @staticmethod
+    def create_failed_notice(source_name: str) -> Dict:
+        """Create a context block marking a source whose fetch failed."""
+        return SlackMessageFormatter.create_context([
+            f"⚠️ _Couldn't load {source_name} — results may be missing. Try `/mywork` again shortly._"
+        ])
+    
+    @staticmethod
+    def create_rate_limited_notice(source_name: str) -> Dict:
+        """Create a context block marking a source served from cache while rate limited."""
+        return SlackMessageFormatter.create_context([
+            f"🐢 _Serving cached {source_name} data — rate limited. Fresh results will be back shortly._"
+        ])
+    
+    @staticmethod
+    def create_more_notice(
+        items: List[Dict],
+        total: Optional[int],
+        limit: int,
+        action_value: Optional[str] = None
+    ) -> Optional[Dict]:
+        """
+        Create a block counting the items of a category that aren't shown.
+        
+        Args:
+            items: Items fetched for the category
+            total: Server-reported total for the category (if known)
+            limit: Most items shown for the category
+            action_value: Value for a "Show more" button; without one the
+                count is shown as plain context
+            
+        Returns:
+            Context or section block, or None if everything is shown
+        """
+        remaining = max(total or 0, len(items)) - min(len(items), limit)
+        if remaining <= 0:
+            return None
+        if action_value is None:
+            return SlackMessageFormatter.create_context([f"_…and {remaining} more_"])
+        
+        block = SlackMessageFormatter.create_section(f"_…and {remaining} more_")
+        block["accessory"] = {
+            "type": "button",
+            "text": {
+                "type": "plain_text",
+                "text": "Show more",
+                "emoji": True
+            },
+            "action_id": SHOW_MORE_ACTION,
+            "value": action_value
+        }
+        return block
+    
+    @staticmethod
+    def format_pr_line(pr: Dict, with_author: bool = False) -> str:
+        """Format one PR as a bullet with its repo (and author)."""
+        repo_name = pr.get("repository_url", "").split("/")[-1] if pr.get("repository_url") else "repo"
+        pr_title = pr.get("title", "Untitled PR")
+        pr_url = pr.get("html_url", "#")
+        pr_number = pr.get("number", "?")
+        text = f"• <{pr_url}|#{pr_number}: {pr_title}>\n   `{repo_name}`"
+        if with_author:
+            text += f" by @{pr.get('user', {}).get('login', 'unknown')}"
+        return text
+    
+    @staticmethod
+    def format_issue_line(issue: Dict) -> str:
+        """Format one Jira issue with its priority, type and status."""
+        priority_emoji = {
+            "Highest": "🔴",
+            "High": "🟠",
+            "Medium": "🟡",
+            "Low": "🟢",
+            "Lowest": "⚪"
+        }.get(issue.get("priority", ""), "⚪")
+        return (
+            f"{priority_emoji} <{issue['url']}|{issue['key']}> {issue['summary']}\n"
+            f"   _{issue['type']} • {issue['status']}_"
+        )
+    
+    @staticmethod
+    def create_category_blocks(
+        source: str,
+        category: str,
+        title: str,
+        items: List[Dict],
+        format_item: Callable[[Dict], str],
+        totals: Dict[str, int],
+        limit: int,
+        view_id: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Create the blocks of one category: heading, items and "N more" notice.
+        
+        Args:
+            source: Source name ("github" or "jira")
+            category: Category key
+            title: Category heading
+            items: Items fetched for the category
+            format_item: Formats one item as section text
+            totals: Server-reported totals per category
+            limit: Most items shown for the category
+            view_id: Stored view id; adds a "Show more" button if truncated
+            
+        Returns:
+            List of Slack blocks
+        """
+        blocks = [SlackMessageFormatter.create_section(title)]
+        for item in items[:limit]:
+            blocks.append(SlackMessageFormatter.create_section(format_item(item)))
+        more_notice = SlackMessageFormatter.create_more_notice(
+            items,
+            totals.get(category),
+            limit,
+            action_value=show_more_value(view_id, source, category) if view_id else None
+        )
+        if more_notice:
+            blocks.append(more_notice)
+        return blocks
+    
+    @staticmethod
+    def format_github_prs(
+        github_data: Dict[str, List[Dict]],
+        timed_out: bool = False,
+        display_limits: Optional[Dict[str, int]] = None,
+        view_id: Optional[str] = None
+    ) -> List[Dict]:
         """
         Format GitHub PR data into Slack blocks.
         
         Args:
             github_data: Dictionary containing categorized PRs
+            timed_out: Whether the GitHub fetch ran out of time
+            display_limits: Per-category overrides of GITHUB_DISPLAY_LIMITS
+            view_id: Stored view id; adds "Show more" buttons to truncated categories
             
         Returns:
             List of Slack blocks
         """
         blocks = []
+        limits = dict(GITHUB_DISPLAY_LIMITS, **(display_limits or {}))
         
         # Header
         blocks.append(SlackMessageFormatter.create_section("*🐙 GitHub Pull Requests*"))
         
-        has_any_prs = False
-        
-        # PRs created by user
-        created_prs = github_data.get("created", [])
-        if created_prs:
-            has_any_prs = True
-            blocks.append(SlackMessageFormatter.create_section("*Your Open PRs* 📝"))
-            for pr in created_prs[:10]:  # Limit to 10
-                repo_name = pr.get("repository_url", "").split("/")[-1] if pr.get("repository_url") else "repo"
-                pr_title = pr.get("title", "Untitled PR")
-                pr_url = pr.get("html_url", "#")
-                pr_number = pr.get("number", "?")
-                
-                blocks.append(
-                    SlackMessageFormatter.create_section(
-                        f"• <{pr_url}|#{pr_number}: {pr_title}>\n   `{repo_name}`"
-                    )
-                )
+        if timed_out:
+            blocks.append(SlackMessageFormatter.create_timed_out_notice("GitHub"))
         
-        # PRs awaiting review
-        review_prs = github_data.get("review_requested", [])
-        if review_prs:
-            has_any_prs = True
-            blocks.append(SlackMessageFormatter.create_divider())
-            blocks.append(SlackMessageFormatter.create_section("*Waiting for Your Review* 👀"))
-            for pr in review_prs[:10]:  # Limit to 10
-                repo_name = pr.get("repository_url", "").split("/")[-1] if pr.get("repository_url") else "repo"
-                pr_title = pr.get("title", "Untitled PR")
-                pr_url = pr.get("html_url", "#")
-                pr_number = pr.get("number", "?")
-                author = pr.get("user", {}).get("login", "unknown")
-                
-                blocks.append(
-                    SlackMessageFormatter.create_section(
-                        f"• <{pr_url}|#{pr_number}: {pr_title}>\n   `{repo_name}` by @{author}"
-                    )
-                )
+        rate_limited = github_data.get("rate_limited", False)
+        if rate_limited:
+            blocks.append(SlackMessageFormatter.create_rate_limited_notice("GitHub"))
         
-        # Assigned PRs
-        assigned_prs = github_data.get("assigned", [])
-        if assigned_prs:
-            has_any_prs = True
-            blocks.append(SlackMessageFormatter.create_divider())
-            blocks.append(SlackMessageFormatter.create_section("*Assigned to You* 👤"))
-            for pr in assigned_prs[:10]:  # Limit to 10
-                repo_name = pr.get("repository_url", "").split("/")[-1] if pr.get("repository_url") else "repo"
-                pr_title = pr.get("title", "Untitled PR")
-                pr_url = pr.get("html_url", "#")
-                pr_number = pr.get("number", "?")
-                
-                blocks.append(
-                    SlackMessageFormatter.create_section(
-                        f"• <{pr_url}|#{pr_number}: {pr_title}>\n   `{repo_name}`"
-                    )
-                )
+        # Categories that failed or timed out came back empty; don't pass that off as "no PRs"
+        failed = any(
+            entry.get("error") or entry.get("timed_out")
+            for entry in github_data.get("fetch_report", {}).values()
+        )
+        if failed and not timed_out and not rate_limited:
+            blocks.append(SlackMessageFormatter.create_failed_notice("some GitHub categories"))
         
-        # Failed CI (optional)
-        failed_ci_prs = github_data.get("failed_ci", [])
-        if failed_ci_prs:
+        has_any_prs = False
+        totals = github_data.get("totals", {})
+        
+        for index, (category, title) in enumerate(GITHUB_SECTIONS):
+            prs = github_data.get(category, [])
+            if not prs:
+                continue
+            if index:
+                blocks.append(SlackMessageFormatter.create_divider())
             has_any_prs = True
-            blocks.append(SlackMessageFormatter.create_divider())
-            blocks.append(SlackMessageFormatter.create_section("*Failed CI Checks* ⚠️"))
-            for pr in failed_ci_prs[:5]:  # Limit to 5
-                repo_name = pr.get("repository_url", "").split("/")[-1] if pr.get("repository_url") else "repo"
-                pr_title = pr.get("title", "Untitled PR")
-                pr_url = pr.get("html_url", "#")
-                pr_number = pr.get("number", "?")
-                
-                blocks.append(
-                    SlackMessageFormatter.create_section(
-                        f"• <{pr_url}|#{pr_number}: {pr_title}>\n   `{repo_name}`"
-                    )
-                )
+            blocks.extend(SlackMessageFormatter.create_category_blocks(
+                "github",
+                category,
+                title,
+                prs,
+                lambda pr: SlackMessageFormatter.format_pr_line(pr, with_author=category == "review_requested"),
+                totals,
+                limits[category],
+                view_id
+            ))
         
         # If no PRs at all
-        if not has_any_prs:
+        if not has_any_prs and not timed_out and not rate_limited and not failed:
             blocks.append(
                 SlackMessageFormatter.create_section("✨ _All clear! No pending PRs._")
             )
@@ -148,113 +324,70 @@ class SlackMessageFormatter:
         return blocks
     
     @staticmethod
-    def format_jira_issues(jira_data: Dict[str, Any]) -> List[Dict]:
+    def format_jira_issues(
+        jira_data: Dict[str, Any],
+        timed_out: bool = False,
+        display_limits: Optional[Dict[str, int]] = None,
+        view_id: Optional[str] = None
+    ) -> List[Dict]:
         """
         Format Jira issue data into Slack blocks.
         
         Args:
             jira_data: Dictionary containing categorized issues
+            timed_out: Whether the Jira fetch ran out of time
+            display_limits: Per-category overrides of JIRA_DISPLAY_LIMITS
+            view_id: Stored view id; adds "Show more" buttons to truncated categories
             
         Returns:
             List of Slack blocks
         """
         blocks = []
+        limits = dict(JIRA_DISPLAY_LIMITS, **(display_limits or {}))
         
         # Header
         blocks.append(SlackMessageFormatter.create_section("*📊 Jira Issues*"))
         
+        if timed_out:
+            blocks.append(SlackMessageFormatter.create_timed_out_notice("Jira"))
+        
+        rate_limited = jira_data.get("rate_limited", False)
+        if rate_limited:
+            blocks.append(SlackMessageFormatter.create_rate_limited_notice("Jira"))
+        
+        failed = jira_data.get("failed", False)
+        if failed:
+            blocks.append(SlackMessageFormatter.create_failed_notice("Jira"))
+        
         all_issues = jira_data.get("all_issues", [])
         
         if not all_issues:
+            if timed_out or rate_limited or failed:
+                return blocks
             blocks.append(
                 SlackMessageFormatter.create_section("✨ _All clear! No assigned issues._")
             )
             return blocks
         
         categorized = jira_data.get("categorized", {})
-        
-        # To Do issues
-        todo_issues = categorized.get("todo", [])
-        if todo_issues:
-            blocks.append(SlackMessageFormatter.create_section("*To Do* 📝"))
-            for issue in todo_issues[:10]:
-                priority_emoji = {
-                    "Highest": "🔴",
-                    "High": "🟠",
-                    "Medium": "🟡",
-                    "Low": "🟢",
-                    "Lowest": "⚪"
-                }.get(issue.get("priority", ""), "⚪")
-                
-                blocks.append(
-                    SlackMessageFormatter.create_section(
-                        f"{priority_emoji} <{issue['url']}|{issue['key']}> {issue['summary']}\n"
-                        f"   _{issue['type']} • {issue['status']}_"
-                    )
-                )
-        
-        # In Progress issues
-        in_progress_issues = categorized.get("in_progress", [])
-        if in_progress_issues:
-            blocks.append(SlackMessageFormatter.create_divider())
-            blocks.append(SlackMessageFormatter.create_section("*In Progress* 🚀"))
-            for issue in in_progress_issues[:10]:
-                priority_emoji = {
-                    "Highest": "🔴",
-                    "High": "🟠",
-                    "Medium": "🟡",
-                    "Low": "🟢",
-                    "Lowest": "⚪"
-                }.get(issue.get("priority", ""), "⚪")
-                
-                blocks.append(
-                    SlackMessageFormatter.create_section(
-                        f"{priority_emoji} <{issue['url']}|{issue['key']}> {issue['summary']}\n"
-                        f"   _{issue['type']} • {issue['status']}_"
-                    )
-                )
-        
-        # Blocked issues
-        blocked_issues = categorized.get("blocked", [])
-        if blocked_issues:
-            blocks.append(SlackMessageFormatter.create_divider())
-            blocks.append(SlackMessageFormatter.create_section("*Blocked* 🚫"))
-            for issue in blocked_issues[:10]:
-                priority_emoji = {
-                    "Highest": "🔴",
-                    "High": "🟠",
-                    "Medium": "🟡",
-                    "Low": "🟢",
-                    "Lowest": "⚪"
-                }.get(issue.get("priority", ""), "⚪")
-                
-                blocks.append(
-                    SlackMessageFormatter.create_section(
-                        f"{priority_emoji} <{issue['url']}|{issue['key']}> {issue['summary']}\n"
-                        f"   _{issue['type']} • {issue['status']}_"
-                    )
-                )
-        
-        # Other issues
-        other_issues = categorized.get("other", [])
-        if other_issues:
-            blocks.append(SlackMessageFormatter.create_divider())
-            blocks.append(SlackMessageFormatter.create_section("*Other* 📌"))
-            for issue in other_issues[:5]:
-                priority_emoji = {
-                    "Highest": "🔴",
-                    "High": "🟠",
-                    "Medium": "🟡",
-                    "Low": "🟢",
-                    "Lowest": "⚪"
-                }.get(issue.get("priority", ""), "⚪")
-                
-                blocks.append(
-                    SlackMessageFormatter.create_section(
-                        f"{priority_emoji} <{issue['url']}|{issue['key']}> {issue['summary']}\n"
-                        f"   _{issue['type']} • {issue['status']}_"
-                    )
-                )
+        totals = jira_data.get("totals", {})
+        
+        for index, (category, title) in enumerate(JIRA_SECTIONS):
+            issues = categorized.get(category, [])
+            if not issues:
+                continue
+            if index:
+                blocks.append(SlackMessageFormatter.create_divider())
+            blocks.extend(SlackMessageFormatter.create_category_blocks(
+                "jira",
+                category,
+                title,
+                issues,
+                SlackMessageFormatter.format_issue_line,
+                totals,
+                limits[category],
+                view_id
+            ))
         
         return blocks
     
@@ -327,7 +460,16 @@ class SlackMessageFormatter:
         return blocks
     
     @staticmethod
-    def create_my_work_message(github_data: Dict, jira_data: Dict, todos: List[Dict] = None) -> List[Dict]:
+    def create_my_work_message(
+        github_data: Dict,
+        jira_data: Dict,
+        todos: List[Dict] = None,
+        timed_out_sources: Optional[List[str]] = None,
+        display_limits: Optional[Dict[str, Dict[str, int]]] = None,
+        view_id: Optional[str] = None,
+        pending_sources: Optional[List[str]] = None,
+        as_of: Optional[float] = None
+    ) -> List[Dict]:
         """
         Create a complete /mywork response message.
         
@@ -335,28 +477,112 @@ class SlackMessageFormatter:
             github_data: GitHub PR data
             jira_data: Jira issue data
             todos: Personal todos list
+            timed_out_sources: Names of sources ("github", "jira", "todos") that timed out
+            display_limits: Per-source ("github", "jira") display limit overrides
+            view_id: Stored view id; adds "Show more" buttons to truncated categories
+            pending_sources: Names of sources still loading; shown as placeholders
+            as_of: Fetch time (epoch seconds) of the oldest cached section, if any are stale
             
         Returns:
-            Complete list of Slack blocks
+            Complete list of Slack blocks, at most MAX_MESSAGE_BLOCKS long
         """
+        timed_out_sources = timed_out_sources or []
+        display_limits = display_limits or {}
+        pending_sources = pending_sources or []
+        limits = {
+            "github": dict(GITHUB_DISPLAY_LIMITS, **display_limits.get("github", {})),
+            "jira": dict(JIRA_DISPLAY_LIMITS, **display_limits.get("jira", {}))
+        }
+        shown_items = {
+            "github": {category: github_data.get(category, []) for category, _ in GITHUB_SECTIONS},
+            "jira": {category: jira_data.get("categorized", {}).get(category, []) for category, _ in JIRA_SECTIONS}
+        }
+        
+        blocks = SlackMessageFormatter._build_my_work_blocks(
+            github_data, jira_data, todos, timed_out_sources, limits, view_id, pending_sources, as_of
+        )
+        
+        # Over the limit: shorten the longest categories, those the user didn't
+        # expand first; each keeps its "…and N more" notice and button
+        while len(blocks) > MAX_MESSAGE_BLOCKS:
+            candidates = [
+                (source, category, min(len(items), limits[source][category]))
+                for source in ("github", "jira") if source not in pending_sources
+                for category, items in shown_items[source].items()
+                if min(len(items), limits[source][category])
+            ]
+            if not candidates:
+                blocks = blocks[:MAX_MESSAGE_BLOCKS]
+                break
+            source, category, shown = min(
+                candidates,
+                key=lambda candidate: (candidate[1] in display_limits.get(candidate[0], {}), -candidate[2])
+            )
+            limits[source][category] = shown - 1
+            blocks = SlackMessageFormatter._build_my_work_blocks(
+                github_data, jira_data, todos, timed_out_sources, limits, view_id, pending_sources, as_of
+            )
+        
+        return blocks
+    
+    @staticmethod
+    def _build_my_work_blocks(
+        github_data: Dict,
+        jira_data: Dict,
+        todos: Optional[List[Dict]],
+        timed_out_sources: List[str],
+        limits: Dict[str, Dict[str, int]],
+        view_id: Optional[str],
+        pending_sources: List[str],
+        as_of: Optional[float]
+    ) -> List[Dict]:
+        """Build the /mywork blocks with the given per-category limits."""
         blocks = []
         
         # Main header
         blocks.append(SlackMessageFormatter.create_header("Your Pending Work", "📋"))
+        if as_of is not None:
+            blocks.append(SlackMessageFormatter.create_as_of_notice(as_of))
         blocks.append(SlackMessageFormatter.create_divider())
         
         # GitHub section
-        github_blocks = SlackMessageFormatter.format_github_prs(github_data)
-        blocks.extend(github_blocks)
+        if "github" in pending_sources:
+            blocks.append(SlackMessageFormatter.create_section("*🐙 GitHub Pull Requests*"))
+            blocks.append(SlackMessageFormatter.create_pending_notice("GitHub"))
+        else:
+            github_blocks = SlackMessageFormatter.format_github_prs(
+                github_data,
+                timed_out="github" in timed_out_sources,
+                display_limits=limits["github"],
+                view_id=view_id
+            )
+            blocks.extend(github_blocks)
         
         blocks.append(SlackMessageFormatter.create_divider())
         
         # Jira section
-        jira_blocks = SlackMessageFormatter.format_jira_issues(jira_data)
-        blocks.extend(jira_blocks)
+        if "jira" in pending_sources:
+            blocks.append(SlackMessageFormatter.create_section("*📊 Jira Issues*"))
+            blocks.append(SlackMessageFormatter.create_pending_notice("Jira"))
+        else:
+            jira_blocks = SlackMessageFormatter.format_jira_issues(
+                jira_data,
+                timed_out="jira" in timed_out_sources,
+                display_limits=limits["jira"],
+                view_id=view_id
+            )
+            blocks.extend(jira_blocks)
         
         # Personal Todos section
-        if todos is not None:
+        if "todos" in pending_sources:
+            blocks.append(SlackMessageFormatter.create_divider())
+            blocks.append(SlackMessageFormatter.create_section("*✅ Personal Todos*"))
+            blocks.append(SlackMessageFormatter.create_pending_notice("Todos"))
+        elif "todos" in timed_out_sources:
+            blocks.append(SlackMessageFormatter.create_divider())
+            blocks.append(SlackMessageFormatter.create_section("*✅ Personal Todos*"))
+            blocks.append(SlackMessageFormatter.create_timed_out_notice("Todos"))
+        elif todos is not None:
             blocks.append(SlackMessageFormatter.create_divider())
             todo_blocks = SlackMessageFormatter.format_todos(todos)
             blocks.extend(todo_blocks)
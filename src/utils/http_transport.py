@@ -0,0 +1,213 @@
+"""
+Shared HTTP transport with pooled keep-alive sessions and retry/backoff.
+"""
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+RETRY_STATUSES = (429, 502, 503, 504)
+
+
+def parse_retry_after(headers) -> Optional[float]:
+    """
+    Parse a Retry-After header.
+    
+    Args:
+        headers: Response headers
+        
+    Returns:
+        Delay in seconds, or None if the header is missing or invalid
+    """
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, base: float, maximum: float) -> float:
+    """Full-jitter exponential backoff delay for a retry attempt."""
+    ceiling = min(maximum, base * (2 ** attempt))
+    return random.uniform(0, ceiling)
+
+
+def is_retryable(status_code: int, headers) -> bool:
+    """Check whether a response is a transient failure worth retrying."""
+    if status_code in RETRY_STATUSES:
+        return True
+    # GitHub secondary rate limits answer 403 with a Retry-After header
+    return status_code == 403 and "Retry-After" in headers
+
+
+class HttpTransport:
+    """Pooled persistent sessions per upstream host with jittered retries."""
+    
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0
+    ):
+        """
+        Initialize the transport.
+        
+        Args:
+            pool_connections: Number of connection pools to cache per session
+            pool_maxsize: Maximum number of keep-alive connections per host
+            max_retries: Retries for transient failures (0 disables retrying)
+            backoff_base: Base delay in seconds for exponential backoff
+            backoff_max: Upper bound in seconds for any single retry delay
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max(0, max_retries)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._retries = 0
+    
+    def _host_key(self, url: str) -> str:
+        """Return the scheme and host that identify a session."""
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+    
+    def _get_session(self, url: str) -> requests.Session:
+        """Get the pooled session for a URL's host, creating it on first use."""
+        key = self._host_key(url)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[key] = session
+            return session
+    
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request, retrying transient failures.
+        
+        Retries connection errors, timeouts and 429/502/503/504 responses with
+        jittered exponential backoff, honoring Retry-After when present.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed through to requests.Session.request
+            
+        Returns:
+            The final HTTP response (callers should check its status)
+        """
+        session = self._get_session(url)
+        attempt = 0
+        
+        while True:
+            with self._lock:
+                self._requests += 1
+            
+            try:
+                response = session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt >= self.max_retries:
+                    raise
+                delay = backoff_delay(attempt, self.backoff_base, self.backoff_max)
+            else:
+                if attempt >= self.max_retries or not is_retryable(response.status_code, response.headers):
+                    return response
+                delay = parse_retry_after(response.headers)
+                if delay is None:
+                    delay = backoff_delay(attempt, self.backoff_base, self.backoff_max)
+                delay = min(delay, self.backoff_max)
+                response.close()
+            
+            with self._lock:
+                self._retries += 1
+            attempt += 1
+            time.sleep(delay)
+    
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request (see request)."""
+        return self.request("GET", url, **kwargs)
+    
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """Send a POST request (see request)."""
+        return self.request("POST", url, **kwargs)
+    
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get transport counters.
+        
+        Connection counts come from the urllib3 pools, so "connections_reused"
+        is the number of requests that did not need a new TCP+TLS handshake.
+        
+        Returns:
+            Dictionary with request, retry and connection counters
+        """
+        opened = 0
+        served = 0
+        with self._lock:
+            sessions = list(self._sessions.values())
+            stats = {
+                "requests": self._requests,
+                "retries": self._retries,
+                "hosts": len(sessions)
+            }
+        
+        for session in sessions:
+            for adapter in set(session.adapters.values()):
+                pools = adapter.poolmanager.pools
+                for key in list(pools.keys()):
+                    pool = pools.get(key)
+                    if pool is None:
+                        continue
+                    opened += pool.num_connections
+                    served += pool.num_requests
+        
+        stats["connections_opened"] = opened
+        stats["connections_reused"] = max(0, served - opened)
+        return stats
+
+
+# Global instance
+_http_transport = None
+_http_transport_lock = threading.Lock()
+
+def get_http_transport() -> HttpTransport:
+    """Get the global HTTP transport shared by the API clients."""
+    global _http_transport
+    with _http_transport_lock:
+        if _http_transport is None:
+            _http_transport = HttpTransport(
+                pool_connections=int(os.getenv("HTTP_POOL_CONNECTIONS", "10")),
+                pool_maxsize=int(os.getenv("HTTP_POOL_MAXSIZE", "10")),
+                max_retries=int(os.getenv("HTTP_MAX_RETRIES", "3")),
+                backoff_base=float(os.getenv("HTTP_BACKOFF_BASE", "0.5")),
+                backoff_max=float(os.getenv("HTTP_BACKOFF_MAX", "30"))
+            )
+        return _http_transport
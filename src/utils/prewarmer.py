@@ -0,0 +1,319 @@
+"""
+Predictive /mywork cache pre-warming.
+Learns when each user usually runs /mywork first each day and refreshes
+their cached results shortly before, within a share of the API quota.
+"""
+import json
+import os
+import threading
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from utils.rate_limit import RateLimitScheduler
+
+
+class CachePrewarmer:
+    """Background thread that warms the result cache ahead of each user's usual first /mywork."""
+    
+    def __init__(
+        self,
+        warm_fn: Callable[[str], None],
+        is_warm: Callable[[str], bool],
+        rate_limiter: RateLimitScheduler,
+        quota_keys: List[str],
+        history_path: str = "data/mywork_usage.json",
+        lead: float = 300.0,
+        quota_share: float = 0.2,
+        min_days: int = 3,
+        max_days: int = 14,
+        interval: float = 60.0,
+        max_age: Optional[float] = None
+    ):
+        """
+        Initialize the pre-warmer.
+        
+        Args:
+            warm_fn: Refreshes a user's cached GitHub and Jira results
+            is_warm: Checks whether a user's results are cached and fresh
+            rate_limiter: Scheduler holding the upstream budgets
+            quota_keys: Rate limit keys pre-warming spends from
+            history_path: JSON file the usage history is kept in
+            lead: Seconds before a user's usual first /mywork to warm their cache
+            quota_share: Share of each upstream budget window pre-warming may spend
+            min_days: Days of history needed before a user is pre-warmed
+            max_days: Days of history kept per user
+            interval: Seconds between checks for users due a warm-up
+            max_age: Seconds warmed results stay fresh (the shortest cache TTL);
+                lead and interval are shortened so a warm-up is still fresh at
+                the predicted time
+        """
+        self.warm_fn = warm_fn
+        self.is_warm = is_warm
+        self.rate_limiter = rate_limiter
+        self.quota_keys = quota_keys
+        self.history_path = history_path
+        self.lead = lead
+        self.quota_share = quota_share
+        self.min_days = max(1, min_days)
+        self.max_days = max(self.min_days, max_days)
+        self.interval = interval
+        if max_age and max_age > 0:
+            # A warm-up lands at most one interval into the lead window, so it
+            # is fresh from before the predicted time until at least one
+            # interval after it
+            self.interval = min(interval, max_age / 2)
+            self.lead = min(lead, max_age - self.interval)
+        
+        # Minute of day of each user's first /mywork, per day: {user: [[date, minute], ...]}
+        self._history: Dict[str, List[List]] = self._load_history()
+        self._warmed: Dict[str, str] = {}
+        # Requests spent per budget window: {key: {"reset": epoch, "used": n}}
+        self._spent: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._metrics = {
+            "warms": 0,
+            "warm_failures": 0,
+            "skipped_quota": 0,
+            "first_runs": 0,
+            "warm_hits": 0,
+            "quota_spent": 0
+        }
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def _load_history(self) -> Dict[str, List[List]]:
+        """Load the usage history, starting empty if it is missing or unreadable."""
+        try:
+            with open(self.history_path, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+    
+    def _save_history(self, history: Dict[str, List[List]]):
+        """Write the usage history."""
+        storage_dir = os.path.dirname(self.history_path)
+        if storage_dir and not os.path.exists(storage_dir):
+            os.makedirs(storage_dir)
+        with open(self.history_path, 'w') as f:
+            json.dump(history, f)
+    
+    def _predict(self, days: List[List], now: datetime) -> Optional[datetime]:
+        """
+        Predict when a user will first run /mywork today.
+        
+        The prediction is the median first-use time of the earlier days in
+        the history. Weekends are only predicted for users who have used
+        the bot on a weekend before.
+        
+        Args:
+            days: User's [date, minute of day] history
+            now: Current local time
+            
+        Returns:
+            Predicted time today, or None without enough history
+        """
+        today = now.date().isoformat()
+        prior = [day for day in days if day[0] != today]
+        if len(prior) < self.min_days:
+            return None
+        weekend = now.weekday() >= 5
+        if not any((date.fromisoformat(day[0]).weekday() >= 5) == weekend for day in prior):
+            return None
+        
+        minutes = sorted(day[1] for day in prior)
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return midnight + timedelta(minutes=minutes[len(minutes) // 2])
+    
+    def record(self, user_id: str, now: Optional[datetime] = None):
+        """
+        Record a /mywork invocation; call it before the results are fetched.
+        
+        The first invocation of the day is added to the user's history and,
+        for users with a prediction, counted as a warm hit if their results
+        were still fresh in the cache.
+        
+        Args:
+            user_id: Slack user ID
+            now: Invocation time (defaults to the current local time)
+        """
+        now = now or datetime.now()
+        today = now.date().isoformat()
+        with self._lock:
+            days = self._history.get(user_id, [])
+            if days and days[-1][0] == today:
+                return
+            predicted = self._predict(days, now) is not None
+            warmed = self._warmed.get(user_id) == today
+        
+        hit = predicted and warmed and self.is_warm(user_id)
+        
+        with self._lock:
+            days = self._history.setdefault(user_id, [])
+            if days and days[-1][0] == today:
+                return
+            if predicted:
+                self._metrics["first_runs"] += 1
+                if hit:
+                    self._metrics["warm_hits"] += 1
+            days.append([today, now.hour * 60 + now.minute])
+            del days[:-self.max_days]
+            history = {user: list(user_days) for user, user_days in self._history.items()}
+        
+        try:
+            self._save_history(history)
+        except OSError as e:
+            print(f"Failed to save /mywork usage history: {e}")
+    
+    def _due_users(self, now: datetime) -> List[str]:
+        """List users whose usual first /mywork is within the lead time and who aren't warm yet."""
+        today = now.date().isoformat()
+        due = []
+        with self._lock:
+            for user_id, days in self._history.items():
+                if self._warmed.get(user_id) == today or (days and days[-1][0] == today):
+                    continue
+                predicted = self._predict(days, now)
+                if predicted and predicted - timedelta(seconds=self.lead) <= now < predicted:
+                    due.append(user_id)
+        return due
+    
+    def _quota_available(self) -> bool:
+        """Check that pre-warming hasn't used up its share of any budget window."""
+        for key in self.quota_keys:
+            if self.rate_limiter.is_limited(key):
+                return False
+            budget = self.rate_limiter.get_budget(key)
+            if not budget or not budget.get("limit"):
+                continue
+            with self._lock:
+                spent = self._spent.get(key)
+                used = spent["used"] if spent and spent["reset"] == budget["reset"] else 0
+            if used >= self.quota_share * budget["limit"]:
+                return False
+        return True
+    
+    def _budgets(self) -> Dict[str, Optional[Dict[str, float]]]:
+        """Snapshot the budgets pre-warming spends from."""
+        return {key: self.rate_limiter.get_budget(key) for key in self.quota_keys}
+    
+    def _account(self, before: Dict[str, Optional[Dict]], after: Dict[str, Optional[Dict]]):
+        """Charge the requests a warm-up spent to each budget window."""
+        with self._lock:
+            for key, current in after.items():
+                if not current:
+                    continue
+                previous = before.get(key)
+                if previous and previous["reset"] == current["reset"]:
+                    used = max(0, previous["remaining"] - current["remaining"])
+                elif previous and current.get("limit"):
+                    # The window reset during the warm-up
+                    used = max(0, current["limit"] - current["remaining"])
+                else:
+                    continue
+                
+                spent = self._spent.get(key)
+                if not spent or spent["reset"] != current["reset"]:
+                    spent = self._spent[key] = {"reset": current["reset"], "used": 0}
+                spent["used"] += used
+                self._metrics["quota_spent"] += used
+    
+    def run_once(self, now: Optional[datetime] = None):
+        """
+        Warm every user that is due.
+        
+        Args:
+            now: Current local time (defaults to now)
+        """
+        now = now or datetime.now()
+        due = self._due_users(now)
+        for index, user_id in enumerate(due):
+            if not self._quota_available():
+                with self._lock:
+                    self._metrics["skipped_quota"] += len(due) - index
+                return
+            
+            before = self._budgets()
+            try:
+                self.warm_fn(user_id)
+                outcome = "warms"
+            except Exception as e:
+                outcome = "warm_failures"
+                print(f"Pre-warming /mywork for {user_id} failed: {e}")
+            self._account(before, self._budgets())
+            
+            with self._lock:
+                self._metrics[outcome] += 1
+                self._warmed[user_id] = now.date().isoformat()
+    
+    def _run(self):
+        """Check for due users every interval until stopped."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"/mywork pre-warming failed: {e}")
+    
+    def start(self):
+        """Start pre-warming in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="mywork-prewarmer", daemon=True)
+            self._thread.start()
+    
+    def stop(self):
+        """Stop the background thread."""
+        self._stop.set()
+    
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Get pre-warming metrics.
+        
+        Returns:
+            Dictionary with tracked and predictable users, warm-ups done,
+            failed and skipped for quota, first runs of the day by predictable
+            users and how many of them were warm hits, and upstream requests
+            spent on pre-warming
+        """
+        now = datetime.now()
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics["users"] = len(self._history)
+            metrics["predictable"] = len([
+                days for days in self._history.values() if self._predict(days, now) is not None
+            ])
+        return metrics
+
+
+def create_prewarmer(
+    warm_fn: Callable[[str], None],
+    is_warm: Callable[[str], bool],
+    rate_limiter: RateLimitScheduler,
+    quota_keys: List[str],
+    max_age: Optional[float] = None
+) -> Optional[CachePrewarmer]:
+    """
+    Create the /mywork pre-warmer from environment variables.
+    
+    Args:
+        warm_fn: Refreshes a user's cached GitHub and Jira results
+        is_warm: Checks whether a user's results are cached and fresh
+        rate_limiter: Scheduler holding the upstream budgets
+        quota_keys: Rate limit keys pre-warming spends from
+        max_age: Seconds warmed results stay fresh (the shortest cache TTL)
+        
+    Returns:
+        CachePrewarmer instance, or None if MYWORK_PREWARM is not enabled
+    """
+    if os.getenv("MYWORK_PREWARM", "false").lower() != "true":
+        return None
+    
+    return CachePrewarmer(
+        warm_fn,
+        is_warm,
+        rate_limiter,
+        quota_keys,
+        history_path=os.getenv("MYWORK_PREWARM_HISTORY", "data/mywork_usage.json"),
+        lead=float(os.getenv("MYWORK_PREWARM_LEAD", "60")),
+        quota_share=float(os.getenv("MYWORK_PREWARM_QUOTA_SHARE", "0.2")),
+        min_days=int(os.getenv("MYWORK_PREWARM_MIN_DAYS", "3")),
+        max_age=max_age
+    )
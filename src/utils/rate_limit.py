@@ -0,0 +1,293 @@
+"""
+Rate-limit-aware request scheduling shared by the GitHub and Jira clients.
+Tracks each token's remaining upstream budget and each Slack user's share.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Mapping, Optional
+
+
+class RateLimitExceeded(Exception):
+    """Raised when an upstream budget is exhausted for longer than we may wait."""
+    
+    def __init__(self, key: str, retry_after: float):
+        """
+        Initialize the exception.
+        
+        Args:
+            key: Rate limit key that is exhausted
+            retry_after: Seconds until the budget resets
+        """
+        super().__init__(f"Rate limit exhausted for {key}, resets in {retry_after:.0f}s")
+        self.key = key
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Thread-safe token bucket."""
+    
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize the bucket full.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self):
+        """Add the tokens earned since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """
+        Take tokens if available.
+        
+        Args:
+            tokens: Number of tokens to take
+            
+        Returns:
+            True if the tokens were taken
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+    
+    def acquire(self, tokens: float = 1):
+        """
+        Take tokens, waiting for them to be earned if necessary.
+        
+        Args:
+            tokens: Number of tokens to take
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait_for = (tokens - self._tokens) / self.rate
+            time.sleep(wait_for)
+
+
+class RateLimitScheduler:
+    """Central scheduler that spends upstream budgets carefully and fairly."""
+    
+    def __init__(
+        self,
+        max_wait: float = 5.0,
+        user_rate_per_minute: float = 2.0,
+        user_burst: float = 5.0,
+        max_users: int = 10000
+    ):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            max_wait: Longest time in seconds a request is delayed for a budget reset
+            user_rate_per_minute: Sustained /mywork refreshes per Slack user per minute
+            user_burst: Refreshes a Slack user can make back to back
+            max_users: Maximum number of per-user buckets kept in memory
+        """
+        self.max_wait = max_wait
+        self.user_rate = user_rate_per_minute / 60.0
+        self.user_burst = user_burst
+        self.max_users = max_users
+        
+        self._budgets: Dict[str, Dict[str, float]] = {}
+        self._condition = threading.Condition()
+        self._user_buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._user_lock = threading.Lock()
+        self._stats = {
+            "delayed": 0,
+            "rejected": 0,
+            "users_throttled": 0
+        }
+    
+    @staticmethod
+    def _parse_reset(value: str) -> Optional[float]:
+        """
+        Parse a rate limit reset header into an epoch timestamp.
+        
+        GitHub sends epoch seconds; Jira Cloud sends an ISO 8601 timestamp.
+        """
+        try:
+            return float(value)
+        except ValueError:
+            pass
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return None
+    
+    def acquire(self, key: str):
+        """
+        Wait for permission to send one request against a budget.
+        
+        Requests are delayed (queued) until the budget resets when that
+        happens within max_wait; otherwise RateLimitExceeded is raised so
+        the caller can fall back to cached data instead of failing silently.
+        
+        Args:
+            key: Rate limit key (upstream, resource and token)
+            
+        Raises:
+            RateLimitExceeded: If the budget will not reset within max_wait
+        """
+        with self._condition:
+            delayed = False
+            while True:
+                budget = self._budgets.get(key)
+                now = time.time()
+                if budget is None or budget["reset"] <= now:
+                    if budget is not None:
+                        del self._budgets[key]
+                    return
+                if budget["remaining"] > 0:
+                    # Reserve a unit so concurrent callers don't overspend
+                    budget["remaining"] -= 1
+                    return
+                
+                wait_for = budget["reset"] - now
+                if wait_for > self.max_wait:
+                    self._stats["rejected"] += 1
+                    raise RateLimitExceeded(key, wait_for)
+                if not delayed:
+                    self._stats["delayed"] += 1
+                    delayed = True
+                self._condition.wait(wait_for)
+    
+    def update(self, key: str, headers: Mapping[str, str], status_code: int = 200):
+        """
+        Record the budget reported by an upstream response.
+        
+        Args:
+            key: Rate limit key
+            headers: Response headers
+            status_code: Response status code
+        """
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        limit = headers.get("X-RateLimit-Limit")
+        retry_after = headers.get("Retry-After")
+        
+        with self._condition:
+            if remaining is not None and reset is not None:
+                reset_at = self._parse_reset(reset)
+                if reset_at is not None:
+                    try:
+                        self._budgets[key] = {
+                            "remaining": int(remaining),
+                            "reset": reset_at,
+                            "limit": int(limit) if limit else None
+                        }
+                    except ValueError:
+                        pass
+            
+            if status_code == 429 or (status_code == 403 and retry_after):
+                try:
+                    delay = float(retry_after) if retry_after else 60.0
+                except ValueError:
+                    delay = 60.0
+                self._budgets[key] = {"remaining": 0, "reset": time.time() + delay, "limit": None}
+            
+            self._condition.notify_all()
+    
+    def is_limited(self, key: str) -> bool:
+        """Check whether a budget is currently exhausted."""
+        with self._condition:
+            budget = self._budgets.get(key)
+            return bool(budget and budget["remaining"] <= 0 and budget["reset"] > time.time())
+    
+    def get_budget(self, key: str) -> Optional[Dict[str, float]]:
+        """
+        Get the last budget reported for a key.
+        
+        Args:
+            key: Rate limit key
+            
+        Returns:
+            Dictionary with "remaining", "reset" (epoch seconds) and "limit"
+            (None if not reported), or None if no current budget is known
+        """
+        with self._condition:
+            budget = self._budgets.get(key)
+            if budget is None or budget["reset"] <= time.time():
+                return None
+            return dict(budget)
+    
+    def admit_user(self, user_id: Optional[str]) -> bool:
+        """
+        Take one refresh from a Slack user's fair-share bucket.
+        
+        Args:
+            user_id: Slack user ID
+            
+        Returns:
+            True if the user may trigger upstream requests now
+        """
+        if not user_id:
+            return True
+        
+        with self._user_lock:
+            bucket = self._user_buckets.get(user_id)
+            if bucket is None:
+                bucket = TokenBucket(self.user_rate, self.user_burst)
+                self._user_buckets[user_id] = bucket
+            self._user_buckets.move_to_end(user_id)
+            
+            # Least recently seen users are dropped first
+            while len(self._user_buckets) > self.max_users:
+                self._user_buckets.popitem(last=False)
+        
+        if bucket.try_acquire():
+            return True
+        
+        with self._user_lock:
+            self._stats["users_throttled"] += 1
+        return False
+    
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get scheduler counters.
+        
+        Returns:
+            Dictionary with delayed/rejected requests, throttled users and exhausted budgets
+        """
+        now = time.time()
+        with self._condition:
+            stats = dict(self._stats)
+            stats["exhausted_budgets"] = len([
+                b for b in self._budgets.values() if b["remaining"] <= 0 and b["reset"] > now
+            ])
+        return stats
+
+
+# Global instance
+_rate_limit_scheduler = None
+_rate_limit_scheduler_lock = threading.Lock()
+
+def get_rate_limit_scheduler() -> RateLimitScheduler:
+    """Get the global rate limit scheduler shared by the API clients."""
+    global _rate_limit_scheduler
+    with _rate_limit_scheduler_lock:
+        if _rate_limit_scheduler is None:
+            _rate_limit_scheduler = RateLimitScheduler(
+                max_wait=float(os.getenv("RATE_LIMIT_MAX_WAIT", "5")),
+                user_rate_per_minute=float(os.getenv("RATE_LIMIT_USER_PER_MINUTE", "2")),
+                user_burst=float(os.getenv("RATE_LIMIT_USER_BURST", "5"))
+            )
+        return _rate_limit_scheduler
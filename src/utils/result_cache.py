@@ -0,0 +1,197 @@
+"""
+Per-user cache of /mywork source data with stale-while-revalidate.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class ResultCache:
+    """LRU of fetched source data per (user, source), with per-source TTLs."""
+    
+    def __init__(self, ttls: Dict[str, float], stale_ttl: float = 600.0, max_entries: int = 1000):
+        """
+        Initialize the cache.
+        
+        Args:
+            ttls: Seconds each source's data counts as fresh; 0 disables caching it
+            stale_ttl: Seconds past its TTL that data may still be served while it is refreshed
+            max_entries: Maximum number of (user, source) entries kept
+        """
+        self.ttls = ttls
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Dict]" = OrderedDict()
+        self._refreshing = set()
+        # Bumped on invalidation so fetches started earlier can't store outdated data.
+        # Generations come from one counter and the oldest are pruned past
+        # max_entries; a pruned key falls back to the floor, which is at least
+        # its last generation, so an earlier fetch still can't match.
+        self._generations: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+        self._last_generation = 0
+        self._generation_floor = 0
+        self._lock = threading.Lock()
+        self._metrics = {"hits": 0, "stale_hits": 0, "misses": 0, "invalidations": 0}
+    
+    def get(self, user_id: str, source: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a user's cached data for a source.
+        
+        Args:
+            user_id: Slack user ID
+            source: Source name ("github", "jira" or "todos")
+            
+        Returns:
+            Dictionary with "data", "fetched_at" (epoch seconds) and "fresh",
+            or None if nothing usable is cached
+        """
+        ttl = self.ttls.get(source, 0)
+        key = (user_id, source)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or ttl <= 0:
+                self._metrics["misses"] += 1
+                return None
+            
+            age = time.time() - entry["fetched_at"]
+            if age > ttl + self.stale_ttl:
+                del self._entries[key]
+                self._metrics["misses"] += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            fresh = age <= ttl
+            self._metrics["hits" if fresh else "stale_hits"] += 1
+            return {"data": entry["data"], "fetched_at": entry["fetched_at"], "fresh": fresh}
+    
+    def contains(self, user_id: str, source: str, fresh: bool = False) -> bool:
+        """
+        Check whether get would return data, without counting a lookup.
+        
+        Args:
+            user_id: Slack user ID
+            source: Source name
+            fresh: Only count data that is still within its TTL
+            
+        Returns:
+            True if fresh (or, unless fresh is set, stale) data is cached
+        """
+        ttl = self.ttls.get(source, 0)
+        max_age = ttl if fresh else ttl + self.stale_ttl
+        with self._lock:
+            entry = self._entries.get((user_id, source))
+            return bool(entry and ttl > 0 and time.time() - entry["fetched_at"] <= max_age)
+    
+    def generation(self, user_id: str, source: str) -> int:
+        """
+        Get the invalidation generation of an entry, to pass to put after fetching.
+        
+        Args:
+            user_id: Slack user ID
+            source: Source name
+            
+        Returns:
+            Generation number
+        """
+        with self._lock:
+            return self._generations.get((user_id, source), self._generation_floor)
+    
+    def put(self, user_id: str, source: str, data: Any, generation: Optional[int] = None):
+        """
+        Store freshly fetched data.
+        
+        Args:
+            user_id: Slack user ID
+            source: Source name
+            data: Fetched data
+            generation: Generation read before the fetch started; the data is
+                dropped if the entry was invalidated since
+        """
+        if self.ttls.get(source, 0) <= 0:
+            return
+        key = (user_id, source)
+        with self._lock:
+            if generation is not None and generation != self._generations.get(key, self._generation_floor):
+                return
+            self._entries[key] = {"data": data, "fetched_at": time.time()}
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self, user_id: str, source: str):
+        """
+        Drop a user's cached data for a source.
+        
+        Args:
+            user_id: Slack user ID
+            source: Source name
+        """
+        key = (user_id, source)
+        with self._lock:
+            self._last_generation += 1
+            self._generations[key] = self._last_generation
+            self._generations.move_to_end(key)
+            while len(self._generations) > self.max_entries:
+                _, pruned = self._generations.popitem(last=False)
+                self._generation_floor = max(self._generation_floor, pruned)
+            if self._entries.pop(key, None) is not None:
+                self._metrics["invalidations"] += 1
+    
+    def begin_refresh(self, user_id: str, source: str) -> bool:
+        """
+        Claim the background refresh of a stale entry.
+        
+        Args:
+            user_id: Slack user ID
+            source: Source name
+            
+        Returns:
+            True if the caller should refresh, False if a refresh is already running
+        """
+        with self._lock:
+            if (user_id, source) in self._refreshing:
+                return False
+            self._refreshing.add((user_id, source))
+            return True
+    
+    def end_refresh(self, user_id: str, source: str):
+        """
+        Release a refresh claimed with begin_refresh.
+        
+        Args:
+            user_id: Slack user ID
+            source: Source name
+        """
+        with self._lock:
+            self._refreshing.discard((user_id, source))
+    
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Get cache metrics.
+        
+        Returns:
+            Dictionary with fresh hits, stale hits, misses, invalidations and entries
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics["entries"] = len(self._entries)
+            return metrics
+
+
+def create_result_cache() -> ResultCache:
+    """
+    Create the /mywork result cache from environment variables.
+    
+    Returns:
+        ResultCache instance
+    """
+    ttls = {
+        "github": float(os.getenv("MYWORK_CACHE_TTL_GITHUB", "60")),
+        "jira": float(os.getenv("MYWORK_CACHE_TTL_JIRA", "120")),
+        "todos": float(os.getenv("MYWORK_CACHE_TTL_TODOS", "300"))
+    }
+    stale_ttl = float(os.getenv("MYWORK_CACHE_STALE_TTL", "600"))
+    max_entries = int(os.getenv("MYWORK_CACHE_MAX_ENTRIES", "1000"))
+    return ResultCache(ttls=ttls, stale_ttl=stale_ttl, max_entries=max_entries)
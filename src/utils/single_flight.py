@@ -0,0 +1,163 @@
+"""
+Single-flight request coalescing: concurrent calls with the same key share one upstream call.
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """One in-flight call and the outcome its waiters share."""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Merges concurrent calls with the same key into one."""
+    
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._metrics = {"calls": 0, "coalesced": 0, "waiter_timeouts": 0}
+    
+    def do(self, key: Hashable, fn: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run fn, or wait for the identical call already in flight.
+        
+        The first caller for a key runs fn; callers arriving while it runs
+        get the same result, or the same exception. The result is shared,
+        so callers must not modify it. Nothing is cached once the call
+        finishes.
+        
+        Args:
+            key: Identity of the call
+            fn: Zero-argument function making the upstream call
+            timeout: Seconds a waiter waits for the in-flight call before giving
+                up; the in-flight call itself keeps running for the others
+                
+        Returns:
+            Result of fn
+            
+        Raises:
+            TimeoutError: If a waiter gives up before the in-flight call finishes
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._metrics["coalesced"] += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._metrics["calls"] += 1
+                leader = True
+        
+        if not leader:
+            if not call.done.wait(timeout):
+                with self._lock:
+                    self._metrics["waiter_timeouts"] += 1
+                raise TimeoutError(f"Timed out waiting for in-flight call {key!r}")
+            if call.error is not None:
+                raise call.error
+            return call.result
+        
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+    
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Get coalescing metrics.
+        
+        Returns:
+            Dictionary with upstream calls made, calls coalesced into them,
+            waiter timeouts and calls currently in flight
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics["in_flight"] = len(self._calls)
+            return metrics
+
+
+class AsyncSingleFlight:
+    """Merges concurrent coroutine calls with the same key into one, on one event loop."""
+    
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._tasks: Dict[Hashable, "asyncio.Task"] = {}
+        self._metrics = {"calls": 0, "coalesced": 0, "waiter_timeouts": 0}
+    
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await fn(), or the identical call already in flight.
+        
+        The shared call runs as its own task, so a caller that is cancelled
+        (e.g. by asyncio.wait_for) stops waiting without cancelling it for
+        the others. As with SingleFlight, the result must not be modified.
+        
+        Args:
+            key: Identity of the call
+            fn: Zero-argument coroutine function making the upstream call
+            
+        Returns:
+            Result of fn
+        """
+        task = self._tasks.get(key)
+        if task is not None:
+            self._metrics["coalesced"] += 1
+        else:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            self._metrics["calls"] += 1
+            task.add_done_callback(lambda done: self._forget(key, done))
+        
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done():
+                self._metrics["waiter_timeouts"] += 1
+            raise
+    
+    def _forget(self, key: Hashable, task: "asyncio.Task"):
+        """Drop a finished call, unless a newer one already took its key."""
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Mark the exception retrieved; the waiters have re-raised it
+            task.exception()
+    
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Get coalescing metrics.
+        
+        Returns:
+            Dictionary with upstream calls made, calls coalesced into them,
+            waiters that gave up and calls currently in flight
+        """
+        metrics = dict(self._metrics)
+        metrics["in_flight"] = len(self._tasks)
+        return metrics
+
+
+_single_flight = None
+_single_flight_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """Get the global single-flight group shared by the API clients."""
+    global _single_flight
+    with _single_flight_lock:
+        if _single_flight is None:
+            _single_flight = SingleFlight()
+        return _single_flight
@@ -0,0 +1,123 @@
+"""
+Bounded worker pool for slash command work that shouldn't run on Bolt's listener threads.
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+
+class BoundedWorkQueue:
+    """Thread pool with a bounded backlog that rejects work instead of queueing forever."""
+    
+    def __init__(self, max_workers: int = 4, max_queue: int = 20, name: str = "mywork"):
+        """
+        Initialize the queue.
+        
+        Args:
+            max_workers: Number of worker threads
+            max_queue: Jobs allowed to wait for a worker before new ones are rejected
+            name: Thread name prefix
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=name)
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_queue)
+        self._lock = threading.Lock()
+        self._stats = {
+            "queued": 0,
+            "running": 0,
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+            "total_wait": 0.0,
+            "max_wait": 0.0
+        }
+    
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> bool:
+        """
+        Queue a job.
+        
+        Args:
+            fn: Job function
+            *args: Positional arguments for the job
+            **kwargs: Keyword arguments for the job
+            
+        Returns:
+            True if the job was queued, False if the backlog is full
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._stats["rejected"] += 1
+            return False
+        
+        with self._lock:
+            self._stats["queued"] += 1
+        self._executor.submit(self._run, time.monotonic(), fn, args, kwargs)
+        return True
+    
+    def _run(self, submitted: float, fn: Callable[..., Any], args: tuple, kwargs: Dict):
+        """Run one job, recording how long it waited for a worker."""
+        waited = time.monotonic() - submitted
+        with self._lock:
+            self._stats["queued"] -= 1
+            self._stats["running"] += 1
+            self._stats["total_wait"] += waited
+            self._stats["max_wait"] = max(self._stats["max_wait"], waited)
+        
+        outcome = "completed"
+        try:
+            fn(*args, **kwargs)
+        except Exception as e:
+            outcome = "failed"
+            print(f"Background job {getattr(fn, '__name__', fn)} failed: {e}")
+        finally:
+            with self._lock:
+                self._stats["running"] -= 1
+                self._stats[outcome] += 1
+            self._slots.release()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue metrics.
+        
+        Returns:
+            Dictionary with queue depth, running jobs, completed, failed and
+            rejected counts, and average/maximum wait for a worker in seconds
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        started = stats["completed"] + stats["failed"] + stats["running"]
+        stats["avg_wait"] = stats.pop("total_wait") / started if started else 0.0
+        stats["workers"] = self.max_workers
+        stats["max_queue"] = self.max_queue
+        return stats
+
+
+def create_work_queue() -> BoundedWorkQueue:
+    """
+    Create the /mywork work queue from environment variables.
+    
+    Returns:
+        BoundedWorkQueue instance
+    """
+    max_workers = int(os.getenv("MYWORK_WORKERS", "4"))
+    max_queue = int(os.getenv("MYWORK_QUEUE_SIZE", "20"))
+    return BoundedWorkQueue(max_workers=max_workers, max_queue=max_queue)
+
+
+def create_refresh_queue() -> BoundedWorkQueue:
+    """
+    Create the queue for background refreshes of stale cached results.
+    
+    It is separate from the /mywork queue so refreshes never take the
+    slots of commands users are waiting on; a full queue just skips the
+    refresh.
+    
+    Returns:
+        BoundedWorkQueue instance
+    """
+    max_workers = int(os.getenv("MYWORK_REFRESH_WORKERS", "2"))
+    max_queue = int(os.getenv("MYWORK_REFRESH_QUEUE_SIZE", "20"))
+    return BoundedWorkQueue(max_workers=max_workers, max_queue=max_queue, name="mywork-refresh")